@@ -1,22 +1,24 @@
-import os
+import sys
 
-path = r"c:\Users\Life\Desktop\muhasebe app\motoroil\src\app\customers\[id]\CustomerDetailClient.tsx"
-with open(path, "r", encoding="utf-8") as f:
-    lines = f.readlines()
+from tools.codemod.filters import contains_all, filter_file
+from tools.codemod.writer import Transaction
 
-# Remove the OTV % line (line 666 in view_file, so index 665)
-# Note: Line numbers might have shifted, so search for it.
-new_lines = []
-found_header = False
-for line in lines:
-    if "ÖTV %" in line and "th" in line:
-        found_header = True
-        continue
-    new_lines.append(line)
+path = "src/app/(app)/customers/[id]/CustomerDetailClient.tsx"
+dry_run = "--dry-run" in sys.argv
+txn = Transaction("fix_header.py", dry_run=dry_run)
+if txn.is_applied(path):
+    print("Header already removed")
+    sys.exit(0)
 
-if found_header:
-    with open(path, "w", encoding="utf-8") as f:
-        f.writelines(new_lines)
+# Remove the OTV % header cell; search by content since line numbers shift
+result = filter_file(path, contains_all("ÖTV %", "th"), write=not dry_run, diff=dry_run)
+
+if result.removed:
+    if dry_run:
+        sys.stdout.write(result.diff)
+    else:
+        txn.stage(path, result.staged, result.digest)
+        txn.commit()
     print("Successfully removed header")
 else:
     print("Header not found")
@@ -1,17 +1,25 @@
 import sys
 
+from tools.codemod.literal import LiteralReplacer
+from tools.codemod.writer import Transaction
+
 file_path = 'src/app/(app)/inventory/components/ProductWizardModal.tsx'
+txn = Transaction('patch.py', dry_run='--dry-run' in sys.argv)
+if txn.is_applied(file_path):
+    print('Already applied')
+    sys.exit(0)
+
 with open(file_path, 'r', encoding='utf-8') as f:
     content = f.read()
 
 # Edit 1
-content = content.replace(
+edit_1 = (
     'const [currentStep, setCurrentStep] = useState(1);',
     'const [currentStep, setCurrentStep] = useState(1);\n    const [globalCategories, setGlobalCategories] = useState<any[]>([]);\n\n    useEffect(() => {\n        fetch("/api/catalog/global-categories")\n            .then(res => res.json())\n            .then(d => { if (d.success) setGlobalCategories(d.categories); })\n            .catch(e => console.error("Global categories fetch error:", e));\n    }, []);'
 )
 
 # Edit 2
-content = content.replace(
+edit_2 = (
     '<StepOtherInfo mode={mode} data={data} onChange={onChange} categories={categories} />',
     '<StepOtherInfo mode={mode} data={data} onChange={onChange} categories={categories} globalCategories={globalCategories} />'
 )
@@ -71,8 +79,16 @@ new_step_info = '''function StepOtherInfo({ data, onChange, categories, globalCa
                     </select>
                 </div>'''
 
-content = content.replace(old_step_info, new_step_info)
+# All three edits in one scan of the file
+replacer = LiteralReplacer([edit_1, edit_2, (old_step_info, new_step_info)])
+content, hits = replacer.replace(content)
+
+missing = replacer.missing(hits, content)
+if missing:
+    for needle in missing:
+        print('Not found:', needle.splitlines()[0])
+    sys.exit(1)
 
-with open(file_path, 'w', encoding='utf-8') as f:
-    f.write(content)
+txn.write(file_path, content)
+txn.commit()
 print('Done!')
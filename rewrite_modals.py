@@ -1,13 +1,18 @@
-import re
 import sys
 
+from tools.codemod.jsx import JSXScanError, replace_conditional_block
+from tools.codemod.writer import Transaction
+
 file_path = "src/app/(app)/customers/[id]/CustomerDetailClient.tsx"
+txn = Transaction("rewrite_modals.py", dry_run="--dry-run" in sys.argv)
+if txn.is_applied(file_path):
+    print("Modals already replaced")
+    sys.exit(0)
 
 with open(file_path, "r", encoding="utf-8") as f:
     content = f.read()
 
 # 1. Warranty Modal Replacement
-warranty_pattern = r"\{/\* WARRANTY START MODAL \*/\}(.*?)\{warrantyModalOpen && \((.*?)\)\n\s*\}"
 warranty_replacement = """{/* WARRANTY START MODAL */}
             {warrantyModalOpen && (
                 <div className="fixed inset-0 bg-slate-900/80 backdrop-blur-sm z-[4000] flex items-center justify-center p-4 animate-in fade-in duration-200">
@@ -108,7 +113,6 @@ warranty_replacement = """{/* WARRANTY START MODAL */}
             )}"""
 
 # 2. Check Add Modal Replacement
-check_pattern = r"\{/\* CHECK / SENET ADD MODAL \*/\}(.*?)\{checkAddModalOpen && \((.*?)\)\n\s*\}"
 check_replacement = """{/* CHECK / SENET ADD MODAL */}
             {checkAddModalOpen && (
                 <div className="fixed inset-0 bg-slate-900/80 backdrop-blur-sm z-[6000] flex items-center justify-center p-4 animate-in fade-in duration-200">
@@ -247,7 +251,6 @@ check_replacement = """{/* CHECK / SENET ADD MODAL */}
             )}"""
 
 # 3. OTP Modal Replacement
-otp_pattern = r"\{/\* OTP COMPLIANCE MODAL \*/\}(.*?)\{otpModalOpen && \((.*?)\)\n\s*\}"
 otp_replacement = """{/* OTP COMPLIANCE MODAL */}
             {otpModalOpen && (
                 <div className="fixed inset-0 bg-slate-900/80 backdrop-blur-sm z-[6000] flex items-center justify-center p-4 animate-in fade-in duration-200">
@@ -319,12 +322,20 @@ otp_replacement = """{/* OTP COMPLIANCE MODAL */}
                 </div>
             )}"""
 
-# Replace all
-content = re.sub(warranty_pattern, warranty_replacement, content, flags=re.DOTALL)
-content = re.sub(check_pattern, check_replacement, content, flags=re.DOTALL)
-content = re.sub(otp_pattern, otp_replacement, content, flags=re.DOTALL)
+# Replace all: each block spans from its marker comment to the brace that closes {cond && (...)}
+modals = [
+    ("WARRANTY START MODAL", "warrantyModalOpen", warranty_replacement),
+    ("CHECK / SENET ADD MODAL", "checkAddModalOpen", check_replacement),
+    ("OTP COMPLIANCE MODAL", "otpModalOpen", otp_replacement),
+]
+try:
+    for marker, cond, replacement in modals:
+        content = replace_conditional_block(content, cond, replacement, marker=marker)
+except JSXScanError as e:
+    print("Modals not replaced:", e)
+    sys.exit(1)
 
-with open(file_path, "w", encoding="utf-8") as f:
-    f.write(content)
+txn.write(file_path, content)
+txn.commit()
 
 print("Modals Successfully Replaced!")
@@ -1,6 +1,7 @@
 const fs = require('fs');
 
-let file = fs.readFileSync('src/contexts/LanguageContext.tsx', 'utf8');
+// LanguageContext.tsx is generated from src/locales/<lang>.json by `python -m tools.i18n build`;
+// this adds the courier, kitchen and ai namespaces to those files (existing keys win).
 
 const TR_ADDS = `
         courier: {
@@ -155,34 +156,30 @@ const DE_ADDS = `
         },
 `;
 
-let content = file;
+const ADDITIONS = { tr: TR_ADDS, en: EN_ADDS, de: DE_ADDS };
 
-// Helper to inject before exactly the matched string block.
-function injectBefore(substr, replacement) {
-    if(!content.includes(substr)) throw new Error("Substring not found!");
-    content = content.replace(substr, replacement + substr);
-}
-
-// Find TR menu
-const trMenuStr = '        menu: {\n            workspace: "WORKSPACE",';
-injectBefore(trMenuStr, TR_ADDS);
+// The fragments are object-literal bodies
+const parse = (body) => new Function(`return {${body}};`)();
 
-const enMenuStr = '        menu: {\n            workspace: "WORKSPACE",';
-// However, EN has same string. We need to be careful!
-// Let's use regex with the preceding context
-// Let's just do it directly string hacking.
-const blocks = content.split('        menu: {\n            workspace: "WORKSPACE",');
-if (blocks.length !== 4) {
-    console.error("Mismatch blocks");
-} else {
-    // blocks[0] is TR so TR_ADDS comes before blocks[1]
-    const assembled = blocks[0] + TR_ADDS + '        menu: {\n            workspace: "WORKSPACE",' + blocks[1] + EN_ADDS + '        menu: {\n            workspace: "WORKSPACE",' + blocks[2];
-    
-    const DEStr = '        menu: {\n            workspace: "ARBEITSBEREICH",';
-    const splitDE = assembled.split(DEStr);
-    
-    file = splitDE[0] + DE_ADDS + DEStr + splitDE[1];
-    fs.writeFileSync('src/contexts/LanguageContext.tsx', file);
-    console.log("LanguageContext updated with courier, kitchen, ai.");
+// Adds what `into` lacks, recursing into nested objects; returns the number of keys added
+function addMissing(into, from) {
+    let added = 0;
+    for (const [key, value] of Object.entries(from)) {
+        if (!(key in into)) {
+            into[key] = value;
+            added += value && typeof value === 'object' ? Object.keys(value).length : 1;
+        } else if (value && typeof value === 'object' && into[key] && typeof into[key] === 'object') {
+            added += addMissing(into[key], value);
+        }
+    }
+    return added;
 }
 
+for (const [lang, body] of Object.entries(ADDITIONS)) {
+    const path = `src/locales/${lang}.json`;
+    const dictionary = JSON.parse(fs.readFileSync(path, 'utf8'));
+    const added = addMissing(dictionary, parse(body));
+    fs.writeFileSync(path, JSON.stringify(dictionary, null, 2) + '\n');
+    console.log(`${path}: ${added} keys added`);
+}
+console.log('Now run `python -m tools.i18n build` to rebuild the chunks and LanguageContext.tsx.');
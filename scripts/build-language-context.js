@@ -1,8 +1,8 @@
 const fs = require('fs');
 
-let file = fs.readFileSync('src/contexts/LanguageContext.tsx', 'utf8');
-
-// We use string match since the file format is known and stable
+// LanguageContext.tsx is generated from src/locales/<lang>.json by `python -m tools.i18n build`;
+// this adds the keys below to those files (existing keys win) and leaves the context to the build.
+// The fragments are object-literal bodies, read as such.
 const INJECT_TR = `
             errCustomer: "Cari Seçimi Eksik",
             errCustomerDesc: "Fatura kesebilmek için lütfen Cari Hesap seçiniz.",
@@ -186,23 +186,36 @@ const AI_DE = `
             noSuggestion: "Keine passenden Vorschläge gefunden"
         },`;
 
-// 1) Replace invoice successTitle with new keys + successTitle TR
-file = file.replace('        invoice: {\n            successTitle: "E-Fatura Kesildi",', '        invoice: {\n' + INJECT_TR + '\n            successTitle: "E-Fatura Kesildi",');
-// EN
-file = file.replace('        invoice: {\n            successTitle: "E-Invoice Issued",', '        invoice: {\n' + INJECT_EN + '\n            successTitle: "E-Invoice Issued",');
-// DE
-file = file.replace('        invoice: {\n            successTitle: "E-Rechnung erstellt",', '        invoice: {\n' + INJECT_DE + '\n            successTitle: "E-Rechnung erstellt",');
+const ADDITIONS = {
+    tr: [['invoice', INJECT_TR], [null, COURIER_TR + KITCHEN_TR + AI_TR]],
+    en: [['invoice', INJECT_EN], [null, COURIER_EN + KITCHEN_EN + AI_EN]],
+    de: [['invoice', INJECT_DE], [null, COURIER_DE + KITCHEN_DE + AI_DE]],
+};
 
-// 2) Replace `menu: {` with Courier + Kitchen + AI + Menu TR
-// We find indices of `menu: {\n            workspace: "WORKSPACE",` and replace
-let searchStr = '        menu: {\n            workspace: "WORKSPACE",';
-file = file.replace(searchStr, COURIER_TR + '\n' + KITCHEN_TR + '\n' + AI_TR + '\n' + searchStr);
-// Then EN
-file = file.replace(searchStr, COURIER_EN + '\n' + KITCHEN_EN + '\n' + AI_EN + '\n' + searchStr);
+const parse = (body) => new Function(`return {${body}};`)();
 
-// DE uses "ARBEITSBEREICH"
-let searchStrDe = '        menu: {\n            workspace: "ARBEITSBEREICH",';
-file = file.replace(searchStrDe, COURIER_DE + '\n' + KITCHEN_DE + '\n' + AI_DE + '\n' + searchStrDe);
+// Adds what `into` lacks, recursing into nested objects; returns the number of keys added
+function addMissing(into, from) {
+    let added = 0;
+    for (const [key, value] of Object.entries(from)) {
+        if (!(key in into)) {
+            into[key] = value;
+            added += value && typeof value === 'object' ? Object.keys(value).length : 1;
+        } else if (value && typeof value === 'object' && into[key] && typeof into[key] === 'object') {
+            added += addMissing(into[key], value);
+        }
+    }
+    return added;
+}
 
-fs.writeFileSync('src/contexts/LanguageContext.tsx', file);
-console.log('LanguageContext fully built and updated!');
+for (const [lang, additions] of Object.entries(ADDITIONS)) {
+    const path = `src/locales/${lang}.json`;
+    const dictionary = JSON.parse(fs.readFileSync(path, 'utf8'));
+    let added = 0;
+    for (const [ns, body] of additions) {
+        added += addMissing(ns ? (dictionary[ns] ??= {}) : dictionary, parse(body));
+    }
+    fs.writeFileSync(path, JSON.stringify(dictionary, null, 2) + '\n');
+    console.log(`${path}: ${added} keys added`);
+}
+console.log('Now run `python -m tools.i18n build` to rebuild the chunks and LanguageContext.tsx.');
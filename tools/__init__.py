@@ -0,0 +1,7 @@
+"""Python maintenance tooling for the periodya repo (codemods, data and log utilities).
+
+Most tools need only the standard library; tools.fintech and tools.products
+also need numpy:
+
+    python -m pip install -r tools/requirements.txt
+"""
@@ -0,0 +1,82 @@
+"""Aho–Corasick automaton for matching many literal needles in one pass."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterator, Sequence
+
+
+class Automaton:
+    """Compiled set of literal needles.
+
+    ``finditer`` reports every (possibly overlapping) occurrence; ``leftmost_longest``
+    picks the non-overlapping subset a left-to-right ``str.replace`` sweep would see,
+    preferring the longer needle when two start at the same offset.
+    """
+
+    def __init__(self, needles: Sequence[str]):
+        if any(not n for n in needles):
+            raise ValueError("empty needle")
+        self.needles = tuple(needles)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        for idx, needle in enumerate(self.needles):
+            state = 0
+            for ch in needle:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                    self._goto[state][ch] = nxt
+                state = nxt
+            self._out[state] += (idx,)
+        self._build_failure_links()
+
+    def _build_failure_links(self) -> None:
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[nxt] = target if target != nxt else 0
+                out[nxt] += out[fail[nxt]]
+
+    def finditer(self, text: str) -> Iterator[tuple[int, int]]:
+        """Yield ``(start, needle_index)`` for every occurrence, ordered by end offset."""
+        goto, fail, out, needles = self._goto, self._fail, self._out, self.needles
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for idx in out[state]:
+                yield i - len(needles[idx]) + 1, idx
+
+    def leftmost_longest(self, text: str, allowed: Sequence[bool] | None = None) -> list[tuple[int, int]]:
+        """Non-overlapping matches as ``(start, needle_index)``, sorted by start."""
+        needles = self.needles
+        found = [
+            (start, -len(needles[idx]), idx)
+            for start, idx in self.finditer(text)
+            if allowed is None or allowed[idx]
+        ]
+        found.sort()
+        chosen: list[tuple[int, int]] = []
+        pos = 0
+        for start, neg_len, idx in found:
+            if start >= pos:
+                chosen.append((start, idx))
+                pos = start - neg_len
+        return chosen
+
+    def search(self, text: str) -> bool:
+        """True if any needle occurs in ``text``."""
+        return next(self.finditer(text), None) is not None
@@ -0,0 +1,19 @@
+"""Registered e-document users (GIB alias lists) and a memory-mapped lookup index.
+
+    python -m tools.aliases build [aliases/despatch_pk.xml | aliases.zip]
+    python -m tools.aliases sync [aliases.zip] [--log changes.jsonl]
+    python -m tools.aliases lookup 3680485737 31793317082
+    python -m tools.aliases batch customers.csv --column taxNumber [-o registered.csv]
+"""
+
+from .index import AliasIndex, AliasIndexError, BuildStats, build_index, index_path
+from .parse import (
+    DEFAULT_XML, DEFAULT_ZIP, Alias, AliasListError, AliasUser, ChecksumReader, iter_users, list_name, open_list,
+)
+from .sync import Change, SyncStats, diff_users, sync
+
+__all__ = [
+    "DEFAULT_XML", "DEFAULT_ZIP", "Alias", "AliasIndex", "AliasIndexError", "AliasListError", "AliasUser",
+    "BuildStats", "Change", "ChecksumReader", "SyncStats", "build_index", "diff_users", "index_path",
+    "iter_users", "list_name", "open_list", "sync",
+]
@@ -0,0 +1,128 @@
+import argparse
+import csv
+import json
+import sys
+import time
+import zipfile
+from pathlib import Path
+
+from .index import INDEX_DIR, AliasIndex, AliasIndexError, build_index, index_path
+from .parse import DEFAULT_XML, DEFAULT_ZIP, AliasListError, ChecksumReader, iter_users, list_name, open_list
+from .sync import sync
+
+DOCUMENT_TYPE = "DespatchAdvice"
+
+
+def _identifiers(path: str, column: str | None):
+    f = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8-sig")
+    try:
+        if column is None:
+            for line in f:
+                if line.strip():
+                    yield line.strip()
+        else:
+            for row in csv.DictReader(f):
+                if (row.get(column) or "").strip():
+                    yield row[column].strip()
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.aliases")
+    parser.add_argument("--index", help=f"index file (default: {index_path(DEFAULT_XML)})")
+    parser.add_argument("--document-type", default=DOCUMENT_TYPE, help="aliases listed for this document type")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("build", help="stream-parse an alias list (XML or zip) into a new index")
+    p.add_argument("source", nargs="?", default=str(DEFAULT_XML))
+
+    p = sub.add_parser("sync", help="apply only what changed in a new download to the index")
+    p.add_argument("source", nargs="?", default=str(DEFAULT_ZIP))
+    p.add_argument("--log", help="append the changes as JSON lines here, or - for stdout "
+                                 f"(default: {INDEX_DIR}/<list>.changes.jsonl)")
+    p.add_argument("--force", action="store_true", help="read the list even if its checksum is unchanged")
+
+    p = sub.add_parser("lookup", help="print the registration of each identifier")
+    p.add_argument("identifiers", nargs="+")
+
+    p = sub.add_parser("batch", help="check a whole customer list; writes CSV")
+    p.add_argument("file", help="one identifier per line, a CSV with --column, or -")
+    p.add_argument("--column", help="CSV column holding the VKN/TCKN")
+    p.add_argument("-o", "--output", help="CSV output (default: stdout)")
+
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    try:
+        source = getattr(args, "source", DEFAULT_XML)
+        index = Path(args.index) if args.index else index_path(list_name(source))
+        if args.command == "build":
+            with open_list(source) as (stream, stamp):
+                reader = ChecksumReader(stream)
+                stats = build_index(iter_users(reader), index, lambda: stamp or reader.stamp)
+            print(f"{stats.users} users ({stats.duplicates} duplicates) -> {index}, {stats.size} bytes "
+                  f"in {time.perf_counter() - t0:.2f} s", file=sys.stderr)
+            return 0
+        if args.command == "sync":
+            log_path = args.log or index.with_suffix(".changes.jsonl")
+            index.parent.mkdir(parents=True, exist_ok=True)
+            log = sys.stdout if log_path == "-" else open(log_path, "a", encoding="utf-8")
+            at = time.strftime("%Y-%m-%dT%H:%M:%S")
+            try:
+                stats = sync(source, index, lambda c: log.write(
+                    json.dumps({"at": at, **c.to_dict()}, ensure_ascii=False) + "\n"), args.force)
+            finally:
+                if log is not sys.stdout:
+                    log.close()
+            if stats.skipped:
+                summary = "unchanged (checksum matches the index)"
+            elif stats.built:
+                summary = f"no index yet; built with {stats.users} users"
+            else:
+                summary = (f"{stats.inserted} inserted, {stats.changed} changed, {stats.removed} removed, "
+                           f"{stats.unchanged} unchanged")
+            print(f"{index}: {summary} in {time.perf_counter() - t0:.2f} s", file=sys.stderr)
+            return 0
+
+        with AliasIndex(index) as idx:
+            if args.command == "lookup":
+                found = idx.lookup_many(args.identifiers)
+                for identifier in args.identifiers:
+                    user = found[identifier.strip()]
+                    if user is None:
+                        print(f"{identifier}\tnot registered")
+                        continue
+                    names = ", ".join(a.name for a in user.active_aliases(args.document_type)) or "-"
+                    print(f"{user.identifier}\t{user.account_type}\t{user.title}\t{names}")
+                status = 0 if all(found.values()) else 1
+            else:
+                identifiers = list(_identifiers(args.file, args.column))
+                found = idx.lookup_many(identifiers)
+                out = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+                try:
+                    writer = csv.writer(out, lineterminator="\n")
+                    writer.writerow(["identifier", "registered", "title", "account_type", "aliases"])
+                    for identifier in dict.fromkeys(i.strip() for i in identifiers):
+                        user = found[identifier]
+                        if user is None:
+                            writer.writerow([identifier, "no", "", "", ""])
+                        else:
+                            names = ";".join(a.name for a in user.active_aliases(args.document_type))
+                            writer.writerow([identifier, "yes", user.title, user.account_type, names])
+                finally:
+                    if out is not sys.stdout:
+                        out.close()
+                registered = sum(user is not None for user in found.values())
+                print(f"{registered}/{len(found)} registered", file=sys.stderr)
+                status = 0
+    except (AliasListError, AliasIndexError, zipfile.BadZipFile, FileNotFoundError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    print(f"{(time.perf_counter() - t0) * 1000:.1f} ms", file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+"""Sorted, memory-mapped identifier index over an alias list.
+
+File layout (little-endian): a header (magic, version, entry count, table
+offset, heap offset, CRC-32 and size of the source XML), a table of
+fixed-width entries sorted by identifier, then a heap holding each user's
+compact JSON record in the same order. An entry is the identifier
+NUL-padded to 16 bytes, the record's heap offset and length and an 8-byte
+BLAKE2b digest of the record, which ``tools.aliases.sync`` compares to
+find changed users without decoding them.
+
+A lookup is a binary search over the mapped table plus one record decode,
+a few microseconds; nothing is loaded up front. ``build_index`` streams:
+records go straight to a temp heap, table entries are sorted in bounded
+runs spilled to disk and merged, so the build's memory does not grow with
+the list.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import heapq
+import mmap
+import os
+import struct
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from tools.codemod.writer import TempWriter
+from tools.fs import REPO_ROOT
+
+from .parse import AliasUser
+
+INDEX_DIR = REPO_ROOT / ".cache" / "aliases"
+
+_MAGIC = b"ALIX"
+_VERSION = 2
+_HEADER = struct.Struct("<4sIQQQIQ")
+_ENTRY = struct.Struct("<16sQI8s")  # identifier, heap offset, length, digest
+# Entries while sorting: identifier, heap number, input order, offset in that heap, length, digest
+_RUN = struct.Struct("<16sBQQI8s")
+KEY_SIZE = 16
+RUN_SIZE = 200_000  # table entries sorted in memory before spilling a run
+_COPY_CHUNK = 1 << 20
+
+
+class AliasIndexError(ValueError):
+    pass
+
+
+def index_path(source: str | Path) -> Path:
+    """Default index for an alias list: ``.cache/aliases/<stem>.idx``."""
+    return INDEX_DIR / f"{Path(source).stem}.idx"
+
+
+def record_digest(record: bytes) -> bytes:
+    return hashlib.blake2b(record, digest_size=8).digest()
+
+
+def encode_key(identifier: str) -> bytes:
+    key = identifier.strip().encode("ascii", "replace")
+    if not key or len(key) > KEY_SIZE:
+        raise AliasIndexError(f"identifier {identifier!r} does not fit the index")
+    return key.ljust(KEY_SIZE, b"\0")
+
+
+def decode_key(key: bytes) -> str:
+    return key.rstrip(b"\0").decode("ascii")
+
+
+@dataclass
+class BuildStats:
+    users: int = 0
+    duplicates: int = 0  # repeated identifiers; the last record wins
+    runs: int = 0
+    size: int = 0  # bytes in the finished index
+
+
+class SortedRuns:
+    """Run entries sorted in memory ``run_size`` at a time, spilled to ``tmp`` and merged on read."""
+
+    def __init__(self, tmp: str, run_size: int = RUN_SIZE):
+        self._tmp = tmp
+        self._run_size = run_size
+        self._buffer: list[tuple] = []
+        self._runs: list[str] = []
+
+    def add(self, entry: tuple) -> None:
+        self._buffer.append(entry)
+        if len(self._buffer) >= self._run_size:
+            self._runs.append(os.path.join(self._tmp, f"run{len(self._runs)}"))
+            self._buffer.sort()
+            with open(self._runs[-1], "wb") as f:
+                for e in self._buffer:
+                    f.write(_RUN.pack(*e))
+            self._buffer.clear()
+
+    @property
+    def runs(self) -> int:
+        return len(self._runs) + 1
+
+    @staticmethod
+    def _read(path: str) -> Iterator[tuple]:
+        with open(path, "rb") as f:
+            while chunk := f.read(_RUN.size * 4096):
+                yield from _RUN.iter_unpack(chunk)
+
+    def merged(self) -> Iterator[tuple]:
+        self._buffer.sort()
+        return heapq.merge(self._buffer, *map(self._read, self._runs))
+
+
+def map_file(path: str) -> mmap.mmap | bytes:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def write_index(path: str | Path, entries: Iterable[tuple], heaps: list[tuple], stamp: tuple[int, int],
+                tmp: str, before_replace: Callable[[], None] | None = None) -> BuildStats:
+    """Write ``entries`` (sorted run tuples) as an index at ``path``.
+
+    An entry's heap number picks a ``(buffer, base offset)`` pair in
+    ``heaps``, which its record offset is relative to. Of several entries
+    for one identifier the last is kept. The table and the re-laid-out heap
+    are staged in ``tmp``, then copied behind the header into a temp file
+    that replaces ``path``. ``before_replace`` runs once the heaps have been
+    read and before the replace; sync closes the old index there, since
+    Windows will not replace a mapped file.
+    """
+    path = Path(path)
+    stats = BuildStats()
+    table_path = os.path.join(tmp, "table")
+    heap_path = os.path.join(tmp, "heap.out")
+    offset = 0
+    with open(table_path, "wb") as table, open(heap_path, "wb") as heap:
+        def emit(entry: tuple) -> None:
+            nonlocal offset
+            key, src, _, start, length, digest = entry
+            buffer, base = heaps[src]
+            heap.write(buffer[base + start:base + start + length])
+            table.write(_ENTRY.pack(key, offset, length, digest))
+            offset += length
+            stats.users += 1
+
+        pending = None
+        for entry in entries:
+            if pending is not None:
+                if pending[0] == entry[0]:
+                    stats.duplicates += 1
+                else:
+                    emit(pending)
+            pending = entry
+        if pending is not None:
+            emit(pending)
+
+    table_off = _HEADER.size
+    heap_off = table_off + stats.users * _ENTRY.size
+    with TempWriter(path) as out:
+        out.write(_HEADER.pack(_MAGIC, _VERSION, stats.users, table_off, heap_off, *stamp))
+        for part in (table_path, heap_path):
+            with open(part, "rb") as f:
+                while chunk := f.read(_COPY_CHUNK):
+                    out.write(chunk)
+    try:
+        if before_replace is not None:
+            before_replace()
+        os.replace(out.name, path)
+    except BaseException:
+        out.discard()
+        raise
+    stats.size = path.stat().st_size
+    return stats
+
+
+def build_index(users: Iterable[AliasUser], path: str | Path,
+                stamp: tuple[int, int] | Callable[[], tuple[int, int]] = (0, 0),
+                run_size: int = RUN_SIZE) -> BuildStats:
+    """Write the index for ``users`` to ``path``, replacing any previous one atomically.
+
+    ``stamp`` is the source's ``(crc32, size)``, kept so a later sync can
+    tell an unchanged download without reading it; pass a callable when it
+    is only known once ``users`` has been consumed.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix=".alix-", dir=path.parent) as tmp:
+        heap_path = os.path.join(tmp, "heap")
+        runs = SortedRuns(tmp, run_size)
+        offset = 0
+        with open(heap_path, "wb") as heap:
+            for seq, user in enumerate(users):
+                record = user.to_json()
+                heap.write(record)
+                runs.add((encode_key(user.identifier), 0, seq, offset, len(record), record_digest(record)))
+                offset += len(record)
+        records = map_file(heap_path)
+        try:
+            if callable(stamp):
+                stamp = stamp()
+            stats = write_index(path, runs.merged(), [(records, 0)], stamp, tmp)
+        finally:
+            if isinstance(records, mmap.mmap):
+                records.close()
+    stats.runs = runs.runs
+    return stats
+
+
+class _Keys:
+    """The table's identifier column as a sequence, for ``bisect``."""
+
+    __slots__ = ("_mm", "_base", "_len")
+
+    def __init__(self, mm: mmap.mmap, base: int, count: int):
+        self._mm, self._base, self._len = mm, base, count
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, i: int) -> bytes:
+        start = self._base + i * _ENTRY.size
+        return self._mm[start:start + KEY_SIZE]
+
+
+class AliasIndex:
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < _HEADER.size:
+            self._mm.close()
+            raise AliasIndexError(f"{self.path} is not an alias index")
+        magic, version, self._count, self._table, self._heap, crc, size = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._mm.close()
+            raise AliasIndexError(f"{self.path} is not a v{_VERSION} alias index")
+        self.stamp = (crc, size)
+        self._keys = _Keys(self._mm, self._table, self._count)
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def __enter__(self) -> "AliasIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def find(self, key: bytes, lo: int = 0) -> int:
+        """Table position of an encoded key, or ``-(insertion point) - 1``."""
+        i = bisect.bisect_left(self._keys, key, lo)
+        if i < self._count and self._keys[i] == key:
+            return i
+        return -i - 1
+
+    def entry(self, i: int) -> tuple[bytes, int, int, bytes]:
+        """``(key, heap offset, length, digest)`` at table position ``i``."""
+        return _ENTRY.unpack_from(self._mm, self._table + i * _ENTRY.size)
+
+    @property
+    def heap(self) -> tuple[mmap.mmap, int]:
+        """``(buffer, base offset)`` of the record heap, as ``write_index`` takes it."""
+        return self._mm, self._heap
+
+    def record(self, i: int) -> AliasUser:
+        _, offset, length, _ = self.entry(i)
+        start = self._heap + offset
+        return AliasUser.from_json(self._mm[start:start + length])
+
+    def __contains__(self, identifier: str) -> bool:
+        return self.find(encode_key(identifier)) >= 0
+
+    def get(self, identifier: str) -> AliasUser | None:
+        i = self.find(encode_key(identifier))
+        return self.record(i) if i >= 0 else None
+
+    def digest(self, identifier: str) -> bytes | None:
+        i = self.find(encode_key(identifier))
+        return self.entry(i)[3] if i >= 0 else None
+
+    def lookup_many(self, identifiers: Iterable[str]) -> dict[str, AliasUser | None]:
+        """``{identifier: user or None}``; the queries are sorted so each search starts where the last ended."""
+        out: dict[str, AliasUser | None] = {}
+        lo = 0
+        for key, identifier in sorted({encode_key(i): i.strip() for i in identifiers}.items()):
+            i = self.find(key, lo)
+            if i < 0:
+                lo = -i - 1
+                out[identifier] = None
+            else:
+                lo = i
+                out[identifier] = self.record(i)
+        return out
+
+    def iter_digests(self) -> Iterator[tuple[str, bytes]]:
+        """``(identifier, record digest)`` in identifier order."""
+        for i in range(self._count):
+            key, _, _, digest = self.entry(i)
+            yield decode_key(key), digest
+
+    def __iter__(self) -> Iterator[AliasUser]:
+        for i in range(self._count):
+            yield self.record(i)
@@ -0,0 +1,163 @@
+"""Streaming reader for the GIB registered-user alias lists (``<UserList>`` XML).
+
+The national lists run to hundreds of megabytes, so ``iter_users`` walks
+them with ``iterparse`` and drops every ``<User>`` element (and its place
+in the root) as soon as it has been read; memory stays flat whatever the
+size of the file. Any binary file object works; ``open_list`` opens a
+plain XML file or streams the list out of a downloaded ``aliases.zip``
+without extracting it.
+"""
+
+from __future__ import annotations
+
+import json
+import xml.etree.ElementTree as ET
+import zipfile
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from tools.fs import REPO_ROOT
+
+DEFAULT_XML = REPO_ROOT / "aliases" / "despatch_pk.xml"
+DEFAULT_ZIP = REPO_ROOT / "aliases.zip"
+
+
+class AliasListError(ValueError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class Alias:
+    document_type: str  # e.g. "DespatchAdvice", "Invoice"
+    name: str  # urn:mail:...
+    created: str
+    deleted: str | None = None
+
+    @property
+    def active(self) -> bool:
+        return self.deleted is None
+
+
+@dataclass(frozen=True, slots=True)
+class AliasUser:
+    identifier: str  # 10-digit VKN or 11-digit TCKN
+    title: str
+    type: str  # OZEL / KAMU
+    first_creation: str
+    account_type: str
+    aliases: tuple[Alias, ...] = ()
+
+    def active_aliases(self, document_type: str | None = None) -> list[Alias]:
+        return [a for a in self.aliases
+                if a.active and (document_type is None or a.document_type == document_type)]
+
+    def to_json(self) -> bytes:
+        """Compact, canonical encoding; equal users encode to equal bytes."""
+        return json.dumps(
+            [self.identifier, self.title, self.type, self.first_creation, self.account_type,
+             [[a.document_type, a.name, a.created, a.deleted] for a in self.aliases]],
+            ensure_ascii=False, separators=(",", ":"),
+        ).encode("utf-8")
+
+    @classmethod
+    def from_json(cls, data: bytes | str) -> "AliasUser":
+        identifier, title, type_, first, account, aliases = json.loads(data)
+        return cls(identifier, title, type_, first, account, tuple(Alias(*a) for a in aliases))
+
+
+def _text(elem: ET.Element, tag: str) -> str | None:
+    child = elem.find(tag)
+    if child is None or child.text is None:
+        return None
+    return child.text.strip()
+
+
+def _user(elem: ET.Element) -> AliasUser:
+    identifier = _text(elem, "Identifier")
+    if not identifier:
+        raise AliasListError("<User> without an <Identifier>")
+    aliases = []
+    for doc in elem.iterfind("Documents/Document"):
+        doc_type = doc.get("type", "")
+        for alias in doc.iterfind("Alias"):
+            aliases.append(Alias(doc_type, _text(alias, "Name") or "", _text(alias, "CreationTime") or "",
+                                 _text(alias, "DeletionTime")))
+    return AliasUser(identifier, _text(elem, "Title") or "", _text(elem, "Type") or "",
+                     _text(elem, "FirstCreationTime") or "", _text(elem, "AccountType") or "", tuple(aliases))
+
+
+def iter_users(source: str | Path | BinaryIO) -> Iterator[AliasUser]:
+    """``AliasUser`` records in file order."""
+    events = ET.iterparse(source, events=("start", "end"))
+    try:
+        _, root = next(events)
+    except ET.ParseError as e:
+        raise AliasListError(f"not an alias list: {e}") from None
+    if root.tag != "UserList":
+        raise AliasListError(f"root element is <{root.tag}>, expected <UserList>")
+    depth = 0
+    try:
+        for event, elem in events:
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 0 and elem.tag == "User":
+                yield _user(elem)
+                root.clear()  # drops the finished <User> and anything before it
+    except ET.ParseError as e:
+        raise AliasListError(str(e)) from None
+
+
+class ChecksumReader:
+    """Wraps a binary stream, keeping the CRC-32 and size of everything read through it."""
+
+    def __init__(self, raw: BinaryIO):
+        self._raw = raw
+        self.crc = 0
+        self.size = 0
+
+    def read(self, n: int = -1) -> bytes:
+        data = self._raw.read(n)
+        self.crc = zlib.crc32(data, self.crc)
+        self.size += len(data)
+        return data
+
+    @property
+    def stamp(self) -> tuple[int, int]:
+        return self.crc, self.size
+
+
+def _member(archive: zipfile.ZipFile) -> zipfile.ZipInfo:
+    members = [i for i in archive.infolist() if i.filename.lower().endswith(".xml") and not i.is_dir()]
+    if len(members) != 1:
+        raise AliasListError(f"{archive.filename}: expected one .xml member, found {len(members)}")
+    return members[0]
+
+
+def list_name(path: str | Path) -> str:
+    """File name of the list itself: ``path``'s, or that of the XML inside a zip."""
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            return Path(_member(archive).filename).name
+    return Path(path).name
+
+
+@contextmanager
+def open_list(path: str | Path) -> Iterator[tuple[BinaryIO, tuple[int, int] | None]]:
+    """``(stream, (crc32, size) of the XML or None)``; zip members are decompressed as they are read.
+
+    The stamp comes from the zip directory, so it is known before a byte is
+    inflated; for a plain file it is ``None``.
+    """
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            info = _member(archive)
+            with archive.open(info) as f:
+                yield f, (info.CRC, info.file_size)
+    else:
+        with open(path, "rb") as f:
+            yield f, None
@@ -0,0 +1,186 @@
+"""Delta sync of an alias index against a newly downloaded list.
+
+``sync`` streams the new list (straight out of ``aliases.zip``, nothing is
+extracted) and looks each user up in the existing index: an identifier
+the index lacks is an insert, one whose record digest differs is a change
+and is diffed field by field, and index entries the new list never
+mentioned are removals. An identifier listed more than once counts once,
+as its last record, which is the one ``build_index`` keeps too. Only
+inserted and changed records are encoded into the delta; unchanged ones are copied from the old index's heap when
+the new index is written. Each difference is reported as a ``Change``,
+but only once the new index has replaced the old one: until then they are
+spooled to a temp file, so a sync that fails part way reports nothing and
+the next run finds the same differences again.
+
+A download whose CRC-32 and size (read from the zip directory) equal the
+stamp in the index is skipped without inflating it.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import mmap
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from .index import (
+    AliasIndex, SortedRuns, build_index, encode_key, map_file, record_digest, write_index,
+)
+from .parse import Alias, AliasUser, ChecksumReader, iter_users, open_list
+
+INSERT, CHANGE, REMOVE = "insert", "change", "remove"
+_FIELDS = ("title", "type", "first_creation", "account_type")
+
+# Per entry of the old index while syncing
+_UNSEEN, _UNCHANGED, _CHANGED = 0, 1, 2
+
+
+@dataclass
+class Change:
+    op: str  # insert / change / remove
+    identifier: str
+    title: str
+    fields: dict[str, tuple[str, str]] = field(default_factory=dict)  # name -> (old, new)
+    added: list[Alias] = field(default_factory=list)
+    removed: list[Alias] = field(default_factory=list)
+    deleted: list[Alias] = field(default_factory=list)  # aliases that gained (or changed) a DeletionTime
+
+    def to_dict(self) -> dict:
+        out: dict = {"op": self.op, "identifier": self.identifier, "title": self.title}
+        if self.fields:
+            out["fields"] = {name: list(values) for name, values in self.fields.items()}
+        for name in ("added", "removed", "deleted"):
+            aliases = getattr(self, name)
+            if aliases:
+                out[name] = [[a.document_type, a.name, a.created, a.deleted] for a in aliases]
+        return out
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Change":
+        change = cls(data["op"], data["identifier"], data["title"],
+                     {name: tuple(values) for name, values in data.get("fields", {}).items()})
+        for name in ("added", "removed", "deleted"):
+            setattr(change, name, [Alias(*a) for a in data.get(name, ())])
+        return change
+
+
+@dataclass
+class SyncStats:
+    inserted: int = 0
+    changed: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    skipped: bool = False  # the source matched the index's stamp
+    built: bool = False  # there was no index; it was built from scratch
+    users: int = 0
+
+
+def _alias_key(a: Alias) -> tuple[str, str, str]:
+    return a.document_type, a.name, a.created
+
+
+def diff_users(old: AliasUser, new: AliasUser) -> Change:
+    change = Change(CHANGE, new.identifier, new.title)
+    for name in _FIELDS:
+        before, after = getattr(old, name), getattr(new, name)
+        if before != after:
+            change.fields[name] = (before, after)
+    old_aliases = {_alias_key(a): a for a in old.aliases}
+    new_aliases = {_alias_key(a): a for a in new.aliases}
+    for key, alias in new_aliases.items():
+        previous = old_aliases.get(key)
+        if previous is None:
+            change.added.append(alias)
+        elif previous.deleted != alias.deleted:
+            change.deleted.append(alias)
+    change.removed = [a for key, a in old_aliases.items() if key not in new_aliases]
+    return change
+
+
+def sync(source: str | Path, index: str | Path, on_change: Callable[[Change], None] | None = None,
+         force: bool = False) -> SyncStats:
+    """Bring the index at ``index`` up to date with the list at ``source`` (XML or zip)."""
+    index = Path(index)
+    stats = SyncStats()
+    with open_list(source) as (stream, stamp):
+        reader = ChecksumReader(stream)
+        if not index.exists():
+            built = build_index(iter_users(reader), index, lambda: stamp or reader.stamp)
+            stats.built, stats.inserted, stats.users = True, built.users, built.users
+            return stats
+        with AliasIndex(index) as old:
+            if not force and stamp is not None and stamp == old.stamp:
+                stats.skipped, stats.unchanged, stats.users = True, len(old), len(old)
+                return stats
+            with tempfile.TemporaryDirectory(prefix=".alix-", dir=index.parent) as tmp:
+                state = bytearray(len(old))
+                runs = SortedRuns(tmp)
+                delta_path = f"{tmp}/delta"
+                changes_path = f"{tmp}/changes"
+                offset = 0
+                inserted: set[bytes] = set()
+                last: dict[bytes, int] = {}  # seq of the last record of each identifier listed more than once
+                with open(delta_path, "wb") as delta, open(changes_path, "w", encoding="utf-8") as changes:
+                    def emit(seq: int, change: Change) -> None:
+                        changes.write(json.dumps([seq, change.to_dict()], ensure_ascii=False) + "\n")
+
+                    for seq, user in enumerate(iter_users(reader)):
+                        key = encode_key(user.identifier)
+                        record = user.to_json()
+                        digest = record_digest(record)
+                        i = old.find(key)
+                        repeat = state[i] != _UNSEEN if i >= 0 else key in inserted
+                        if repeat:
+                            last[key] = seq
+                        if i >= 0 and old.entry(i)[3] == digest:
+                            state[i] = _UNCHANGED
+                            if not repeat:
+                                continue
+                            # An earlier record of this identifier may be in the delta; this one must win
+                        elif i >= 0:
+                            state[i] = _CHANGED
+                            emit(seq, diff_users(old.record(i), user))
+                        else:
+                            inserted.add(key)
+                            emit(seq, Change(INSERT, user.identifier, user.title, added=list(user.aliases)))
+                        delta.write(record)
+                        runs.add((key, 1, seq, offset, len(record), digest))
+                        offset += len(record)
+                    i = state.find(_UNSEEN)
+                    while i >= 0:
+                        user = old.record(i)
+                        emit(-1, Change(REMOVE, user.identifier, user.title, removed=list(user.aliases)))
+                        stats.removed += 1
+                        i = state.find(_UNSEEN, i + 1)
+                stats.unchanged, stats.changed = state.count(_UNCHANGED), state.count(_CHANGED)
+                stats.inserted = len(inserted)
+                stats.users = len(old) - stats.removed + stats.inserted
+                new_stamp = stamp or reader.stamp
+                if stats.unchanged == len(old) and not stats.inserted and new_stamp == old.stamp:
+                    return stats
+
+                # The old table minus removed and changed entries is already sorted; merge the delta in
+                def kept():
+                    for i, seen in enumerate(state):
+                        if seen == _UNCHANGED:
+                            key, start, length, digest = old.entry(i)
+                            yield key, 0, i, start, length, digest
+
+                records = map_file(delta_path)
+                try:
+                    entries = heapq.merge(kept(), runs.merged())
+                    write_index(index, entries, [old.heap, (records, 0)], new_stamp, tmp, old.close)
+                finally:
+                    if isinstance(records, mmap.mmap):
+                        records.close()
+                if on_change is not None:
+                    with open(changes_path, encoding="utf-8") as changes:
+                        for line in changes:
+                            seq, change = json.loads(line)
+                            # Changes are diffed against the old index, so only the last record's counts
+                            if last.get(encode_key(change["identifier"]), seq) == seq:
+                                on_change(Change.from_dict(change))
+    return stats
@@ -0,0 +1,127 @@
+"""``sync`` against small generated alias lists.
+
+    python -m pytest tools/aliases        # or: python -m unittest tools.aliases.test_sync
+"""
+
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from .index import AliasIndex, build_index
+from .parse import iter_users
+from .sync import CHANGE, INSERT, REMOVE, sync
+
+
+def _user(identifier: str, title: str, alias: str = "", deleted: str = "") -> str:
+    deletion = f"<DeletionTime>{deleted}</DeletionTime>" if deleted else ""
+    return (f"<User><Identifier>{identifier}</Identifier><Title>{title}</Title><Type>OZEL</Type>"
+            f"<FirstCreationTime>2020-01-01</FirstCreationTime><AccountType>Ozel</AccountType>"
+            f"<Documents><Document type='DespatchAdvice'><Alias><Name>{alias or 'urn:mail:' + identifier}</Name>"
+            f"<CreationTime>2020-01-02</CreationTime>{deletion}</Alias></Document></Documents></User>")
+
+
+def _listed(path: Path) -> dict:
+    """The users of a zipped list by identifier, the last record of each winning."""
+    with zipfile.ZipFile(path) as archive, archive.open("list.xml") as f:
+        return {user.identifier: user for user in iter_users(f)}
+
+
+def _users(count: int) -> list[tuple[str, str]]:
+    return [(str(1000000000 + i), f"Firma {i}") for i in range(count)]
+
+
+class SyncTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.index = self.root / "list.idx"
+
+    def write(self, users, name="list.zip") -> Path:
+        """A downloaded list as GIB ships it: one XML member in a zip."""
+        xml = "<UserList>" + "".join(_user(*u) for u in users) + "</UserList>"
+        path = self.root / name
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("list.xml", xml)
+        return path
+
+    def sync(self, source, force=False):
+        changes = []
+        stats = sync(source, self.index, changes.append, force)
+        return stats, changes
+
+    def contents(self, path=None) -> dict:
+        with AliasIndex(path or self.index) as index:
+            return {user.identifier: user for user in map(index.record, range(len(index)))}
+
+    def test_first_sync_builds(self):
+        stats, changes = self.sync(self.write(_users(20)))
+        self.assertTrue(stats.built)
+        self.assertEqual((stats.inserted, stats.users, changes), (20, 20, []))
+        self.assertEqual(len(self.contents()), 20)
+
+    def test_insert_change_remove(self):
+        users = _users(50)
+        self.sync(self.write(users))
+        users = [u for u in users if u[0] != "1000000003"]  # removed
+        users[5] = (users[5][0], "Firma 6 Ltd")  # changed
+        users.append(("2000000000", "Yeni Firma"))  # inserted
+        stats, changes = self.sync(self.write(users, "next.zip"))
+        self.assertEqual((stats.inserted, stats.changed, stats.removed, stats.unchanged, stats.users),
+                         (1, 1, 1, 48, 50))
+        self.assertEqual(sorted((c.op, c.identifier) for c in changes),
+                         [(CHANGE, "1000000006"), (INSERT, "2000000000"), (REMOVE, "1000000003")])
+        change = next(c for c in changes if c.op == CHANGE)
+        self.assertEqual(change.fields, {"title": ("Firma 6", "Firma 6 Ltd")})
+
+        self.assertEqual(self.contents(), _listed(self.root / "next.zip"))
+
+    def test_alias_changes(self):
+        self.sync(self.write([("1000000000", "A", "urn:mail:a")]))
+        _, changes = self.sync(self.write([("1000000000", "A", "urn:mail:a", "2024-01-01")], "next.zip"))
+        [change] = changes
+        self.assertEqual([a.name for a in change.deleted], ["urn:mail:a"])
+        _, changes = self.sync(self.write([("1000000000", "A", "urn:mail:b")], "third.zip"))
+        [change] = changes
+        self.assertEqual(([a.name for a in change.added], [a.name for a in change.removed]),
+                         (["urn:mail:b"], ["urn:mail:a"]))
+
+    def test_unchanged_download_is_skipped(self):
+        source = self.write(_users(10))
+        self.sync(source)
+        stats, changes = self.sync(source)
+        self.assertTrue(stats.skipped)
+        self.assertEqual((stats.unchanged, changes), (10, []))
+        stats, changes = self.sync(source, force=True)
+        self.assertFalse(stats.skipped)
+        self.assertEqual((stats.inserted, stats.changed, stats.removed, stats.unchanged, changes), (0, 0, 0, 10, []))
+
+    def test_repeated_identifiers_count_once_as_their_last_record(self):
+        users = _users(5)
+        self.sync(self.write(users))
+        listed = users + [
+            ("1000000001", "Changed, then listed again as before"), users[1],
+            ("2000000000", "New"), ("2000000000", "New, listed twice"),
+            users[2], ("1000000002", "Listed as before, then changed"),
+        ]
+        stats, changes = self.sync(self.write(listed, "next.zip"))
+        self.assertEqual((stats.inserted, stats.changed, stats.removed, stats.unchanged, stats.users),
+                         (1, 1, 0, 4, 6))
+        self.assertEqual(sorted((c.op, c.identifier, c.title) for c in changes),
+                         [(CHANGE, "1000000002", "Listed as before, then changed"),
+                          (INSERT, "2000000000", "New, listed twice")])
+        contents = self.contents()
+        self.assertEqual(contents["1000000001"].title, "Firma 1")
+        self.assertEqual(contents["1000000002"].title, "Listed as before, then changed")
+
+        # The same list built from scratch keeps the same records
+        rebuilt = self.root / "rebuilt.idx"
+        self.assertEqual(contents, _listed(self.root / "next.zip"))
+        with zipfile.ZipFile(self.root / "next.zip") as archive, archive.open("list.xml") as f:
+            build_index(iter_users(f), rebuilt)
+        self.assertEqual(self.contents(rebuilt), contents)
+
+
+if __name__ == "__main__":
+    unittest.main()
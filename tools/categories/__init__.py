@@ -0,0 +1,16 @@
+"""Global category tree from marketplace taxonomies (scripts/AmazonCategories.xlsx).
+
+    python -m tools.categories tree [scripts/AmazonCategories.xlsx] [--depth 3] [--format json|ts] [-o OUT]
+    python -m tools.categories paths [scripts/AmazonCategories.xlsx] [--depth 3]
+    python -m tools.categories bench --scale 500000
+"""
+
+from .tree import (
+    DEPTH, GENERIC_TERMS, LEVELS, CategoryTrie, GenericNames, TreeStats, build_tree, synthetic,
+)
+from .workbook import WorkbookError, iter_records, iter_rows
+
+__all__ = [
+    "DEPTH", "GENERIC_TERMS", "LEVELS", "CategoryTrie", "GenericNames", "TreeStats", "WorkbookError",
+    "build_tree", "iter_records", "iter_rows", "synthetic",
+]
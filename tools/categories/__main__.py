@@ -0,0 +1,84 @@
+import argparse
+import json
+import sys
+import time
+
+from tools.fs import REPO_ROOT
+
+from .tree import DEPTH, build_tree, synthetic
+from .workbook import WorkbookError, iter_records
+
+WORKBOOK = REPO_ROOT / "scripts" / "AmazonCategories.xlsx"
+
+
+def _peak_mb() -> int | None:
+    """Peak resident size of this process, where the platform reports it (not on Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // (1 << 20) if sys.platform == "darwin" else peak // 1024  # bytes on macOS, KiB elsewhere
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.categories")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("tree", help="the deduplicated category tree, as seed-global-categories.ts takes it")
+    p.add_argument("source", nargs="?", default=str(WORKBOOK))
+    p.add_argument("--depth", type=int, default=DEPTH)
+    p.add_argument("--sheet", help="sheet name (default: the first)")
+    p.add_argument("--format", choices=("json", "ts"), default="json",
+                   help="ts writes a module exporting catalogTree")
+    p.add_argument("-o", "--output", help="write here instead of stdout")
+
+    p = sub.add_parser("paths", help="the deduplicated paths, one per line, shallowest first")
+    p.add_argument("source", nargs="?", default=str(WORKBOOK))
+    p.add_argument("--depth", type=int, default=DEPTH)
+    p.add_argument("--sheet", help="sheet name (default: the first)")
+
+    p = sub.add_parser("bench", help="build a tree from generated rows")
+    p.add_argument("--scale", type=int, default=500_000, help="rows")
+    p.add_argument("--depth", type=int, default=5)
+    p.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    try:
+        if args.command == "bench":
+            records = synthetic(args.scale, args.depth, args.seed)
+        else:
+            records = iter_records(args.source, args.sheet)
+        trie, stats = build_tree(records, args.depth)
+    except (WorkbookError, FileNotFoundError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    seconds = time.perf_counter() - t0
+    peak = _peak_mb()
+    print(f"{stats.rows} rows -> {len(trie)} categories ({' / '.join(map(str, stats.depths))} by depth, "
+          f"{len(trie.names)} distinct names, {stats.dropped} duplicates dropped) in {seconds:.2f} s"
+          + (f", peak {peak} MB" if peak is not None else ""), file=sys.stderr)
+    if args.command == "bench":
+        return 0
+
+    out = open(args.output, "w", encoding="utf-8") if getattr(args, "output", None) else sys.stdout
+    try:
+        if args.command == "paths":
+            for path in trie.paths():
+                out.write(path + "\n")
+        elif args.format == "ts":
+            out.write("export const catalogTree = " + json.dumps(trie.to_tree(), ensure_ascii=False, indent=2)
+                      + ";\n")
+        else:
+            json.dump(trie.to_tree(), out, ensure_ascii=False, indent=2)
+            out.write("\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""Category path trie with the integrator's deduplication rules.
+
+scripts/amazon-excel-integrator.ts keeps each path as a joined string in
+a ``Set``, remembers the first parent of every lower-cased name in a map
+and, for every name, loops over ``GENERIC_TERMS`` with ``includes``.
+Here a path is a walk down a trie whose nodes are two integer arrays
+(parent, name id) over a table of interned names, so a node costs a few
+bytes however long its path, and the generic test is one pass of an
+Aho–Corasick automaton over the name, done once per distinct name.
+
+The rules are the script's: a non-generic name already placed under a
+different parent is dropped with everything below it in that row;
+generic names ("accessories", "parts", ...) may repeat under any parent.
+"""
+
+from __future__ import annotations
+
+import random
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Mapping
+
+from tools.aho import Automaton
+
+# amazon-excel-integrator.ts
+GENERIC_TERMS = (
+    "accessories", "parts", "components", "cables", "cases", "covers", "others", "miscellaneous", "sets", "kits",
+    "hardware", "equipment", "tools", "supplies", "chargers", "batteries", "adapters", "lighting", "storage",
+    "bags", "mounts", "stands", "attachments", "replacement parts", "more",
+)
+LEVELS = ("Mai Category", *(f"Subcategory {i}" for i in range(1, 9)))  # the sheet's headers, typo included
+DEPTH = 3  # the integrator stops at Subcategory 2
+SEPARATOR = " > "
+_ROOT = "ROOT"  # first-parent marker of a top-level name, as in the script
+
+
+class GenericNames:
+    """``isGeneric`` from the integrator: empty, or containing any generic term."""
+
+    def __init__(self, terms: Iterable[str] = GENERIC_TERMS):
+        self._automaton = Automaton(tuple(terms))
+        self._seen: dict[str, bool] = {}
+
+    def __call__(self, name: str) -> bool:
+        generic = self._seen.get(name)
+        if generic is None:
+            generic = self._seen[name] = not name or self._automaton.search(name.lower())
+        return generic
+
+
+@dataclass
+class TreeStats:
+    rows: int = 0
+    dropped: int = 0  # names cut because they already sit under another parent
+    depths: list[int] = field(default_factory=list)  # nodes per depth, top level first
+
+
+class CategoryTrie:
+    """Node 0 is the (unnamed) root; node ``i`` has ``parent[i]`` and ``name[i]``, an index into ``names``.
+
+    Nodes are numbered in the order their paths were first seen, so
+    children come out in that order too.
+    """
+
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self._name_ids: dict[str, int] = {}
+        self.parent = array("i", [-1])
+        self.name = array("i", [-1])
+        self.depth = array("B", [0])
+        self._children: dict[int, int] = {}  # parent << 32 | name id -> node
+
+    def __len__(self) -> int:
+        return len(self.parent) - 1
+
+    def add(self, parent: int, name: str) -> int:
+        """The child of ``parent`` called ``name``, created if missing."""
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+        key = parent << 32 | name_id
+        node = self._children.get(key)
+        if node is None:
+            node = self._children[key] = len(self.parent)
+            self.parent.append(parent)
+            self.name.append(name_id)
+            self.depth.append(self.depth[parent] + 1)
+        return node
+
+    def path(self, node: int) -> list[str]:
+        out = []
+        while node > 0:
+            out.append(self.names[self.name[node]])
+            node = self.parent[node]
+        return out[::-1]
+
+    def paths(self) -> Iterator[str]:
+        """Every path joined with ``" > "``, shallowest first, as the integrator lists them."""
+        for depth in range(1, max(self.depth, default=0) + 1):
+            for node in range(1, len(self.parent)):
+                if self.depth[node] == depth:
+                    yield SEPARATOR.join(self.path(node))
+
+    def to_tree(self) -> list[dict]:
+        """Nested ``{"name", "children"}`` nodes, the shape of ``catalogTree`` in seed-global-categories.ts.
+
+        Leaves have no ``children`` key.
+        """
+        nodes: list[dict] = [{"children": []}]
+        for i in range(1, len(self.parent)):
+            node = {"name": self.names[self.name[i]]}
+            nodes.append(node)
+            nodes[self.parent[i]].setdefault("children", []).append(node)
+        return nodes[0]["children"]
+
+
+def build_tree(records: Iterable[Mapping[str, str]], depth: int = DEPTH, levels: tuple[str, ...] = LEVELS,
+               generic: GenericNames | None = None) -> tuple[CategoryTrie, TreeStats]:
+    """The deduplicated trie of the records' category columns, down to ``depth`` levels."""
+    is_generic = generic or GenericNames()
+    columns = levels[:depth]
+    trie = CategoryTrie()
+    stats = TreeStats()
+    first_parent: dict[str, str] = {}
+    for record in records:
+        stats.rows += 1
+        names = [(record.get(column) or "").strip() for column in columns]
+        if not names[0]:
+            continue
+        node = trie.add(0, names[0])
+        if not is_generic(names[0]):
+            first_parent[names[0].lower()] = _ROOT
+        parent = names[0]
+        for name in names[1:]:
+            if not name:
+                break
+            key = name.lower()
+            seen = first_parent.get(key)
+            if seen is not None and seen != parent and not is_generic(name):
+                stats.dropped += 1
+                break
+            first_parent[key] = parent
+            node = trie.add(node, name)
+            parent = name
+    stats.depths = [0] * max(trie.depth, default=0)
+    for d in trie.depth[1:]:
+        stats.depths[d - 1] += 1
+    return trie, stats
+
+
+_WORDS = (
+    "Home", "Kitchen", "Garden", "Outdoor", "Office", "Sports", "Fitness", "Baby", "Toys", "Automotive", "Pet",
+    "Beauty", "Health", "Audio", "Video", "Camera", "Phone", "Computer", "Tablet", "Printer", "Network", "Smart",
+    "Power", "Hand", "Water", "Travel", "Craft", "Party", "Food", "Drink", "Storage", "Accessories", "Parts",
+)
+
+
+def synthetic(rows: int, depth: int = DEPTH, seed: int = 0) -> Iterator[dict[str, str]]:
+    """Sheet-like records: every row extends an earlier path by one level, as the workbook's rows do."""
+    rng = random.Random(seed)
+    paths: list[list[str]] = []
+    for _ in range(rows):
+        base = rng.choice(paths) if paths and rng.random() < 0.97 else []
+        if len(base) >= depth:
+            base = base[:rng.randrange(depth)]
+        path = [*base, " ".join(rng.sample(_WORDS, rng.randint(1, 3))) + f" {rng.randrange(1000)}"]
+        paths.append(path)
+        yield dict(zip(LEVELS, path))
@@ -0,0 +1,129 @@
+"""Streaming reader for .xlsx worksheets, without a spreadsheet library.
+
+An .xlsx file is a zip of XML parts. ``iter_rows`` locates the sheet
+through the workbook and its relationships, loads the shared-string table
+(the only part that has to be held: cells refer to it by position) and
+walks the sheet with ``iterparse``, dropping each ``<row>`` once read.
+Nothing is extracted to disk, and memory does not grow with the row count.
+"""
+
+from __future__ import annotations
+
+import posixpath
+import sys
+import xml.etree.ElementTree as ET
+import zipfile
+from pathlib import Path
+from typing import Iterator
+
+_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+class WorkbookError(ValueError):
+    pass
+
+
+def _column(ref: str) -> int:
+    """Zero-based column of a cell reference (``C7`` -> 2)."""
+    col = 0
+    for ch in ref:
+        if not ch.isalpha():
+            break
+        col = col * 26 + ord(ch.upper()) - 64
+    return col - 1
+
+
+def _sheet_part(archive: zipfile.ZipFile, sheet: str | None) -> str:
+    """Member name of the named sheet, or of the first one."""
+    workbook = ET.fromstring(archive.read("xl/workbook.xml"))
+    sheets = workbook.findall(f"{_NS}sheets/{_NS}sheet")
+    if not sheets:
+        raise WorkbookError(f"{archive.filename}: the workbook has no sheets")
+    chosen = sheets[0] if sheet is None else next((s for s in sheets if s.get("name") == sheet), None)
+    if chosen is None:
+        raise WorkbookError(f"{archive.filename}: no sheet named {sheet!r}")
+    rels = ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    rid = chosen.get(f"{_REL_NS}id")
+    target = next((r.get("Target") for r in rels.iter(f"{_PKG_NS}Relationship") if r.get("Id") == rid), None)
+    if target is None:
+        raise WorkbookError(f"{archive.filename}: sheet {chosen.get('name')!r} has no part")
+    return target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join("xl", target))
+
+
+def _shared_strings(archive: zipfile.ZipFile) -> list[str]:
+    """The shared-string table; repeated values share one interned string."""
+    try:
+        source = archive.open("xl/sharedStrings.xml")
+    except KeyError:
+        return []
+    strings: list[str] = []
+    with source:
+        for _, elem in ET.iterparse(source):
+            if elem.tag == f"{_NS}si":
+                # Plain text is one <t>, rich text a <t> per run; phonetic hints (<rPh>) are not part of it
+                parts = elem.findall(f"{_NS}t") or elem.findall(f"{_NS}r/{_NS}t")
+                strings.append(sys.intern("".join(t.text or "" for t in parts)))
+                elem.clear()
+    return strings
+
+
+def _value(cell: ET.Element, strings: list[str]) -> str | None:
+    kind = cell.get("t")
+    if kind == "inlineStr":
+        return "".join(t.text or "" for t in cell.iter(f"{_NS}t"))
+    v = cell.findtext(f"{_NS}v")
+    if v is None:
+        return None
+    if kind == "s":
+        return strings[int(v)]
+    if kind == "b":
+        return "TRUE" if v == "1" else "FALSE"
+    return v
+
+
+def iter_rows(path: str | Path, sheet: str | None = None) -> Iterator[list[str | None]]:
+    """Each row's cell values as strings (None for empty cells), gaps filled, in sheet order.
+
+    Rows the sheet omits (entirely empty) are skipped, as ``sheet_to_json`` does.
+    """
+    try:
+        archive = zipfile.ZipFile(path)
+    except zipfile.BadZipFile:
+        raise WorkbookError(f"{path} is not an .xlsx workbook") from None
+    with archive:
+        try:
+            part = _sheet_part(archive, sheet)
+            strings = _shared_strings(archive)
+            with archive.open(part) as f:
+                rows = None
+                for event, elem in ET.iterparse(f, events=("start", "end")):
+                    if event == "start":
+                        if elem.tag == f"{_NS}sheetData":
+                            rows = elem
+                        continue
+                    if elem.tag != f"{_NS}row":
+                        continue
+                    row: list[str | None] = []
+                    for cell in elem.iterfind(f"{_NS}c"):
+                        ref = cell.get("r")
+                        col = _column(ref) if ref else len(row)
+                        row.extend([None] * (col - len(row)))
+                        row.append(_value(cell, strings))
+                    if rows is not None:
+                        rows.clear()  # drops the finished <row>
+                    if any(v is not None for v in row):
+                        yield row
+        except (KeyError, ET.ParseError) as e:
+            raise WorkbookError(f"{path}: {e}") from None
+
+
+def iter_records(path: str | Path, sheet: str | None = None) -> Iterator[dict[str, str]]:
+    """Rows after the first as ``{header: value}``, leaving out empty cells."""
+    rows = iter_rows(path, sheet)
+    header = next(rows, None)
+    if header is None:
+        return
+    for row in rows:
+        yield {header[i]: v for i, v in enumerate(row) if v is not None and i < len(header) and header[i]}
@@ -0,0 +1,27 @@
+"""Tools for the checkpoints/backup_*.json database snapshots.
+
+    python -m tools.checkpoints diff OLD NEW [--fields]
+    python -m tools.checkpoints verify BACKUP...
+    python -m tools.checkpoints chain [DIR]
+    python -m tools.checkpoints export [BACKUP...]
+    python -m tools.checkpoints import NAME [-o OUT] [--force]
+    python -m tools.checkpoints entity NAME ENTITY
+"""
+
+from .diff import BackupIndex, EntityDiff, diff_backups, index_backup
+from .store import CheckpointStore, StoreError
+from .stream import BackupFormatError, iter_backup, iter_raw, open_backup, read_metadata
+
+__all__ = [
+    "BackupFormatError",
+    "BackupIndex",
+    "CheckpointStore",
+    "EntityDiff",
+    "StoreError",
+    "diff_backups",
+    "index_backup",
+    "iter_backup",
+    "iter_raw",
+    "open_backup",
+    "read_metadata",
+]
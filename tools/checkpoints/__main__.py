@@ -0,0 +1,119 @@
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+from tools.fs import REPO_ROOT
+
+from .diff import EntityDiff, chain_diffs, diff_backups, index_many
+from .store import DEFAULT_STORE, CheckpointStore
+
+CHECKPOINT_DIR = REPO_ROOT / "checkpoints"
+
+
+def _print_diffs(diffs: list[EntityDiff], limit: int) -> None:
+    if not diffs:
+        print("  no differences")
+    for d in diffs:
+        print(f"  {d.entity}: +{len(d.added)} -{len(d.removed)} ~{len(d.changed)}")
+        for label, ids in (("+", d.added), ("-", d.removed), ("~", d.changed)):
+            for pk in ids[:limit]:
+                extra = f"  [{', '.join(d.changed_fields[pk])}]" if pk in d.changed_fields else ""
+                print(f"    {label} {pk}{extra}")
+            if limit and len(ids) > limit:
+                print(f"    {label} ... {len(ids) - limit} more")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.checkpoints")
+    parser.add_argument("--jobs", "-j", type=int, default=None)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("diff", help="added/removed/changed records per entity")
+    p.add_argument("old")
+    p.add_argument("new")
+    p.add_argument("--fields", action="store_true", help="list changed field names per record")
+    p.add_argument("--limit", type=int, default=20, help="ids shown per category")
+
+    p = sub.add_parser("verify", help="check record counts against metadata.stats")
+    p.add_argument("backups", nargs="+")
+
+    p = sub.add_parser("chain", help="diff every backup against the previous one")
+    p.add_argument("dir", nargs="?", default=str(CHECKPOINT_DIR))
+    p.add_argument("--limit", type=int, default=0)
+
+    p = sub.add_parser("export", help="add backups to the deduplicated store")
+    p.add_argument("backups", nargs="*", help="default: every backup in checkpoints/")
+    p.add_argument("--store", default=str(DEFAULT_STORE))
+
+    p = sub.add_parser("import", help="rebuild a backup byte-identically from the store")
+    p.add_argument("name")
+    p.add_argument("-o", "--output", help="default: checkpoints/<name>.json")
+    p.add_argument("--force", action="store_true", help="overwrite the output if it exists")
+    p.add_argument("--store", default=str(DEFAULT_STORE))
+
+    p = sub.add_parser("entity", help="print one entity's records from a stored snapshot")
+    p.add_argument("name")
+    p.add_argument("entity")
+    p.add_argument("--store", default=str(DEFAULT_STORE))
+
+    p = sub.add_parser("gc", help="drop chunks no snapshot references")
+    p.add_argument("--store", default=str(DEFAULT_STORE))
+
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        store = CheckpointStore(args.store)
+        backups = args.backups or sorted(str(p) for p in CHECKPOINT_DIR.glob("backup_*.json"))
+        for path in backups:
+            r = store.export(path)
+            state = "unchanged" if r.unchanged else f"{r.new_chunks}/{r.chunks} new chunks, {r.new_bytes} bytes"
+            print(f"{r.name}: {state}")
+        return 0
+
+    if args.command == "import":
+        store = CheckpointStore(args.store)
+        out = args.output or str(CHECKPOINT_DIR / f"{args.name}.json")
+        if os.path.exists(out) and not args.force:
+            print(f"error: {out} exists; pass --force to overwrite it or -o to write elsewhere", file=sys.stderr)
+            return 2
+        store.restore(args.name, out)
+        print(out)
+        return 0
+
+    if args.command == "entity":
+        records = CheckpointStore(args.store).restore_entity(args.name, args.entity)
+        json.dump(records, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return 0
+
+    if args.command == "gc":
+        print(f"removed {CheckpointStore(args.store).gc()} chunks")
+        return 0
+
+    if args.command == "diff":
+        _print_diffs(diff_backups(args.old, args.new, fields=args.fields, jobs=args.jobs), args.limit)
+        return 0
+
+    if args.command == "verify":
+        bad = 0
+        for index in index_many(args.backups, args.jobs):
+            mismatches = index.count_mismatches()
+            total = sum(len(v) for v in index.entities.values())
+            status = "OK" if not mismatches else "MISMATCH"
+            print(f"{status} {index.path}: {total} records in {len(index.entities)} entities")
+            for entity, (expected, actual) in mismatches.items():
+                print(f"  {entity}: stats say {expected}, found {actual}")
+            bad += bool(mismatches)
+        return 1 if bad else 0
+
+    paths = sorted(str(p) for p in Path(args.dir).glob("backup_*.json"))
+    for old, new, diffs in chain_diffs(paths, args.jobs):
+        print(f"{Path(old).name} -> {Path(new).name}")
+        _print_diffs(diffs, args.limit)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""Content-addressed, deduplicated storage for checkpoint backups.
+
+A backup is split by ``iter_raw`` into envelope text and per-record pieces.
+Consecutive pieces of an entity are grouped into chunks at content-defined
+boundaries (a boundary falls after a piece whose hash has a low first
+byte), so inserting or editing a record only changes the chunks around it.
+Chunks are stored once under ``objects/`` keyed by their hash; a snapshot
+is a manifest listing envelope text and chunk ids in file order:
+
+    .cache/checkpoints/
+      objects/3f/a91c...      zlib-compressed chunk text
+      manifests/backup_2026-03-14T22-32-33.json
+
+Joining a manifest's parts rebuilds the original file byte for byte, and
+one entity can be restored by reading only its own chunks.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import zlib
+from dataclasses import dataclass
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Iterator
+
+from tools.codemod.writer import atomic_write
+from tools.fs import REPO_ROOT
+
+from .stream import iter_raw
+
+DEFAULT_STORE = REPO_ROOT / ".cache" / "checkpoints"
+
+MANIFEST_VERSION = 1
+# A chunk ends after a piece whose hash byte is below this (~1 in 8 records) ...
+BOUNDARY = 256 // 8
+# ... or once it holds this many bytes of text
+MAX_CHUNK = 1 << 16
+
+
+class StoreError(Exception):
+    pass
+
+
+@dataclass
+class ExportResult:
+    name: str
+    chunks: int
+    new_chunks: int
+    new_bytes: int
+    unchanged: bool = False
+
+
+def _chunk_id(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+def _chunks(pieces: Iterator[str]) -> Iterator[str]:
+    group: list[str] = []
+    size = 0
+    for piece in pieces:
+        group.append(piece)
+        size += len(piece)
+        if size >= MAX_CHUNK or hashlib.blake2b(piece.encode("utf-8"), digest_size=1).digest()[0] < BOUNDARY:
+            yield "".join(group)
+            group, size = [], 0
+    if group:
+        yield "".join(group)
+
+
+class CheckpointStore:
+    def __init__(self, root: str | Path = DEFAULT_STORE):
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.manifests = self.root / "manifests"
+
+    def _object_path(self, chunk_id: str) -> Path:
+        return self.objects / chunk_id[:2] / chunk_id[2:]
+
+    def _manifest_path(self, name: str) -> Path:
+        return self.manifests / f"{Path(name).stem}.json"
+
+    def _put(self, text: str) -> tuple[str, int]:
+        """Store a chunk; returns its id and the bytes written (0 if already present)."""
+        data = text.encode("utf-8")
+        chunk_id = _chunk_id(data)
+        path = self._object_path(chunk_id)
+        if path.exists():
+            return chunk_id, 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        blob = zlib.compress(data)
+        atomic_write(path, blob)
+        return chunk_id, len(blob)
+
+    def _get(self, chunk_id: str) -> str:
+        try:
+            data = zlib.decompress(self._object_path(chunk_id).read_bytes())
+        except FileNotFoundError:
+            raise StoreError(f"missing chunk {chunk_id}") from None
+        if _chunk_id(data) != chunk_id:
+            raise StoreError(f"corrupt chunk {chunk_id}")
+        return data.decode("utf-8")
+
+    def names(self) -> list[str]:
+        return sorted(p.stem for p in self.manifests.glob("*.json"))
+
+    def manifest(self, name: str) -> dict:
+        try:
+            return json.loads(self._manifest_path(name).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            raise StoreError(f"no snapshot named {Path(name).stem}") from None
+
+    def export(self, path: str | os.PathLike) -> ExportResult:
+        """Add a backup file; only chunks not already in the store are written."""
+        name = Path(path).stem
+        parts: list = []
+        digest = hashlib.blake2b(digest_size=20)
+        size = chunks = new_chunks = new_bytes = 0
+
+        def texts(f) -> Iterator[tuple[str | None, str]]:
+            nonlocal size
+            for entity, text in iter_raw(f):
+                data = text.encode("utf-8")
+                digest.update(data)
+                size += len(data)
+                yield entity, text
+
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            # An entity's pieces arrive together and go straight into chunks, never held as a whole
+            for entity, run in groupby(texts(f), key=itemgetter(0)):
+                if entity is None:
+                    parts.extend(text for _, text in run)
+                    continue
+                ids = []
+                for text in _chunks(text for _, text in run if text):
+                    chunk_id, written = self._put(text)
+                    ids.append(chunk_id)
+                    chunks += 1
+                    new_chunks += bool(written)
+                    new_bytes += written
+                parts.append({"entity": entity, "chunks": ids})
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "name": name,
+            "size": size,
+            "digest": digest.hexdigest(),
+            "parts": parts,
+        }
+        target = self._manifest_path(name)
+        try:
+            previous = json.loads(target.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            previous = None
+        if previous == manifest:
+            return ExportResult(name, chunks, new_chunks, new_bytes, unchanged=True)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # The manifest goes last: until it exists the new chunks are just unreferenced objects
+        atomic_write(target, json.dumps(manifest, ensure_ascii=False, separators=(",", ":")))
+        return ExportResult(name, chunks, new_chunks, new_bytes)
+
+    def iter_text(self, name: str) -> Iterator[str]:
+        for part in self.manifest(name)["parts"]:
+            if isinstance(part, str):
+                yield part
+            else:
+                for chunk_id in part["chunks"]:
+                    yield self._get(chunk_id)
+
+    def restore(self, name: str, out: str | os.PathLike) -> None:
+        """Rebuild the original backup at ``out``, checking it against the recorded digest."""
+        manifest = self.manifest(name)
+        digest = hashlib.blake2b(digest_size=20)
+        tmp = Path(f"{os.fspath(out)}.tmp{os.getpid()}")
+        try:
+            with open(tmp, "wb") as f:
+                for text in self.iter_text(name):
+                    data = text.encode("utf-8")
+                    digest.update(data)
+                    f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            if digest.hexdigest() != manifest["digest"]:
+                raise StoreError(f"{name}: rebuilt file does not match the exported digest")
+            os.replace(tmp, out)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    def entities(self, name: str) -> list[str]:
+        return [p["entity"] for p in self.manifest(name)["parts"] if isinstance(p, dict)]
+
+    def restore_entity(self, name: str, entity: str) -> list:
+        """Decode one entity's records, reading only that entity's chunks."""
+        for part in self.manifest(name)["parts"]:
+            if isinstance(part, dict) and part["entity"] == entity:
+                return json.loads("[" + "".join(self._get(c) for c in part["chunks"]) + "]")
+        raise StoreError(f"{name} has no entity {entity!r}")
+
+    def gc(self) -> int:
+        """Delete chunks no manifest references; returns how many were removed."""
+        live = {
+            c
+            for name in self.names()
+            for part in self.manifest(name)["parts"]
+            if isinstance(part, dict)
+            for c in part["chunks"]
+        }
+        removed = 0
+        for path in self.objects.glob("*/*"):
+            if path.parent.name + path.name not in live:
+                path.unlink()
+                removed += 1
+        return removed
@@ -0,0 +1,107 @@
+"""Incremental reader for checkpoints/backup_*.json.
+
+A backup is ``{"metadata": {...}, "data": {"<entity>": [record, ...], ...}}``
+as written by scripts/create-backup.js. The reader walks that envelope
+itself and decodes one record at a time, so memory is bounded by the
+largest single record plus the read buffer, not by the backup size.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+from tools.jsonstream import CHUNK, JsonReader
+from tools.jsonstream import JsonStreamError as BackupFormatError
+
+
+def iter_backup(f, chunk: int = CHUNK) -> Iterator[tuple[str, Any]]:
+    """Yield ``("metadata", dict)`` and ``(entity, record)`` pairs from an open text file.
+
+    An entity with no records yields ``(entity, None)`` once so callers still
+    see it.
+    """
+    r = JsonReader(f, chunk)
+    r.expect("{")
+    if r.peek() == "}":
+        return
+    while True:
+        top = r.key()
+        if top == "data":
+            r.expect("{")
+            if r.peek() != "}":
+                while True:
+                    entity = r.key()
+                    r.expect("[")
+                    if r.peek() == "]":
+                        r.pos += 1
+                        yield entity, None
+                    else:
+                        while True:
+                            yield entity, r.value()
+                            if not r.comma_or("]"):
+                                break
+                    if not r.comma_or("}"):
+                        break
+            else:
+                r.pos += 1
+        else:
+            yield top, r.value()
+        if not r.comma_or("}"):
+            break
+
+
+def iter_raw(f, chunk: int = CHUNK) -> Iterator[tuple[str | None, str]]:
+    """Split an open text file into ``(None, envelope)`` and ``(entity, piece)`` texts.
+
+    Concatenating every yielded text reproduces the file exactly. Each piece
+    is one record's raw JSON with the separator in front of it, so the pieces
+    of an entity joined together are the body of its ``[...]`` array. Empty
+    arrays yield ``(entity, "")``. Open ``f`` with ``newline=""`` so line
+    endings survive.
+    """
+    r = JsonReader(f, chunk, track=True)
+    r.expect("{")
+    if r.peek() != "}":
+        while True:
+            if r.key() == "data":
+                r.expect("{")
+                if r.peek() != "}":
+                    while True:
+                        entity = r.key()
+                        r.expect("[")
+                        yield None, r.take()
+                        if r.peek() == "]":
+                            yield entity, ""
+                            r.pos += 1
+                        else:
+                            while True:
+                                r.value()
+                                yield entity, r.take()
+                                if not r.comma_or("]"):
+                                    break
+                            # Whitespace before the closing bracket is the last piece of the body
+                            r.pos -= 1
+                            yield entity, r.take()
+                            r.pos += 1
+                        if not r.comma_or("}"):
+                            break
+                else:
+                    r.pos += 1
+            else:
+                r.value()
+            if not r.comma_or("}"):
+                break
+    yield None, r.take() + r.rest()
+
+
+def open_backup(path) -> Iterator[tuple[str, Any]]:
+    with open(path, "r", encoding="utf-8") as f:
+        yield from iter_backup(f)
+
+
+def read_metadata(path) -> dict:
+    """Metadata only; create-backup.js writes it first, so this stops before the data."""
+    for key, value in open_backup(path):
+        if key == "metadata":
+            return value
+    return {}
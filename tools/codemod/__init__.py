@@ -0,0 +1,9 @@
+"""Batch codemod engine for the TS/TSX tree.
+
+    python -m tools.codemod rules.json [--root src] [--jobs N]
+"""
+
+from .engine import FileResult, Report, apply_rules, run
+from .rules import Rule, load_rules
+
+__all__ = ["FileResult", "Report", "Rule", "apply_rules", "load_rules", "run"]
@@ -0,0 +1,60 @@
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from tools.fs import REPO_ROOT
+from tools.scan import read_csv
+
+from .cache import CodemodCache
+from .engine import DEFAULT_ROOT, run
+from .rules import load_rules
+
+
+def _scanned_files(source: str, root: str) -> list[str]:
+    """Distinct paths from a scan CSV, made relative to ``root``; files outside it are dropped."""
+    root_path = Path(root).resolve()
+    f = sys.stdin if source == "-" else open(source, encoding="utf-8-sig", newline="")
+    try:
+        paths = dict.fromkeys(hit.path for hit in read_csv(f))
+    finally:
+        if f is not sys.stdin:
+            f.close()
+    files = []
+    for path in paths:
+        try:
+            rel = (REPO_ROOT / path).resolve().relative_to(root_path).as_posix()
+        except ValueError:
+            continue
+        if os.path.isfile(root_path / rel):
+            files.append(rel)
+    return files
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.codemod")
+    parser.add_argument("rules", help="JSON rule file")
+    parser.add_argument("--root", default=str(DEFAULT_ROOT), help="tree to rewrite (default: src/)")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--dry-run", "-n", action="store_true",
+                        help="write nothing; stream unified diffs to stdout and the summary to stderr")
+    parser.add_argument("--no-cache", action="store_true", help="read every file even if the cache can rule it out")
+    parser.add_argument("--files-from", metavar="CSV",
+                        help="only rewrite files listed in a tools.scan CSV ('-' for stdin)")
+    args = parser.parse_args(argv)
+
+    rules = load_rules(args.rules)
+    options = dict(jobs=args.jobs, write=not args.dry_run, diff_out=sys.stdout if args.dry_run else None)
+    if args.files_from:
+        options["files"] = _scanned_files(args.files_from, args.root)
+    if args.no_cache:
+        report = run(rules, args.root, **options)
+    else:
+        with CodemodCache() as cache:
+            report = run(rules, args.root, cache=cache, **options)
+    print(report.summary(rules), file=sys.stderr if args.dry_run else sys.stdout)
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
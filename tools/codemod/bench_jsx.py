@@ -0,0 +1,55 @@
+"""Micro-benchmark: JSX block locator vs the DOTALL regexes from rewrite_modals.py.
+
+    python -m tools.codemod.bench_jsx [file] [--repeat N]
+"""
+
+import argparse
+import re
+import timeit
+
+from tools.fs import REPO_ROOT
+
+from .jsx import find_conditional_block
+
+DEFAULT_FILE = REPO_ROOT / "src/app/(app)/customers/[id]/CustomerDetailClient.tsx"
+
+MODALS = [
+    ("WARRANTY START MODAL", "warrantyModalOpen"),
+    ("CHECK / SENET ADD MODAL", "checkAddModalOpen"),
+    ("OTP COMPLIANCE MODAL", "otpModalOpen"),
+]
+
+
+def legacy_pattern(marker: str, cond: str) -> re.Pattern:
+    return re.compile(
+        r"\{/\* " + re.escape(marker) + r" \*/\}(.*?)\{" + re.escape(cond) + r" && \((.*?)\)\n\s*\}",
+        re.DOTALL,
+    )
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m tools.codemod.bench_jsx")
+    parser.add_argument("file", nargs="?", default=str(DEFAULT_FILE))
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    with open(args.file, "r", encoding="utf-8") as f:
+        text = f.read()
+    print(f"{args.file}: {text.count(chr(10)) + 1} lines, {len(text)} chars")
+
+    for marker, cond in MODALS:
+        pattern = legacy_pattern(marker, cond)
+        m = pattern.search(text)
+        block = find_conditional_block(text, cond, marker)
+        t_regex = min(timeit.repeat(lambda: pattern.search(text), number=1, repeat=args.repeat))
+        t_scan = min(timeit.repeat(lambda: find_conditional_block(text, cond, marker), number=1, repeat=args.repeat))
+        legacy_span = (m.start(), m.end()) if m else None
+        agree = "same span" if legacy_span == (block.start, block.end) else f"regex span {legacy_span} differs"
+        print(
+            f"  {marker:<26} regex {t_regex * 1e3:8.3f} ms   locator {t_scan * 1e3:8.3f} ms"
+            f"   [{block.start}:{block.end}] {agree}"
+        )
+
+
+if __name__ == "__main__":
+    main()
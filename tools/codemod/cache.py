@@ -0,0 +1,239 @@
+"""Persistent per-file cache that lets codemod runs skip files no rule can touch.
+
+Each file is keyed by path, mtime and size, with a content digest and a
+trigram bitset of its text. A rule can only fire where every trigram of
+each literal it requires is present, so for an unchanged file the verdict
+for a rule set comes from the cache without reading the file at all.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+from tools.fs import REPO_ROOT
+
+from .rules import Rule
+
+try:
+    import re._parser as _sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse as _sre_parse
+
+DEFAULT_PATH = REPO_ROOT / ".cache" / "codemod.sqlite"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_AGE = 30 * 24 * 3600
+_LOOSE = re.IGNORECASE | re.VERBOSE  # flags under which a pattern's literals are not its required bytes
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    digest BLOB NOT NULL,
+    bits BLOB NOT NULL,
+    used REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS verdicts (
+    path TEXT NOT NULL,
+    ruleset BLOB NOT NULL,
+    digest BLOB NOT NULL,
+    may_fire INTEGER NOT NULL,
+    PRIMARY KEY (path, ruleset)
+);
+"""
+
+
+@dataclass(frozen=True)
+class Stamp:
+    """What the cache needs to know about a file's current content."""
+
+    mtime_ns: int
+    size: int
+    digest: bytes
+    bits: bytes
+
+
+def _trigram_hash(tri: bytes, mask: int) -> int:
+    return (tri[0] * 0x9E3779B1 ^ tri[1] * 0x85EBCA77 ^ tri[2] * 0xC2B2AE3D) & mask
+
+
+def trigram_bits(data: bytes) -> bytes:
+    """Bitset of hashed byte trigrams, about one byte per distinct trigram."""
+    trigrams = {data[i:i + 3] for i in range(len(data) - 2)}
+    nbits = 1024
+    while nbits < len(trigrams) * 8:
+        nbits <<= 1
+    mask = nbits - 1
+    bits = bytearray(nbits // 8)
+    for tri in trigrams:
+        h = _trigram_hash(tri, mask)
+        bits[h >> 3] |= 1 << (h & 7)
+    return bytes(bits)
+
+
+def may_contain(bits: bytes, needle: str) -> bool:
+    data = needle.encode("utf-8")
+    if len(data) < 3:
+        return True
+    mask = len(bits) * 8 - 1
+    for i in range(len(data) - 2):
+        h = _trigram_hash(data[i:i + 3], mask)
+        if not bits[h >> 3] & (1 << (h & 7)):
+            return False
+    return True
+
+
+def _regex_literals(rule: Rule) -> list[str]:
+    """Literal runs every match of a regex rule must contain (best effort).
+
+    Case-insensitive and verbose patterns, whether flagged on the rule or
+    inline (``(?i)``, ``(?x:...)``), yield none: their literals are not the
+    bytes that have to appear in the file.
+    """
+    flags = rule._compiled.flags if rule._compiled is not None else 0
+    if flags & _LOOSE:
+        return []
+    try:
+        parsed = _sre_parse.parse(rule.pattern, flags)
+    except Exception:
+        return []
+    if parsed.state.flags & _LOOSE:
+        return []
+    runs: list[str] = []
+    current: list[str] = []
+
+    def walk(items) -> None:
+        for op, arg in items:
+            name = str(op)
+            if name == "LITERAL":
+                current.append(chr(arg))
+                continue
+            if current:
+                runs.append("".join(current))
+                current.clear()
+            if name == "SUBPATTERN" and not arg[1] & _LOOSE:  # arg: group, add flags, del flags, pattern
+                walk(arg[-1])
+                if current:
+                    runs.append("".join(current))
+                    current.clear()
+
+    walk(parsed.data)
+    if current:
+        runs.append("".join(current))
+    return [r for r in runs if len(r) >= 3]
+
+
+def required_literals(rule: Rule) -> list[str]:
+    return _regex_literals(rule) if rule.regex else [rule.pattern]
+
+
+def can_fire(bits: bytes, rel_path: str, rules: Sequence[Rule]) -> bool:
+    return any(
+        rule.applies_to(rel_path) and all(may_contain(bits, lit) for lit in required_literals(rule))
+        for rule in rules
+    )
+
+
+def stamp_bytes(data: bytes, st: os.stat_result) -> Stamp:
+    return Stamp(st.st_mtime_ns, st.st_size, hashlib.blake2b(data, digest_size=16).digest(), trigram_bits(data))
+
+
+def ruleset_key(rules: Sequence[Rule]) -> bytes:
+    """What decides whether the rules can fire on a file; trigram verdicts are keyed by it."""
+    h = hashlib.blake2b(digest_size=16)
+    for rule in rules:
+        h.update(repr((rule.id, rule.pattern, rule.regex, rule.flags, rule.include, rule.exclude)).encode())
+    return h.digest()
+
+
+def rewrite_key(rules: Sequence[Rule]) -> bytes:
+    """``ruleset_key`` plus what only changes the output (replacement, count); names a run's transaction."""
+    h = hashlib.blake2b(ruleset_key(rules), digest_size=16)
+    for rule in rules:
+        h.update(repr((rule.replacement, rule.count)).encode())
+    return h.digest()
+
+
+class CodemodCache:
+    def __init__(self, path: str | Path = DEFAULT_PATH, max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_age: float = DEFAULT_MAX_AGE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.db = sqlite3.connect(self.path)
+        self.db.executescript(_SCHEMA)
+        self._now = time.time()
+
+    def __enter__(self) -> "CodemodCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.evict()
+        self.db.commit()
+        self.db.close()
+
+    def may_fire(self, root: str, rel_path: str, rules: Sequence[Rule], ruleset: bytes | None = None) -> bool:
+        """False only when the cache proves no rule can match the file's current content."""
+        try:
+            st = os.stat(os.path.join(root, rel_path))
+        except OSError:
+            return True
+        key = os.path.join(root, rel_path)
+        row = self.db.execute(
+            "SELECT mtime_ns, size, digest, bits FROM files WHERE path = ?", (key,)
+        ).fetchone()
+        if row is None or row[0] != st.st_mtime_ns or row[1] != st.st_size:
+            return True
+        digest = row[2]
+        ruleset = ruleset or ruleset_key(rules)
+        verdict = self.db.execute(
+            "SELECT may_fire FROM verdicts WHERE path = ? AND ruleset = ? AND digest = ?", (key, ruleset, digest)
+        ).fetchone()
+        self.db.execute("UPDATE files SET used = ? WHERE path = ?", (self._now, key))
+        if verdict is not None:
+            return bool(verdict[0])
+        bits = zlib.decompress(row[3])
+        fire = can_fire(bits, rel_path, rules)
+        self._store_verdict(key, ruleset, digest, fire)
+        return fire
+
+    def store(self, root: str, rel_path: str, stamp: Stamp, rules: Sequence[Rule],
+              ruleset: bytes | None = None) -> None:
+        key = os.path.join(root, rel_path)
+        self.db.execute("DELETE FROM verdicts WHERE path = ?", (key,))
+        self.db.execute(
+            "INSERT OR REPLACE INTO files (path, mtime_ns, size, digest, bits, used) VALUES (?, ?, ?, ?, ?, ?)",
+            (key, stamp.mtime_ns, stamp.size, stamp.digest, zlib.compress(stamp.bits), self._now),
+        )
+        fire = can_fire(stamp.bits, rel_path, rules)
+        self._store_verdict(key, ruleset or ruleset_key(rules), stamp.digest, fire)
+
+    def _store_verdict(self, key: str, ruleset: bytes, digest: bytes, fire: bool) -> None:
+        self.db.execute(
+            "INSERT OR REPLACE INTO verdicts (path, ruleset, digest, may_fire) VALUES (?, ?, ?, ?)",
+            (key, ruleset, digest, int(fire)),
+        )
+
+    def evict(self) -> None:
+        """Drop entries unused for ``max_age`` seconds, then the least recently used until under ``max_bytes``."""
+        self.db.execute("DELETE FROM files WHERE used < ?", (self._now - self.max_age,))
+        total = self.db.execute("SELECT COALESCE(SUM(LENGTH(bits)), 0) FROM files").fetchone()[0]
+        if total > self.max_bytes:
+            for path, size in self.db.execute("SELECT path, LENGTH(bits) FROM files ORDER BY used").fetchall():
+                if total <= self.max_bytes:
+                    break
+                self.db.execute("DELETE FROM files WHERE path = ?", (path,))
+                total -= size
+        self.db.execute("DELETE FROM verdicts WHERE path NOT IN (SELECT path FROM files)")
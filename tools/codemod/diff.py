@@ -0,0 +1,38 @@
+"""Unified diffs for dry runs, produced one file at a time."""
+
+from __future__ import annotations
+
+import difflib
+from typing import Iterator
+
+
+def iter_unified_diff(rel_path: str, old: str, new: str, context: int = 3) -> Iterator[str]:
+    """Yield ``git diff``-style lines for one file, ``a/`` and ``b/`` prefixed."""
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    for line in difflib.unified_diff(old_lines, new_lines, f"a/{rel_path}", f"b/{rel_path}", n=context):
+        if line.endswith("\n"):
+            yield line
+        else:
+            yield line + "\n"
+            yield "\\ No newline at end of file\n"
+
+
+def unified_diff(rel_path: str, old: str, new: str, context: int = 3) -> str:
+    return "".join(iter_unified_diff(rel_path, old, new, context))
+
+
+def diff_stats(diff: str) -> tuple[int, int]:
+    """``(bytes_added, bytes_removed)`` counted over the +/- lines of a unified diff."""
+    added = removed = 0
+    in_hunk = False
+    for line in diff.splitlines(keepends=True):
+        if line.startswith("@@"):
+            in_hunk = True
+        elif not in_hunk:
+            continue  # ---/+++ file headers
+        elif line.startswith("+"):
+            added += len(line.encode("utf-8")) - 1
+        elif line.startswith("-"):
+            removed += len(line.encode("utf-8")) - 1
+    return added, removed
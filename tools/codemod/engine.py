@@ -0,0 +1,271 @@
+"""Apply a list of rules to every matching file under a root, one file per task."""
+
+from __future__ import annotations
+
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Sequence, TextIO
+
+from tools.fs import REPO_ROOT, iter_files
+
+from .cache import CodemodCache, Stamp, rewrite_key, ruleset_key, stamp_bytes
+from .diff import diff_stats, unified_diff
+from .literal import LiteralReplacer
+from .rules import Rule
+from .writer import Transaction, digest, write_temp
+
+DEFAULT_ROOT = REPO_ROOT / "src"
+
+_worker_rules: Sequence[Rule] = ()
+_worker_root = ""
+_worker_write = True
+_worker_stamp = False
+_worker_applied: dict[str, str] = {}
+_worker_diff = False
+
+
+@dataclass
+class FileResult:
+    path: str
+    hits: dict[str, int]
+    changed: bool
+    error: str | None = None
+    stamp: Stamp | None = None
+    staged: str | None = None  # temp file holding the new content, swapped in on commit
+    digest: str | None = None
+    already_applied: bool = False
+    diff: str | None = None
+    bytes_added: int = 0
+    bytes_removed: int = 0
+
+
+@dataclass
+class Report:
+    files_scanned: int = 0
+    files_skipped: int = 0
+    files_already_applied: int = 0
+    bytes_added: int = 0
+    bytes_removed: int = 0
+    files_changed: list[str] = field(default_factory=list)
+    hits: Counter = field(default_factory=Counter)
+    files_per_rule: Counter = field(default_factory=Counter)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    def add(self, result: FileResult) -> None:
+        self.files_scanned += 1
+        if result.error:
+            self.errors[result.path] = result.error
+            return
+        if result.already_applied:
+            self.files_already_applied += 1
+        for rule_id, n in result.hits.items():
+            self.hits[rule_id] += n
+            self.files_per_rule[rule_id] += 1
+        if result.changed:
+            self.files_changed.append(result.path)
+        self.bytes_added += result.bytes_added
+        self.bytes_removed += result.bytes_removed
+
+    def unmatched(self, rules: Sequence[Rule]) -> list[str]:
+        return [rule.id for rule in rules if not self.hits[rule.id]]
+
+    def summary(self, rules: Sequence[Rule]) -> str:
+        lines = [f"{self.files_scanned} files scanned, {len(self.files_changed)} changed"]
+        if self.files_skipped:
+            lines[0] += f", {self.files_skipped} skipped via cache"
+        if self.files_already_applied:
+            lines[0] += f", {self.files_already_applied} already applied"
+        if self.bytes_added or self.bytes_removed:
+            lines[0] += f" (+{self.bytes_added}/-{self.bytes_removed} bytes)"
+        for rule in rules:
+            n = self.hits[rule.id]
+            note = "" if n else "  <- NO MATCH"
+            lines.append(f"  {rule.id}: {n} hits in {self.files_per_rule[rule.id]} files{note}")
+        for path, err in sorted(self.errors.items()):
+            lines.append(f"  ERROR {path}: {err}")
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class _LiteralStage:
+    rules: tuple[Rule, ...]
+    replacer: LiteralReplacer
+
+
+@lru_cache(maxsize=32)
+def compile_stages(rules: tuple[Rule, ...]) -> tuple[Rule | _LiteralStage, ...]:
+    """Fold each run of consecutive literal rules into one Aho–Corasick stage.
+
+    Regex rules stay in place, so rule order still decides what a regex sees.
+    """
+    stages: list[Rule | _LiteralStage] = []
+    run_: list[Rule] = []
+
+    def flush() -> None:
+        if run_:
+            pairs = [(r.pattern, r.replacement) for r in run_]
+            stages.append(_LiteralStage(tuple(run_), LiteralReplacer(pairs, [r.count for r in run_])))
+        run_.clear()
+
+    for rule in rules:
+        if rule.regex:
+            flush()
+            stages.append(rule)
+        else:
+            run_.append(rule)
+    flush()
+    return tuple(stages)
+
+
+def apply_rules(text: str, rules: Sequence[Rule], rel_path: str) -> tuple[str, dict[str, int]]:
+    hits: dict[str, int] = {}
+    for stage in compile_stages(tuple(rules)):
+        if isinstance(stage, _LiteralStage):
+            allowed = [r.applies_to(rel_path) for r in stage.rules]
+            if not any(allowed):
+                continue
+            text, counts = stage.replacer.replace(text, allowed)
+            for rule, n in zip(stage.rules, counts):
+                if n:
+                    hits[rule.id] = n
+        elif stage.applies_to(rel_path):
+            text, n = stage.apply(text)
+            if n:
+                hits[stage.id] = n
+    return text, hits
+
+
+def process_file(root: str, rel_path: str, rules: Sequence[Rule], write: bool = True,
+                 stamp: bool = False, applied: dict[str, str] | None = None,
+                 diff: bool = False) -> FileResult:
+    """Apply ``rules`` to one file.
+
+    New content is staged in a temp file next to the target rather than
+    written in place; the caller's Transaction swaps it in. ``applied`` maps
+    absolute paths to the digest this rule set left there last time, so a
+    file still in that state is not rewritten again. With ``stamp`` the
+    result also carries the cache fingerprint of the content it leaves.
+    With ``diff`` it carries the file's unified diff.
+    """
+    path = os.path.join(root, rel_path)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        if applied and applied.get(os.path.abspath(path)) == digest(data):
+            result = FileResult(rel_path, {}, False, already_applied=True)
+            if stamp:
+                result.stamp = stamp_bytes(data, os.stat(path))
+            return result
+        # Decoding bytes directly keeps CRLF files CRLF on write-back
+        original = data.decode("utf-8")
+        text, hits = apply_rules(original, rules, rel_path)
+        result = FileResult(rel_path, hits, text != original)
+        if diff and result.changed:
+            result.diff = unified_diff(rel_path, original, text)
+            result.bytes_added, result.bytes_removed = diff_stats(result.diff)
+        stat_path = path
+        if result.changed and write:
+            data = text.encode("utf-8")
+            result.staged = stat_path = write_temp(path, data)
+            result.digest = digest(data)
+        if stamp and (write or not result.changed):
+            # os.replace keeps the temp file's mtime and size, so stat it now
+            result.stamp = stamp_bytes(data, os.stat(stat_path))
+    except (OSError, UnicodeDecodeError) as e:
+        return FileResult(rel_path, {}, False, error=str(e))
+    return result
+
+
+def _init_worker(rules: Sequence[Rule], root: str, write: bool, stamp: bool, applied: dict[str, str],
+                 diff: bool) -> None:
+    global _worker_rules, _worker_root, _worker_write, _worker_stamp, _worker_applied, _worker_diff
+    _worker_rules, _worker_root, _worker_write, _worker_stamp = rules, root, write, stamp
+    _worker_applied, _worker_diff = applied, diff
+
+
+def _work(rel_path: str) -> FileResult:
+    return process_file(
+        _worker_root, rel_path, _worker_rules, _worker_write, _worker_stamp, _worker_applied, _worker_diff
+    )
+
+
+def candidate_files(root: str | Path, rules: Sequence[Rule]) -> list[str]:
+    include = {pat for rule in rules for pat in rule.include}
+    return [p for p in iter_files(root, include) if any(r.applies_to(p) for r in rules)]
+
+
+def run(
+    rules: Sequence[Rule],
+    root: str | Path = DEFAULT_ROOT,
+    *,
+    write: bool = True,
+    jobs: int | None = None,
+    files: Sequence[str] | None = None,
+    cache: CodemodCache | None = None,
+    txn: Transaction | None = None,
+    diff_out: TextIO | None = None,
+) -> Report:
+    """Apply ``rules`` to every file under ``root`` that at least one rule includes.
+
+    All writes of the run go through one Transaction (named after the rule
+    set unless ``txn`` is given): nothing changes on disk until every file
+    has been processed, and an error or Ctrl-C leaves the tree untouched.
+    With a ``cache``, files whose cached content proves no rule can fire are
+    skipped without being read. With ``diff_out`` each file's unified diff
+    is written to that stream as soon as the file is done (typically with
+    ``write=False`` for a dry run). ``jobs=1`` runs in-process, which is
+    handy for debugging a rule.
+    """
+    root = str(root)
+    if files is None:
+        files = candidate_files(root, rules)
+    report = Report()
+    ruleset = ruleset_key(rules)
+    if cache is not None:
+        todo = [p for p in files if cache.may_fire(root, p, rules, ruleset)]
+        report.files_skipped = len(files) - len(todo)
+        files = todo
+    stamp = cache is not None
+    own_txn = txn is None
+    if own_txn:
+        txn = Transaction(f"ruleset:{rewrite_key(rules).hex()}")
+    applied = txn.applied_digests()
+    stamps: list[FileResult] = []
+    diff = diff_out is not None
+
+    def collect(result: FileResult) -> None:
+        report.add(result)
+        if result.staged is not None:
+            txn.stage(os.path.join(root, result.path), result.staged, result.digest)
+        if result.stamp is not None:
+            stamps.append(result)
+        if result.diff:
+            diff_out.write(result.diff)
+            diff_out.flush()
+
+    try:
+        if jobs == 1 or len(files) < 2:
+            for rel_path in files:
+                collect(process_file(root, rel_path, rules, write, stamp, applied, diff))
+        else:
+            jobs = jobs or os.cpu_count() or 1
+            chunksize = max(1, len(files) // (jobs * 8))
+            initargs = (tuple(rules), root, write, stamp, applied, diff)
+            with Pool(jobs, initializer=_init_worker, initargs=initargs) as pool:
+                for result in pool.imap_unordered(_work, files, chunksize=chunksize):
+                    collect(result)
+    except BaseException:
+        txn.rollback()
+        raise
+    if own_txn:
+        txn.commit()
+    if cache is not None:
+        # Only record fingerprints once the content they describe is on disk
+        for result in stamps:
+            cache.store(root, result.path, result.stamp, rules, ruleset)
+    report.files_changed.sort()
+    return report
@@ -0,0 +1,279 @@
+"""Streaming line filters: drop every line a predicate selects.
+
+Files are read line by line and the kept lines streamed into a temp file,
+so memory stays constant whatever the file size. Predicates compose with
+``&``, ``|`` and ``~``:
+
+    drop = contains_all("ÖTV %", "th") & inside_element("thead")
+    filter_tree(drop, include=("*.tsx",))
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Callable, Iterable, Sequence, TextIO
+
+from tools.fs import iter_files
+
+from .diff import diff_stats
+from .engine import DEFAULT_ROOT, FileResult, Report
+from .writer import TempWriter, Transaction
+
+LineTest = Callable[[str], bool]
+
+
+class Predicate(ABC):
+    """Line predicate. ``bind()`` returns a fresh per-file test, so stateful predicates start clean."""
+
+    @abstractmethod
+    def bind(self) -> LineTest:
+        ...
+
+    def __and__(self, other: "Predicate") -> "Predicate":
+        return _All((self, other))
+
+    def __or__(self, other: "Predicate") -> "Predicate":
+        return _Any((self, other))
+
+    def __invert__(self) -> "Predicate":
+        return _Not(self)
+
+
+@dataclass(frozen=True)
+class _All(Predicate):
+    parts: tuple[Predicate, ...]
+
+    def bind(self) -> LineTest:
+        tests = [p.bind() for p in self.parts]
+        # Every part sees every line so stateful predicates keep tracking
+        return lambda line: all([t(line) for t in tests])
+
+
+@dataclass(frozen=True)
+class _Any(Predicate):
+    parts: tuple[Predicate, ...]
+
+    def bind(self) -> LineTest:
+        tests = [p.bind() for p in self.parts]
+        return lambda line: any([t(line) for t in tests])
+
+
+@dataclass(frozen=True)
+class _Not(Predicate):
+    part: Predicate
+
+    def bind(self) -> LineTest:
+        test = self.part.bind()
+        return lambda line: not test(line)
+
+
+@dataclass(frozen=True)
+class contains_all(Predicate):
+    needles: tuple[str, ...]
+
+    def __init__(self, *needles: str):
+        object.__setattr__(self, "needles", needles)
+
+    def bind(self) -> LineTest:
+        needles = self.needles
+        return lambda line: all(n in line for n in needles)
+
+
+@dataclass(frozen=True)
+class contains_any(Predicate):
+    needles: tuple[str, ...]
+
+    def __init__(self, *needles: str):
+        object.__setattr__(self, "needles", needles)
+
+    def bind(self) -> LineTest:
+        needles = self.needles
+        return lambda line: any(n in line for n in needles)
+
+
+@dataclass(frozen=True)
+class matches(Predicate):
+    pattern: str
+
+    def bind(self) -> LineTest:
+        search = re.compile(self.pattern).search
+        return lambda line: search(line) is not None
+
+
+@dataclass(frozen=True)
+class inside_element(Predicate):
+    """True for lines within ``<tag ...> ... </tag>``, including the opening and closing lines."""
+
+    tag: str
+
+    def bind(self) -> LineTest:
+        opening = re.compile(r"<" + re.escape(self.tag) + r"(?=[\s>/])[^>]*?(/?)>|<" + re.escape(self.tag) + r"\s*$")
+        closing = f"</{self.tag}>"
+        depth = 0
+
+        def test(line: str) -> bool:
+            nonlocal depth
+            inside = depth > 0
+            for m in opening.finditer(line):
+                if m.group(1) != "/":
+                    depth += 1
+                    inside = True
+            closes = line.count(closing)
+            if closes:
+                inside = True
+                depth = max(0, depth - closes)
+            return inside
+
+        return test
+
+
+@dataclass
+class FilterResult:
+    removed: int
+    staged: str | None
+    digest: str | None
+    diff: str | None
+
+
+def _zero_context_hunks(rel_path: str, removed: Iterable[tuple[int, str]]) -> Iterable[str]:
+    """Unified diff lines (no context) for a set of deleted ``(lineno, text)`` pairs."""
+    yield f"--- a/{rel_path}\n"
+    yield f"+++ b/{rel_path}\n"
+    run: list[tuple[int, str]] = []
+    shift = 0  # lines deleted before the current run
+
+    def flush():
+        first = run[0][0]
+        yield f"@@ -{first},{len(run)} +{first - shift - 1},0 @@\n"
+        for _, text in run:
+            yield "-" + (text if text.endswith("\n") else text + "\n\\ No newline at end of file\n")
+
+    for lineno, text in removed:
+        if run and lineno != run[-1][0] + 1:
+            yield from flush()
+            shift += len(run)
+            run = []
+        run.append((lineno, text))
+    if run:
+        yield from flush()
+
+
+def filter_file(path: str | os.PathLike, drop: Predicate, *, write: bool = True, diff: bool = False,
+                rel_path: str | None = None) -> FilterResult:
+    """Stream ``path`` into a temp file without the lines ``drop`` selects.
+
+    The temp file is returned for a Transaction to stage; it is discarded when
+    nothing was removed or ``write`` is false. With ``diff`` the result carries
+    a zero-context unified diff of the deletions.
+    """
+    test = drop.bind()
+    removed: list[tuple[int, str]] | None = [] if diff else None
+    count = 0
+    out = TempWriter(path) if write else None
+    with open(path, "r", encoding="utf-8", newline="") as src:
+        try:
+            for lineno, line in enumerate(src, 1):
+                if test(line):
+                    count += 1
+                    if removed is not None:
+                        removed.append((lineno, line))
+                elif out is not None:
+                    out.write(line.encode("utf-8"))
+        except BaseException:
+            if out is not None:
+                out.discard()
+            raise
+    staged = digest = None
+    if out is not None:
+        if count:
+            out.close()
+            staged, digest = out.name, out.hexdigest()
+        else:
+            out.discard()
+    patch = None
+    if removed:
+        patch = "".join(_zero_context_hunks(rel_path or os.fspath(path), removed))
+    return FilterResult(count, staged, digest, patch)
+
+
+_worker_drop: Predicate | None = None
+_worker_root = ""
+_worker_write = True
+_worker_diff = False
+
+
+def _init_worker(drop: Predicate, root: str, write: bool, diff: bool) -> None:
+    global _worker_drop, _worker_root, _worker_write, _worker_diff
+    _worker_drop, _worker_root, _worker_write, _worker_diff = drop, root, write, diff
+
+
+def _filter_one(rel_path: str, drop: Predicate, root: str, write: bool, diff: bool) -> FileResult:
+    try:
+        res = filter_file(os.path.join(root, rel_path), drop, write=write, diff=diff, rel_path=rel_path)
+    except (OSError, UnicodeDecodeError) as e:
+        return FileResult(rel_path, {}, False, error=str(e))
+    result = FileResult(rel_path, {"drop": res.removed} if res.removed else {}, bool(res.removed),
+                        staged=res.staged, digest=res.digest, diff=res.diff)
+    if res.diff:
+        result.bytes_removed = diff_stats(res.diff)[1]
+    return result
+
+
+def _work(rel_path: str) -> FileResult:
+    return _filter_one(rel_path, _worker_drop, _worker_root, _worker_write, _worker_diff)
+
+
+def filter_tree(
+    drop: Predicate,
+    root: str | Path = DEFAULT_ROOT,
+    include: Sequence[str] = ("*.ts", "*.tsx"),
+    *,
+    write: bool = True,
+    jobs: int | None = None,
+    files: Sequence[str] | None = None,
+    txn: Transaction | None = None,
+    diff_out: TextIO | None = None,
+) -> Report:
+    """Drop matching lines from every included file under ``root`` as one transaction.
+
+    Line counts are reported under the rule id ``"drop"``.
+    """
+    root = str(root)
+    if files is None:
+        files = list(iter_files(root, include))
+    report = Report()
+    own_txn = txn is None
+    if own_txn:
+        txn = Transaction(f"filter:{drop!r}")
+    diff = diff_out is not None
+
+    def collect(result: FileResult) -> None:
+        report.add(result)
+        if result.staged is not None:
+            txn.stage(os.path.join(root, result.path), result.staged, result.digest)
+        if result.diff:
+            diff_out.write(result.diff)
+            diff_out.flush()
+
+    try:
+        if jobs == 1 or len(files) < 2:
+            for rel_path in files:
+                collect(_filter_one(rel_path, drop, root, write, diff))
+        else:
+            jobs = jobs or os.cpu_count() or 1
+            chunksize = max(1, len(files) // (jobs * 8))
+            with Pool(jobs, initializer=_init_worker, initargs=(drop, root, write, diff)) as pool:
+                for result in pool.imap_unordered(_work, files, chunksize=chunksize):
+                    collect(result)
+    except BaseException:
+        txn.rollback()
+        raise
+    if own_txn:
+        txn.commit()
+    report.files_changed.sort()
+    return report
@@ -0,0 +1,278 @@
+"""Tokenized index of the TSX tree, stored as one memory-mapped file.
+
+Records the offsets of component definitions, JSX element openings and
+closings, ``{/* marker */}`` comments and ``useState`` declarations, so a
+rewrite rule can jump straight to the code it targets:
+
+    index = build_index()          # incremental: reparses changed files only
+    for hit in index.lookup(MARKER, "OTP COMPLIANCE MODAL"):
+        print(hit.path, hit.line, hit.offset)
+
+    python -m tools.codemod.index [--root src] [query-kind name]
+
+File layout (little-endian): a header, a sorted string table, a file table
+(path id, mtime_ns, size) and fixed-width entries sorted by
+(kind, name id, file id, offset) so lookups are two binary searches.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import struct
+import sys
+from bisect import bisect_left
+from dataclasses import dataclass
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from tools.fs import REPO_ROOT, iter_files
+
+from .writer import atomic_write
+
+DEFAULT_PATH = REPO_ROOT / ".cache" / "tsx-index.bin"
+DEFAULT_ROOT = REPO_ROOT / "src"
+
+COMPONENT, JSX_OPEN, JSX_CLOSE, MARKER, USE_STATE = range(5)
+KIND_NAMES = {"component": COMPONENT, "open": JSX_OPEN, "close": JSX_CLOSE, "marker": MARKER, "state": USE_STATE}
+
+_MAGIC = b"TSXI"
+_VERSION = 1
+_HEADER = struct.Struct("<4sIIIIQQQ")
+_FILE = struct.Struct("<IqQ")
+_ENTRY = struct.Struct("<BxxxIIII")
+_U32 = struct.Struct("<I")
+
+_PATTERNS = [
+    (COMPONENT, re.compile(
+        r"^[ \t]*(?:export[ \t]+)?(?:default[ \t]+)?(?:async[ \t]+)?function[ \t]+([A-Z]\w*)"
+        r"|^[ \t]*(?:export[ \t]+)?const[ \t]+([A-Z]\w*)[ \t]*(?::[^=\n]+)?=[ \t]*"
+        r"(?:React\.)?(?:memo|forwardRef|\(|async[ \t]*\(|function\b)"
+        r"|^[ \t]*(?:export[ \t]+)?(?:default[ \t]+)?class[ \t]+([A-Z]\w*)[ \t]+extends\b",
+        re.MULTILINE,
+    )),
+    (JSX_OPEN, re.compile(r"(?<![\w$.)\]])<([A-Za-z][\w.]*)(?=[\s/>])")),
+    (JSX_CLOSE, re.compile(r"</([A-Za-z][\w.]*)\s*>")),
+    (MARKER, re.compile(r"\{/\*\s*(.*?)\s*\*/\}")),
+    (USE_STATE, re.compile(r"\bconst\s*\[\s*(\w+)\s*(?:,\s*\w+\s*)?\]\s*=\s*(?:React\.)?useState\b")),
+]
+
+
+@dataclass(frozen=True)
+class Hit:
+    path: str
+    offset: int  # character offset into the decoded file
+    line: int  # 1-based
+
+
+def tokenize(text: str) -> list[tuple[int, str, int, int]]:
+    """Return ``(kind, name, offset, line)`` for every indexed construct in ``text``."""
+    newlines = [m.start() for m in re.finditer("\n", text)]
+    out = []
+    for kind, pattern in _PATTERNS:
+        for m in pattern.finditer(text):
+            # Components point at their name; everything else at the construct itself
+            start = m.start(m.lastindex) if kind == COMPONENT else m.start()
+            out.append((kind, m.group(m.lastindex), start, bisect_left(newlines, start) + 1))
+    return out
+
+
+def _tokenize_file(args: tuple[str, str]) -> tuple[str, int, int, list[tuple[int, str, int, int]] | None]:
+    """``(rel, mtime_ns, size, tokens)``; tokens are None for a file that went away since it was listed.
+
+    Undecodable files get no tokens but are still recorded, so they are not
+    parsed again until they change.
+    """
+    root, rel = args
+    path = os.path.join(root, rel)
+    try:
+        st = os.stat(path)
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            tokens = tokenize(f.read())
+    except UnicodeDecodeError:
+        tokens = []
+    except OSError:
+        return rel, 0, 0, None
+    return rel, st.st_mtime_ns, st.st_size, tokens
+
+
+class _Column(Sequence):
+    """Read-only sequence view over fixed-width records, for bisect."""
+
+    def __init__(self, n: int, get):
+        self._n, self._get = n, get
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, i):
+        return self._get(i)
+
+
+class TsxIndex:
+    def __init__(self, path: str | Path = DEFAULT_PATH):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.n_strings, self.n_files, self.n_entries, s_off, f_off, e_off = (
+            _HEADER.unpack_from(self._mm, 0)
+        )
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{self.path} is not a v{_VERSION} TSX index")
+        self._str_table = s_off
+        self._str_blob = s_off + (self.n_strings + 1) * _U32.size
+        self._files = f_off
+        self._entries = e_off
+        self._strings = _Column(self.n_strings, self.string)
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def __enter__(self) -> "TsxIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def string(self, i: int) -> str:
+        lo = _U32.unpack_from(self._mm, self._str_table + i * 4)[0]
+        hi = _U32.unpack_from(self._mm, self._str_table + (i + 1) * 4)[0]
+        return self._mm[self._str_blob + lo:self._str_blob + hi].decode("utf-8")
+
+    def string_id(self, s: str) -> int | None:
+        i = bisect_left(self._strings, s)
+        return i if i < self.n_strings and self.string(i) == s else None
+
+    def file(self, i: int) -> tuple[str, int, int]:
+        path_id, mtime_ns, size = _FILE.unpack_from(self._mm, self._files + i * _FILE.size)
+        return self.string(path_id), mtime_ns, size
+
+    def files(self) -> list[tuple[str, int, int]]:
+        return [self.file(i) for i in range(self.n_files)]
+
+    def entry(self, i: int) -> tuple[int, int, int, int, int]:
+        return _ENTRY.unpack_from(self._mm, self._entries + i * _ENTRY.size)
+
+    def lookup(self, kind: int, name: str) -> list[Hit]:
+        name_id = self.string_id(name)
+        if name_id is None:
+            return []
+        keys = _Column(self.n_entries, lambda i: self.entry(i)[:2])
+        i = bisect_left(keys, (kind, name_id))
+        hits = []
+        while i < self.n_entries:
+            k, n, file_id, offset, line = self.entry(i)
+            if (k, n) != (kind, name_id):
+                break
+            hits.append(Hit(self.file(file_id)[0], offset, line))
+            i += 1
+        return hits
+
+    def tokens_by_file(self) -> dict[str, list[tuple[int, str, int, int]]]:
+        """Decode every entry back to per-file token lists (used for incremental rebuilds)."""
+        paths = [self.file(i)[0] for i in range(self.n_files)]
+        out: dict[str, list] = {p: [] for p in paths}
+        names: dict[int, str] = {}
+        for i in range(self.n_entries):
+            kind, name_id, file_id, offset, line = self.entry(i)
+            name = names.get(name_id)
+            if name is None:
+                name = names[name_id] = self.string(name_id)
+            out[paths[file_id]].append((kind, name, offset, line))
+        return out
+
+
+def write_index(path: str | Path, files: dict[str, tuple[int, int, list[tuple[int, str, int, int]]]]) -> None:
+    """Serialise ``{rel_path: (mtime_ns, size, tokens)}``."""
+    strings = sorted({rel for rel in files} | {tok[1] for _, _, toks in files.values() for tok in toks})
+    sid = {s: i for i, s in enumerate(strings)}
+    blobs = [s.encode("utf-8") for s in strings]
+    str_table = bytearray()
+    pos = 0
+    for b in blobs:
+        str_table += _U32.pack(pos)
+        pos += len(b)
+    str_table += _U32.pack(pos)
+    str_section = bytes(str_table) + b"".join(blobs)
+
+    rels = sorted(files)
+    fid = {rel: i for i, rel in enumerate(rels)}
+    file_section = b"".join(_FILE.pack(sid[rel], files[rel][0], files[rel][1]) for rel in rels)
+    entries = sorted(
+        (kind, sid[name], fid[rel], offset, line)
+        for rel in rels
+        for kind, name, offset, line in files[rel][2]
+    )
+    entry_section = b"".join(_ENTRY.pack(*e) for e in entries)
+
+    s_off = _HEADER.size
+    f_off = s_off + len(str_section)
+    e_off = f_off + len(file_section)
+    header = _HEADER.pack(_MAGIC, _VERSION, len(strings), len(rels), len(entries), s_off, f_off, e_off)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(path, header + str_section + file_section + entry_section)
+
+
+def build_index(root: str | Path = DEFAULT_ROOT, path: str | Path = DEFAULT_PATH,
+                include: Iterable[str] = ("*.tsx", "*.ts"), jobs: int | None = None) -> TsxIndex:
+    """(Re)build the index at ``path``, reparsing only files whose mtime or size changed."""
+    root = str(root)
+    previous: dict[str, tuple[int, int]] = {}
+    old_tokens: dict[str, list] = {}
+    try:
+        with TsxIndex(path) as old:
+            previous = {rel: (mtime, size) for rel, mtime, size in old.files()}
+            old_tokens = old.tokens_by_file()
+    except (FileNotFoundError, ValueError):
+        pass
+
+    files: dict[str, tuple[int, int, list]] = {}
+    stale: list[str] = []
+    for rel in iter_files(root, include):
+        try:
+            st = os.stat(os.path.join(root, rel))
+        except OSError:
+            continue  # removed since it was listed
+        if previous.get(rel) == (st.st_mtime_ns, st.st_size):
+            files[rel] = (st.st_mtime_ns, st.st_size, old_tokens[rel])
+        else:
+            stale.append(rel)
+
+    if stale or len(files) != len(previous):
+        tasks = [(root, rel) for rel in stale]
+        if jobs == 1 or len(tasks) < 2:
+            parsed = [_tokenize_file(t) for t in tasks]
+        else:
+            with Pool(jobs or os.cpu_count() or 1) as pool:
+                parsed = pool.map(_tokenize_file, tasks, chunksize=max(1, len(tasks) // 64))
+        for rel, mtime_ns, size, tokens in parsed:
+            if tokens is not None:
+                files[rel] = (mtime_ns, size, tokens)
+        write_index(path, files)
+    return TsxIndex(path)
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m tools.codemod.index")
+    parser.add_argument("--root", default=str(DEFAULT_ROOT))
+    parser.add_argument("--index", default=str(DEFAULT_PATH))
+    parser.add_argument("kind", nargs="?", choices=sorted(KIND_NAMES))
+    parser.add_argument("name", nargs="?")
+    args = parser.parse_args(argv)
+
+    with build_index(args.root, args.index) as index:
+        if args.kind is None:
+            print(f"{index.n_files} files, {index.n_entries} entries, {index.n_strings} strings")
+            return 0
+        hits = index.lookup(KIND_NAMES[args.kind], args.name or "")
+        for hit in hits:
+            print(f"{hit.path}:{hit.line}\t@{hit.offset}")
+        return 0 if hits else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""Linear-time locator for JSX expression blocks such as ``{open && ( ... )}``.
+
+The scanner understands strings, template literals, comments, regex literals
+and JSX tags/children well enough to find the bracket that really closes a
+block, so apostrophes in JSX text or ``)}`` inside a nested element do not
+end it early.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+_CLOSERS = {"{": "}", "(": ")", "[": "]"}
+_NAME_CHARS = re.compile(r"[A-Za-z0-9_$.:\-]*")
+# Characters after which "<" starts JSX and "/" starts a regex literal
+_EXPR_START = set("(,=?:&|{[!;>}")
+_EXPR_KEYWORDS = {"return", "yield", "case", "default", "typeof", "void", "in", "of", "await"}
+
+_JS, _TEMPLATE, _TAG, _CHILDREN = range(4)
+
+# Next character that can change state, per mode; everything between is skipped
+_NEXT_IN_TEMPLATE = re.compile(r"[\\`$]")
+_NEXT_IN_TAG = re.compile(r"[\"'{/>]")
+_NEXT_IN_CHILDREN = re.compile(r"[{<]")
+_WHITESPACE = re.compile(r"[ \t\r\n]+")
+
+
+class JSXScanError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Block:
+    start: int  # offset of the marker comment, or of "{" without a marker
+    end: int  # offset just past the closing "}"
+    expr_start: int  # offset of the block's "{"
+
+
+def _skip_string(text: str, i: int) -> int:
+    quote = text[i]
+    i += 1
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == quote:
+            return i + 1
+        if c == "\n":
+            break
+        i += 1
+    raise JSXScanError(f"unterminated string at offset {i}")
+
+
+def _skip_regex(text: str, i: int) -> int:
+    i += 1
+    in_class = False
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == "\n":
+            break
+        if c == "[":
+            in_class = True
+        elif c == "]":
+            in_class = False
+        elif c == "/" and not in_class:
+            return i + 1
+        i += 1
+    raise JSXScanError(f"unterminated regex literal at offset {i}")
+
+
+def match_close(text: str, pos: int) -> int:
+    """Return the offset just past the bracket that closes ``text[pos]``."""
+    if text[pos] not in _CLOSERS:
+        raise JSXScanError(f"no opening bracket at offset {pos}")
+    # Frames: (_JS, closer) | (_TEMPLATE, None) | (_TAG, name) | (_CHILDREN, name)
+    stack: list[tuple[int, str | None]] = [(_JS, _CLOSERS[text[pos]])]
+    prev = "("  # last significant JS character, "a" for identifiers/values
+    word = ""
+    i, n = pos + 1, len(text)
+    while i < n:
+        kind, arg = stack[-1]
+        c = text[i]
+
+        if kind == _JS:
+            if c in " \t\r\n":
+                i = _WHITESPACE.match(text, i).end()
+                continue
+            if c == "/" and text.startswith("//", i):
+                nl = text.find("\n", i)
+                i = n if nl == -1 else nl + 1
+                continue
+            if c == "/" and text.startswith("/*", i):
+                end = text.find("*/", i + 2)
+                if end == -1:
+                    raise JSXScanError(f"unterminated comment at offset {i}")
+                i = end + 2
+                continue
+            if c in "\"'":
+                i = _skip_string(text, i)
+                prev = "a"
+            elif c == "`":
+                stack.append((_TEMPLATE, None))
+                i += 1
+            elif c in _CLOSERS:
+                stack.append((_JS, _CLOSERS[c]))
+                prev = c
+                i += 1
+            elif c in ")}]":
+                if c != arg:
+                    raise JSXScanError(f"unbalanced {c!r} at offset {i}")
+                stack.pop()
+                i += 1
+                if not stack:
+                    return i
+                prev = "a"
+            elif c == "<" and (prev in _EXPR_START or word in _EXPR_KEYWORDS) and (
+                i + 1 < n and (text[i + 1].isalpha() or text[i + 1] == ">")
+            ):
+                name = _NAME_CHARS.match(text, i + 1).group()
+                stack.append((_TAG, name))
+                i += 1 + len(name)
+            elif c == "/" and (prev in _EXPR_START or word in _EXPR_KEYWORDS):
+                i = _skip_regex(text, i)
+                prev = "a"
+            elif c.isalnum() or c in "_$":
+                m = _NAME_CHARS.match(text, i)
+                word = m.group()
+                i = m.end()
+                prev = "a"
+                continue
+            else:
+                prev = c
+                i += 1
+            word = ""
+
+        elif kind == _TEMPLATE:
+            if c == "\\":
+                i += 2
+            elif c == "`":
+                stack.pop()
+                prev = "a"
+                i += 1
+            elif text.startswith("${", i):
+                stack.append((_JS, "}"))
+                prev = "("
+                i += 2
+            else:
+                m = _NEXT_IN_TEMPLATE.search(text, i + 1)
+                i = m.start() if m else n
+
+        elif kind == _TAG:
+            if c in "\"'":
+                i = _skip_string(text, i)
+            elif c == "{":
+                stack.append((_JS, "}"))
+                prev = "("
+                i += 1
+            elif text.startswith("/>", i):
+                stack.pop()
+                prev = "a"
+                i += 2
+            elif c == ">":
+                stack[-1] = (_CHILDREN, arg)
+                i += 1
+            else:
+                m = _NEXT_IN_TAG.search(text, i + 1)
+                i = m.start() if m else n
+
+        else:  # _CHILDREN: JSX text, nested elements and {expressions}
+            if c == "{":
+                stack.append((_JS, "}"))
+                prev = "("
+                i += 1
+            elif text.startswith("</", i):
+                end = text.find(">", i)
+                if end == -1:
+                    raise JSXScanError(f"unterminated closing tag at offset {i}")
+                closing = text[i + 2:end].strip()
+                if closing != arg:
+                    raise JSXScanError(f"</{closing}> closes <{arg}> at offset {i}")
+                stack.pop()
+                prev = "a"
+                i = end + 1
+            elif c == "<" and i + 1 < n and (text[i + 1].isalpha() or text[i + 1] == ">"):
+                name = _NAME_CHARS.match(text, i + 1).group()
+                stack.append((_TAG, name))
+                i += 1 + len(name)
+            else:
+                m = _NEXT_IN_CHILDREN.search(text, i + 1)
+                i = m.start() if m else n
+    raise JSXScanError(f"bracket at offset {pos} is never closed")
+
+
+def _marker_offset(text: str, marker: str) -> int:
+    needle = f"{{/* {marker} */}}"
+    first = text.find(needle)
+    if first == -1:
+        raise JSXScanError(f"marker {needle} not found")
+    if text.find(needle, first + 1) != -1:
+        raise JSXScanError(f"marker {needle} is ambiguous")
+    return first
+
+
+def find_conditional_block(text: str, cond: str, marker: str | None = None) -> Block:
+    """Locate ``{cond && ( ... )}``, optionally the first one after ``{/* marker */}``.
+
+    With a marker the block's span starts at the marker comment, matching what
+    the old ``MARKER(.*?)\\{cond && \\((.*?)\\)\\n\\s*\\}`` regexes replaced.
+    """
+    start = _marker_offset(text, marker) if marker is not None else 0
+    opener = re.compile(r"\{\s*" + re.escape(cond) + r"\s*&&\s*\(")
+    m = opener.search(text, start)
+    if m is None:
+        where = f" after marker {marker!r}" if marker else ""
+        raise JSXScanError(f"no {{{cond} && (...)}} block{where}")
+    if marker is None and opener.search(text, m.end()) is not None:
+        raise JSXScanError(f"{{{cond} && (...)}} is ambiguous; pass a marker")
+    end = match_close(text, m.start())
+    return Block(start if marker is not None else m.start(), end, m.start())
+
+
+def replace_conditional_block(text: str, cond: str, replacement: str, marker: str | None = None) -> str:
+    block = find_conditional_block(text, cond, marker)
+    return text[:block.start] + replacement + text[block.end:]
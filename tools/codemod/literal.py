@@ -0,0 +1,59 @@
+"""Single-pass replacement of many literal needles."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from tools.aho import Automaton
+
+
+class LiteralReplacer:
+    """Replace every ``(old, new)`` pair in one scan of the text.
+
+    All needles are matched against the original text, so one replacement's
+    output is never rescanned by another. ``limits[i]`` caps the number of
+    replacements of needle ``i`` (0 = unlimited).
+
+    When a replacement contains its own needle (an insertion anchored on
+    existing code), an occurrence already surrounded by the replacement is
+    left alone, so re-running the same edit does not insert twice.
+    """
+
+    def __init__(self, pairs: Sequence[tuple[str, str]], limits: Sequence[int] | None = None):
+        olds = [old for old, _ in pairs]
+        dupes = {o for o in olds if olds.count(o) > 1}
+        if dupes:
+            raise ValueError(f"duplicate needles: {sorted(dupes)[:3]}")
+        self.automaton = Automaton(olds)
+        self.replacements = [new for _, new in pairs]
+        self.limits = list(limits) if limits is not None else [0] * len(pairs)
+        self._anchor_at = [new.find(old) for old, new in pairs]
+
+    def replace(self, text: str, allowed: Sequence[bool] | None = None) -> tuple[str, list[int]]:
+        """Return ``(new_text, hits)`` where ``hits[i]`` counts replacements of needle ``i``."""
+        needles, limits, replacements = self.automaton.needles, self.limits, self.replacements
+        hits = [0] * len(needles)
+        parts: list[str] = []
+        pos = 0
+        for start, idx in self.automaton.leftmost_longest(text, allowed):
+            if limits[idx] and hits[idx] >= limits[idx]:
+                continue
+            k = self._anchor_at[idx]
+            if k >= 0 and start >= k and text.startswith(replacements[idx], start - k):
+                continue
+            parts.append(text[pos:start])
+            parts.append(replacements[idx])
+            pos = start + len(needles[idx])
+            hits[idx] += 1
+        if not parts:
+            return text, hits
+        parts.append(text[pos:])
+        return "".join(parts), hits
+
+    def missing(self, hits: Sequence[int], text: str) -> list[str]:
+        """Needles that never matched and whose replacement is not already in ``text``."""
+        return [
+            needle
+            for needle, new, h in zip(self.automaton.needles, self.replacements, hits)
+            if not h and (not new or new not in text)
+        ]
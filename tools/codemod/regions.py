@@ -0,0 +1,111 @@
+"""Anchor-based region splicing.
+
+Regions are located by marker comments (``{/* WIDGET GRID */}``) instead of
+hard-coded line numbers. A file is indexed once; any number of regions can
+then be resolved and swapped in a single pass over the text.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from typing import Sequence
+
+_MARKER_RE = re.compile(r"^[ \t]*\{/\*\s*(.*?)\s*\*/\}[ \t]*\r?$", re.MULTILINE)
+
+# Region end: the last line before the enclosing element's indentation resumes
+DEDENT = object()
+
+
+class AnchorError(ValueError):
+    pass
+
+
+class SourceIndex:
+    """Line offsets and marker-comment positions of one file."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.line_starts = [0]
+        pos = text.find("\n")
+        while pos != -1:
+            self.line_starts.append(pos + 1)
+            pos = text.find("\n", pos + 1)
+        self.markers: dict[str, list[int]] = {}
+        for m in _MARKER_RE.finditer(text):
+            self.markers.setdefault(m.group(1), []).append(self.line_of(m.start()))
+
+    def line_of(self, offset: int) -> int:
+        return bisect_right(self.line_starts, offset) - 1
+
+    def line_span(self, line: int) -> tuple[int, int]:
+        """Offsets of ``line`` including its newline."""
+        end = self.line_starts[line + 1] if line + 1 < len(self.line_starts) else len(self.text)
+        return self.line_starts[line], end
+
+    def indent(self, line: int) -> int | None:
+        """Indentation width, or None for a blank line."""
+        start, end = self.line_span(line)
+        body = self.text[start:end]
+        stripped = body.lstrip(" \t")
+        if not stripped.strip():
+            return None
+        return len(body) - len(stripped)
+
+    def marker_line(self, name: str) -> int:
+        lines = self.markers.get(name)
+        if not lines:
+            raise AnchorError(f"marker {{/* {name} */}} not found")
+        if len(lines) > 1:
+            raise AnchorError(f"marker {{/* {name} */}} is ambiguous (lines {[n + 1 for n in lines]})")
+        return lines[0]
+
+    def region(self, start: str, end: str | object = DEDENT) -> tuple[int, int]:
+        """Offsets of the lines from marker ``start`` up to ``end``.
+
+        ``end`` is either another marker (exclusive) or ``DEDENT``: the region
+        runs until a line is indented less than the start marker, i.e. until
+        the element that contains the marker closes.
+        """
+        first = self.marker_line(start)
+        if end is DEDENT:
+            base = self.indent(first)
+            last = first
+            for line in range(first + 1, len(self.line_starts)):
+                width = self.indent(line)
+                if width is None:
+                    continue
+                if width < base:
+                    break
+                last = line
+            else:
+                raise AnchorError(f"region {start!r} never closes")
+            return self.line_starts[first], self.line_span(last)[1]
+        stop = self.marker_line(end)
+        if stop <= first:
+            raise AnchorError(f"end marker {end!r} precedes start marker {start!r}")
+        return self.line_starts[first], self.line_starts[stop]
+
+
+def splice(text: str, edits: Sequence[tuple[int, int, str]]) -> str:
+    """Replace each ``(start, end, replacement)`` span of ``text`` in one join."""
+    edits = sorted(edits)
+    parts: list[str] = []
+    pos = 0
+    for start, end, replacement in edits:
+        if start < pos:
+            raise AnchorError(f"overlapping regions at offset {start}")
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def replace_region(text: str, start: str, replacement: str, end: str | object = DEDENT,
+                   index: SourceIndex | None = None) -> str:
+    index = index or SourceIndex(text)
+    lo, hi = index.region(start, end)
+    if replacement and not replacement.endswith("\n"):
+        replacement += "\n"
+    return splice(text, [(lo, hi, replacement)])
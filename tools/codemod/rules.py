@@ -0,0 +1,88 @@
+"""Declarative edit rules.
+
+A rule is the data form of one ``content.replace(...)`` / ``re.sub(...)`` call
+from the old one-off scripts (patch.py, rewrite_modals.py, ...), plus the
+file globs it applies to.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+
+DEFAULT_INCLUDE = ("*.ts", "*.tsx")
+
+_FLAG_NAMES = {
+    "DOTALL": re.DOTALL,
+    "MULTILINE": re.MULTILINE,
+    "IGNORECASE": re.IGNORECASE,
+    "VERBOSE": re.VERBOSE,
+}
+
+
+@dataclass(frozen=True)
+class Rule:
+    id: str
+    pattern: str
+    replacement: str = ""
+    regex: bool = False
+    flags: tuple[str, ...] = ()
+    include: tuple[str, ...] = DEFAULT_INCLUDE
+    exclude: tuple[str, ...] = ()
+    count: int = 0  # 0 replaces every occurrence, like str.replace / re.sub
+    _compiled: re.Pattern | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        unknown = [f for f in self.flags if f not in _FLAG_NAMES]
+        if unknown:
+            raise ValueError(f"rule {self.id!r}: unknown regex flags {unknown}")
+        if self.regex:
+            flags = 0
+            for name in self.flags:
+                flags |= _FLAG_NAMES[name]
+            object.__setattr__(self, "_compiled", re.compile(self.pattern, flags))
+
+    def applies_to(self, rel_path: str) -> bool:
+        """Match ``rel_path`` (posix, relative to the scan root) against include/exclude globs."""
+        if not any(fnmatch(rel_path, pat) for pat in self.include):
+            return False
+        return not any(fnmatch(rel_path, pat) for pat in self.exclude)
+
+    def apply(self, text: str) -> tuple[str, int]:
+        """Return ``(new_text, hits)``."""
+        if self._compiled is not None:
+            return self._compiled.subn(self.replacement, text, count=self.count)
+        hits = text.count(self.pattern)
+        if not hits:
+            return text, 0
+        if self.count:
+            hits = min(hits, self.count)
+            return text.replace(self.pattern, self.replacement, self.count), hits
+        return text.replace(self.pattern, self.replacement), hits
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Rule":
+        data = dict(data)
+        for key in ("flags", "include", "exclude"):
+            if key in data:
+                value = data[key]
+                data[key] = (value,) if isinstance(value, str) else tuple(value)
+        return cls(**data)
+
+
+def load_rules(path: str | Path) -> list[Rule]:
+    """Load a JSON rule file: a list of rule objects, or ``{"rules": [...]}``."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data["rules"]
+    rules = [Rule.from_dict(item) for item in data]
+    seen: set[str] = set()
+    for rule in rules:
+        if rule.id in seen:
+            raise ValueError(f"duplicate rule id {rule.id!r}")
+        seen.add(rule.id)
+    return rules
@@ -0,0 +1,122 @@
+"""Transactions, crash recovery and the ledger of ``tools.codemod.writer``.
+
+    python -m pytest tools/codemod        # or: python -m unittest tools.codemod.test_writer
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from . import writer
+from .writer import Transaction, digest, recover
+
+
+class WriterTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.state = self.root / "state"
+        self.a, self.b = self.root / "a.ts", self.root / "b.ts"
+        self.a.write_text("old a")
+        self.b.write_text("old b")
+
+    def leftovers(self):
+        """Temp files and backups left beside the targets."""
+        return sorted(p.name for p in self.root.iterdir()
+                      if p.name.startswith(".codemod-") or p.suffix == ".codemod-bak")
+
+    def test_commit(self):
+        new = self.root / "new.ts"
+        with Transaction("t", self.state) as txn:
+            txn.write(self.a, "new a")
+            txn.write(new, "created")
+            self.assertEqual(self.a.read_text(), "old a")  # nothing lands before the commit
+        self.assertEqual((self.a.read_text(), self.b.read_text(), new.read_text()), ("new a", "old b", "created"))
+        self.assertEqual(self.leftovers(), [])
+        self.assertFalse(txn.journal_path.exists())
+
+    def test_rollback(self):
+        new = self.root / "new.ts"
+        with self.assertRaises(KeyboardInterrupt):
+            with Transaction("t", self.state) as txn:
+                txn.write(self.a, "new a")
+                txn.write(new, "created")
+                raise KeyboardInterrupt
+        self.assertEqual(self.a.read_text(), "old a")
+        self.assertFalse(new.exists())
+        self.assertEqual(self.leftovers(), [])
+
+    def test_failed_swap_restores_every_target(self):
+        new = self.root / "0-new.ts"  # sorts first, so it is swapped before the failure
+        real = os.replace
+        calls = []
+
+        def flaky(src, dst):
+            calls.append(dst)
+            if len(calls) == 3:
+                raise OSError("disk full")
+            real(src, dst)
+
+        txn = Transaction("t", self.state)
+        for path in (new, self.a, self.b):
+            txn.write(path, f"new {path.name}")
+        with mock.patch.object(writer.os, "replace", flaky), self.assertRaises(OSError):
+            txn.commit()
+        self.assertEqual((self.a.read_text(), self.b.read_text()), ("old a", "old b"))
+        self.assertFalse(new.exists())
+        self.assertEqual(self.leftovers(), [])
+        self.assertFalse(txn.journal_path.exists())
+
+    def test_recover_after_crash_mid_swap(self):
+        # What a commit killed after swapping the new file and a.ts, but not b.ts, leaves behind
+        new = self.root / "0-new.ts"
+        journal = Transaction("t", self.state).journal_path
+        temp_b = writer.write_temp(self.b, b"new b")
+        os.link(self.a, str(self.a) + ".codemod-bak")
+        os.replace(writer.write_temp(self.a, b"new a"), self.a)
+        os.replace(writer.write_temp(new, b"created"), new)
+        journal.parent.mkdir(parents=True, exist_ok=True)
+        journal.write_text(json.dumps({
+            "targets": [str(new), str(self.a), str(self.b)], "temps": [temp_b],
+            "created": {str(new): digest(b"created")},
+        }))
+
+        Transaction("t", self.state)  # recovers on construction
+        self.assertEqual((self.a.read_text(), self.b.read_text()), ("old a", "old b"))
+        self.assertFalse(new.exists())
+        self.assertEqual(self.leftovers(), [])
+        self.assertFalse(journal.exists())
+        self.assertEqual(recover(journal), [])
+
+    def test_recover_keeps_created_file_changed_since(self):
+        new = self.root / "new.ts"
+        new.write_text("edited by hand")
+        journal = self.state / "journal.json"
+        journal.parent.mkdir(parents=True)
+        journal.write_text(json.dumps({"targets": [str(new)], "temps": [], "created": {str(new): digest(b"ours")}}))
+        self.assertEqual(recover(journal), [])
+        self.assertEqual(new.read_text(), "edited by hand")
+
+    def test_ledger(self):
+        with Transaction("t", self.state) as txn:
+            txn.write(self.a, "new a")
+        again = Transaction("t", self.state)
+        self.assertTrue(again.is_applied(self.a))
+        self.assertFalse(again.is_applied(self.b))
+        self.assertEqual(again.applied_digests(), {os.path.abspath(self.a): digest(b"new a")})
+        self.assertFalse(Transaction("other", self.state).is_applied(self.a))
+
+        with Transaction("other", self.state) as txn:
+            txn.write(self.b, "new b")
+        self.assertTrue(Transaction("t", self.state).is_applied(self.a))  # ledgers are per name
+
+        self.a.write_text("edited")
+        self.assertFalse(Transaction("t", self.state).is_applied(self.a))
+
+
+if __name__ == "__main__":
+    unittest.main()
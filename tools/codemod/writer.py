@@ -0,0 +1,290 @@
+"""Crash-safe, idempotent file writes for codemods.
+
+Every write goes to a fsynced temp file next to its target. A Transaction
+collects the temp files of a whole run and swaps them in together on
+commit; if anything fails (or the run is interrupted) all targets are
+restored. A journal makes an interrupted commit recoverable on the next
+run, and a ledger of post-write digests lets a repeated run recognise
+files it already rewrote. Each transaction name has its own ledger file,
+so codemods committing at the same time never overwrite each other's
+entries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import TextIO
+
+from tools.fs import REPO_ROOT
+
+from .diff import iter_unified_diff
+
+STATE_DIR = REPO_ROOT / ".cache"
+_BACKUP_SUFFIX = ".codemod-bak"
+
+
+def digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _fsync_dir(path: str) -> None:
+    if os.name != "posix":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class TempWriter:
+    """Stream bytes into a temp file beside ``path``; fsynced and given ``path``'s mode on close.
+
+        with TempWriter(path) as out:
+            for chunk in chunks:
+                out.write(chunk)
+        txn.stage(path, out.name, out.hexdigest())
+
+    On an exception the temp file is removed. ``discard()`` drops it explicitly.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.target = os.fspath(path)
+        fd, self.name = tempfile.mkstemp(prefix=".codemod-", suffix=".tmp", dir=os.path.dirname(self.target) or ".")
+        self._file = os.fdopen(fd, "wb")
+        self._hash = hashlib.sha256()
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+        self._hash.update(data)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def discard(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+        Path(self.name).unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Flush, fsync and close; the temp file is then ready to stage."""
+        if self._file.closed:
+            return
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            try:
+                os.chmod(self.name, os.stat(self.target).st_mode & 0o7777)
+            except FileNotFoundError:
+                pass
+        except BaseException:
+            self.discard()
+            raise
+
+    def __enter__(self) -> "TempWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.discard()
+        else:
+            self.close()
+
+
+def write_temp(path: str | os.PathLike, data: bytes) -> str:
+    """Write ``data`` to a fsynced temp file in ``path``'s directory and return its name."""
+    with TempWriter(path) as out:
+        out.write(data)
+    return out.name
+
+
+def atomic_write(path: str | os.PathLike, data: bytes | str) -> None:
+    """Replace ``path`` with ``data`` so readers see either the old or the new file, never a partial one."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    tmp = write_temp(path, data)
+    os.replace(tmp, path)
+    _fsync_dir(os.path.dirname(os.fspath(path)) or ".")
+
+
+def _load_json(path: Path, default):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+def _save_json(path: Path, data) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(path, json.dumps(data, indent=1, sort_keys=True))
+
+
+class Transaction:
+    """All-or-nothing batch of file replacements, recorded under ``name`` in the ledger.
+
+        with Transaction("patch.py") as txn:
+            if not txn.is_applied(path):
+                txn.write(path, new_text)
+
+    Leaving the block normally commits; an exception (including Ctrl-C)
+    rolls back and re-raises. With ``dry_run`` nothing is written: each
+    ``write`` streams a unified diff to ``diff_out`` instead.
+    """
+
+    def __init__(self, name: str, state_dir: str | Path = STATE_DIR, dry_run: bool = False,
+                 diff_out: TextIO | None = None):
+        self.name = name
+        self.dry_run = dry_run
+        self.diff_out = diff_out or sys.stdout
+        self.state_dir = Path(state_dir)
+        slug = hashlib.sha1(name.encode()).hexdigest()[:12]
+        self.ledger_path = self.state_dir / f"codemod-ledger-{slug}.json"
+        self.journal_path = self.state_dir / f"codemod-journal-{slug}.json"
+        self._staged: dict[str, tuple[str, str]] = {}  # target -> (temp file, digest)
+        recover(self.journal_path)
+
+    def __enter__(self) -> "Transaction":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    def _ledger(self) -> dict:
+        return _load_json(self.ledger_path, {})
+
+    def is_applied(self, path: str | os.PathLike) -> bool:
+        """True when ``path`` still has exactly the content this transaction name last wrote."""
+        recorded = self._ledger().get(os.path.abspath(path))
+        if recorded is None:
+            return False
+        try:
+            with open(path, "rb") as f:
+                return digest(f.read()) == recorded
+        except FileNotFoundError:
+            return False
+
+    def applied_digests(self) -> dict[str, str]:
+        return dict(self._ledger())
+
+    def write(self, path: str | os.PathLike, data: bytes | str) -> None:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if self.dry_run:
+            self._write_diff(path, data)
+            return
+        self.stage(path, write_temp(path, data), digest(data))
+
+    def _write_diff(self, path: str | os.PathLike, data: bytes) -> None:
+        try:
+            with open(path, "rb") as f:
+                old = f.read().decode("utf-8")
+        except FileNotFoundError:
+            old = ""
+        rel = os.path.relpath(path).replace(os.sep, "/")
+        for line in iter_unified_diff(rel, old, data.decode("utf-8")):
+            self.diff_out.write(line)
+        self.diff_out.flush()
+
+    def stage(self, path: str | os.PathLike, temp_path: str, content_digest: str) -> None:
+        """Adopt a temp file already written (e.g. by a worker process) as the new ``path``."""
+        target = os.path.abspath(path)
+        previous = self._staged.get(target)
+        if previous is not None:
+            os.unlink(previous[0])
+        self._staged[target] = (temp_path, content_digest)
+
+    def commit(self) -> None:
+        if not self._staged:
+            return
+        targets = sorted(self._staged)
+        for target in targets:
+            # A stale backup would make recover() treat this target as already swapped
+            Path(target + _BACKUP_SUFFIX).unlink(missing_ok=True)
+        # Targets that do not exist yet are removed again by recover(), if they still hold what we wrote
+        created = {t: self._staged[t][1] for t in targets if not os.path.exists(t)}
+        _save_json(self.journal_path, {"targets": targets, "temps": [self._staged[t][0] for t in targets],
+                                       "created": created})
+        swapped: list[str] = []
+        try:
+            for target in targets:
+                if os.path.exists(target):
+                    os.link(target, target + _BACKUP_SUFFIX)
+                os.replace(self._staged[target][0], target)
+                swapped.append(target)
+            for directory in {os.path.dirname(t) for t in targets}:
+                _fsync_dir(directory)
+        except BaseException:
+            _restore(swapped)
+            for target in targets:
+                Path(target + _BACKUP_SUFFIX).unlink(missing_ok=True)
+            self._discard_temps(skip=set(swapped))
+            self._staged.clear()
+            self.journal_path.unlink(missing_ok=True)
+            raise
+        ledger = self._ledger()
+        for target in targets:
+            ledger[target] = self._staged[target][1]
+        _save_json(self.ledger_path, ledger)
+        # Removing the journal is the commit point; leftover backups after it are harmless
+        self.journal_path.unlink(missing_ok=True)
+        for target in targets:
+            Path(target + _BACKUP_SUFFIX).unlink(missing_ok=True)
+        self._staged.clear()
+
+    def rollback(self) -> None:
+        self._discard_temps()
+        self._staged.clear()
+
+    def _discard_temps(self, skip: set[str] = frozenset()) -> None:
+        for target, (tmp, _) in self._staged.items():
+            if target not in skip:
+                Path(tmp).unlink(missing_ok=True)
+
+    @property
+    def pending(self) -> list[str]:
+        return sorted(self._staged)
+
+
+def _restore(targets: list[str]) -> None:
+    for target in reversed(targets):
+        backup = target + _BACKUP_SUFFIX
+        if os.path.exists(backup):
+            os.replace(backup, target)
+        else:
+            # The target did not exist before this transaction
+            Path(target).unlink(missing_ok=True)
+
+
+def recover(journal_path: str | Path) -> list[str]:
+    """Undo a commit that was interrupted before it finished; return the targets restored or removed."""
+    journal_path = Path(journal_path)
+    journal = _load_json(journal_path, None)
+    if journal is None:
+        return []
+    targets = journal["targets"]
+    for tmp in journal["temps"]:
+        Path(tmp).unlink(missing_ok=True)
+    # Only targets that were already swapped have a backup; untouched ones keep their content
+    swapped = [t for t in targets if os.path.exists(t + _BACKUP_SUFFIX)]
+    _restore(swapped)
+    for target, content_digest in journal.get("created", {}).items():
+        try:
+            with open(target, "rb") as f:
+                ours = digest(f.read()) == content_digest
+        except FileNotFoundError:
+            continue
+        if ours:
+            os.unlink(target)
+            swapped.append(target)
+    journal_path.unlink(missing_ok=True)
+    return swapped
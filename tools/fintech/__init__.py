@@ -0,0 +1,29 @@
+"""Offline tools for the bank reconciliation path (src/services/fintech).
+
+    python -m tools.fintech match [--log logs/fintech-edge.jsonl] [--backup B] [-o OUT]
+    python -m tools.fintech replay [logs/snapshots | FILE.jsonl] [--rate R] [--scale N]
+    python -m tools.fintech pack-snapshots -o FILE.jsonl
+    python -m tools.fintech store convert | query [--company C --direction IN ...] | compact
+"""
+
+from .candidates import Candidate, load_candidates
+from .matcher import CandidateIndex, Match, bucket, iter_matches, normalize
+from .replay import ReplayReport, iter_events, replay, synthetic
+from .segments import EdgeStore, Segment, SegmentWriter
+
+__all__ = [
+    "Candidate",
+    "CandidateIndex",
+    "EdgeStore",
+    "Match",
+    "ReplayReport",
+    "Segment",
+    "SegmentWriter",
+    "bucket",
+    "iter_events",
+    "iter_matches",
+    "load_candidates",
+    "normalize",
+    "replay",
+    "synthetic",
+]
@@ -0,0 +1,120 @@
+import argparse
+import json
+import sys
+import time
+from itertools import islice
+
+from tools.fs import REPO_ROOT
+
+from .candidates import load_candidates
+from .matcher import TOP_K, CandidateIndex, bucket, iter_matches
+from .replay import SNAPSHOT_DIR, iter_events, pack_snapshots, replay, synthetic
+from .segments import DEFAULT_STORE, EdgeStore, convert
+
+EDGE_LOG = REPO_ROOT / "logs" / "fintech-edge.jsonl"
+
+
+def _read_jsonl(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.fintech")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("match", help="re-score edge-diary lines with top-k candidates")
+    p.add_argument("--log", default=str(EDGE_LOG))
+    p.add_argument("--backup", help="checkpoint to take candidates from (default: latest)")
+    p.add_argument("--candidates", action="append", default=[], help="extra candidates JSONL")
+    p.add_argument("-k", type=int, default=TOP_K)
+    p.add_argument("-o", "--output", help="write JSONL here instead of stdout")
+
+    p = sub.add_parser("replay", help="benchmark the matcher on snapshot events")
+    p.add_argument("source", nargs="?", default=str(SNAPSHOT_DIR), help="snapshot dir or JSONL")
+    p.add_argument("--backup", help="checkpoint to take candidates from (default: latest)")
+    p.add_argument("--candidates", action="append", default=[], help="extra candidates JSONL")
+    p.add_argument("--rate", type=float, default=0.0, help="events per second (0 = as fast as possible)")
+    p.add_argument("--batch", type=int, default=256)
+    p.add_argument("--max-wait", type=float, default=50.0, help="ms a partial batch may wait")
+    p.add_argument("--scale", type=int, default=0, help="replay this many synthetic events instead")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--json", action="store_true", help="print the report as JSON")
+
+    p = sub.add_parser("pack-snapshots", help="concatenate snapshot files into JSONL")
+    p.add_argument("--dir", default=str(SNAPSHOT_DIR))
+    p.add_argument("-o", "--output", required=True)
+
+    p = sub.add_parser("store", help="columnar edge-transaction store")
+    p.add_argument("--store", default=str(DEFAULT_STORE))
+    store_sub = p.add_subparsers(dest="action", required=True)
+    q = store_sub.add_parser("convert", help="load snapshot files and the edge diary")
+    q.add_argument("--snapshots", default=str(SNAPSHOT_DIR))
+    q.add_argument("--log", default=str(EDGE_LOG))
+    q = store_sub.add_parser("query", help="print matching rows as JSONL")
+    q.add_argument("--company")
+    q.add_argument("--direction")
+    q.add_argument("--sub-type")
+    q.add_argument("--currency")
+    q.add_argument("--since", help="ISO date/time, inclusive")
+    q.add_argument("--until", help="ISO date/time, exclusive")
+    store_sub.add_parser("compact", help="merge all segments into one")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "store":
+        store = EdgeStore(args.store)
+        if args.action == "convert":
+            for path in convert(args.snapshots, args.log, store):
+                print(path)
+        elif args.action == "compact":
+            print(store.compact() or "nothing to compact")
+        else:
+            for row in store.select(args.since, args.until, company=args.company, direction=args.direction,
+                                    sub_type=args.sub_type, currency=args.currency):
+                print(json.dumps(row, ensure_ascii=False))
+        return 0
+
+    if args.command == "pack-snapshots":
+        print(f"{pack_snapshots(args.dir, args.output)} snapshots -> {args.output}")
+        return 0
+
+    t0 = time.perf_counter()
+    index = CandidateIndex(load_candidates(args.backup, args.candidates))
+    build = time.perf_counter() - t0
+
+    if args.command == "replay":
+        events = iter_events(args.source)
+        if args.scale:
+            # The sample is tiny next to the scaled run, so holding it is fine
+            events = synthetic(list(islice(events, 100_000)), args.scale, args.seed)
+        report = replay(index, events, args.rate, args.batch, args.max_wait / 1000.0)
+        if args.json:
+            print(json.dumps(dict(report.as_dict(), candidates=len(index), index_seconds=round(build, 3))))
+            return 0
+        lat = report.percentiles()
+        print(f"{len(index)} candidates indexed in {build:.3f}s")
+        print(f"{report.events} events in {report.batches} batches, {report.seconds:.3f}s "
+              f"({report.events_per_second:,.0f} events/s)")
+        print(f"latency ms: p50 {lat['p50']:.3f}  p95 {lat['p95']:.3f}  p99 {lat['p99']:.3f}  max {lat['max']:.3f}")
+        print(", ".join(f"{k} {v}" for k, v in report.buckets.items()))
+        return 0
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    buckets = {"HIGH": 0, "MEDIUM": 0, "LOW": 0}
+    try:
+        for event, match in iter_matches(index, _read_jsonl(args.log), args.k):
+            event = dict(event, confidence=match.confidence, topCandidates=match.candidates or None)
+            buckets[bucket(match.confidence)] += 1
+            out.write(json.dumps(event, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"{len(index)} candidates; " + ", ".join(f"{k} {v}" for k, v in buckets.items()), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Counterparties and open invoices a bank line can be matched against.
+
+Candidates come from a checkpoint backup (see tools.checkpoints) and/or a
+JSONL file with one ``{"id", "kind", "name", "amount"?, "direction"?}``
+object per line.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from tools.checkpoints import open_backup
+from tools.fs import REPO_ROOT
+
+CHECKPOINT_DIR = REPO_ROOT / "checkpoints"
+
+# Direction of the bank line a candidate can explain; None matches both
+_DIRECTIONS = {
+    "customers": "IN",
+    "suppliers": "OUT",
+    "marketplaceConfigs": "IN",
+    "salesInvoices": "IN",
+    "purchaseInvoices": "OUT",
+}
+
+
+@dataclass(frozen=True)
+class Candidate:
+    id: str
+    kind: str
+    name: str
+    amount: float | None = None  # set for invoices; an exact amount match raises confidence
+    direction: str | None = None
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Candidate":
+        amount = d.get("amount")
+        return cls(
+            id=str(d["id"]),
+            kind=d.get("kind", "counterparty"),
+            name=d["name"],
+            amount=None if amount is None else float(amount),
+            direction=d.get("direction"),
+        )
+
+
+def latest_backup(directory: str | Path = CHECKPOINT_DIR) -> Path | None:
+    backups = sorted(Path(directory).glob("backup_*.json"))
+    return backups[-1] if backups else None
+
+
+def from_backup(path: str | Path) -> list[Candidate]:
+    """Customers, suppliers, marketplaces and undeleted invoices from one backup."""
+    names: dict[str, str] = {}
+    invoices: list[tuple[str, dict]] = []
+    out: list[Candidate] = []
+    for entity, record in open_backup(path):
+        if entity not in _DIRECTIONS or not isinstance(record, dict) or record.get("deletedAt"):
+            continue
+        direction = _DIRECTIONS[entity]
+        if entity in ("customers", "suppliers"):
+            if record.get("name"):
+                names[record["id"]] = record["name"]
+                out.append(Candidate(record["id"], entity[:-1], record["name"], None, direction))
+        elif entity == "marketplaceConfigs":
+            if record.get("isActive", True) and record.get("type"):
+                out.append(Candidate(record["id"], "marketplace", record["type"], None, direction))
+        else:
+            invoices.append((entity, record))
+    # Invoices name their counterparty by id; resolve once every party has been seen
+    for entity, record in invoices:
+        party = names.get(record.get("customerId") or record.get("supplierId") or "", "")
+        label = " ".join(filter(None, [party, record.get("invoiceNo"), record.get("description")]))
+        amount = record.get("totalAmount")
+        out.append(Candidate(
+            record["id"], "invoice", label,
+            None if amount is None else float(amount), _DIRECTIONS[entity],
+        ))
+    return out
+
+
+def from_jsonl(path: str | Path) -> Iterator[Candidate]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield Candidate.from_dict(json.loads(line))
+
+
+def load_candidates(backup: str | Path | None = None, extra: Iterable[str | Path] = ()) -> list[Candidate]:
+    backup = backup or latest_backup()
+    out = from_backup(backup) if backup else []
+    for path in extra:
+        out.extend(from_jsonl(path))
+    return out
@@ -0,0 +1,160 @@
+"""Replay bank-transaction snapshots through the matcher as a load benchmark.
+
+Events come from ``logs/snapshots/tx_*.json`` (``{"payload": ..., "timestamp": ...}``
+written by PaymentMatchingEngine.takeSnapshot) or from a JSONL file holding
+one such snapshot, or a bare payload, per line. They are paced at a fixed
+rate (or as fast as possible), collected into batches, and each event's
+latency is measured from its arrival to the end of the batch that scored
+it, so queueing behind a batch counts.
+
+``synthetic`` stretches a small sample to any number of events by cycling
+it with jittered amounts and noisy descriptions, lazily, so millions of
+events never sit in memory.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from tools.fs import REPO_ROOT
+
+from .matcher import CandidateIndex, bucket
+
+SNAPSHOT_DIR = REPO_ROOT / "logs" / "snapshots"
+
+
+def iter_events(source: str | Path = SNAPSHOT_DIR) -> Iterator[dict]:
+    """Payload dicts from a snapshot directory or a JSONL file."""
+    source = Path(source)
+    if source.is_dir():
+        for path in sorted(source.glob("tx_*.json")):
+            with open(path, "r", encoding="utf-8") as f:
+                yield json.load(f)["payload"]
+        return
+    with open(source, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield record.get("payload", record)
+
+
+def pack_snapshots(directory: str | Path, out: str | Path) -> int:
+    """Concatenate a snapshot directory into one JSONL file; returns the line count."""
+    n = 0
+    with open(out, "w", encoding="utf-8") as f:
+        for path in sorted(Path(directory).glob("tx_*.json")):
+            with open(path, "r", encoding="utf-8") as src:
+                f.write(json.dumps(json.load(src), ensure_ascii=False, separators=(",", ":")) + "\n")
+            n += 1
+    return n
+
+
+def _noisy(text: str, rng: random.Random) -> str:
+    words = text.split()
+    out = []
+    for w in words:
+        if rng.random() < 0.2:
+            w = w + rng.choice(["!!", "...", "*", "-", ""])
+        out.append(w.lower() if rng.random() < 0.1 else w)
+    prefix = rng.choice(["", "", ">>> ", "EFT: ", "HAVALE "])
+    suffix = rng.choice(["", "", " ***", f" REF{rng.randrange(10**6):06d}"])
+    return prefix + " ".join(out) + suffix
+
+
+def synthetic(base: list[dict], count: int, seed: int = 0) -> Iterator[dict]:
+    """``count`` events derived from ``base``: same shape, perturbed amount and description."""
+    if not base:
+        return
+    rng = random.Random(seed)
+    for i in range(count):
+        event = dict(base[i % len(base)])
+        amount = float(event.get("amount") or 0)
+        event["amount"] = round(amount * rng.uniform(0.98, 1.02), 2) if rng.random() < 0.3 else amount
+        event["description"] = _noisy(event.get("description") or "", rng)
+        yield event
+
+
+@dataclass
+class ReplayReport:
+    events: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+    buckets: dict[str, int] = field(default_factory=lambda: {"HIGH": 0, "MEDIUM": 0, "LOW": 0})
+    latencies: array = field(default_factory=lambda: array("d"), repr=False)
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.seconds if self.seconds else 0.0
+
+    def percentiles(self) -> dict[str, float]:
+        """Latency percentiles in milliseconds."""
+        if not self.latencies:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        lat = np.frombuffer(self.latencies, dtype=np.float64) * 1000.0
+        p50, p95, p99 = np.percentile(lat, [50, 95, 99])
+        return {"p50": float(p50), "p95": float(p95), "p99": float(p99), "max": float(lat.max())}
+
+    def as_dict(self) -> dict:
+        return {
+            "events": self.events,
+            "batches": self.batches,
+            "seconds": round(self.seconds, 3),
+            "events_per_second": round(self.events_per_second, 1),
+            "latency_ms": {k: round(v, 3) for k, v in self.percentiles().items()},
+            "buckets": self.buckets,
+        }
+
+
+def _sleep_until(t: float) -> None:
+    delay = t - time.perf_counter()
+    if delay > 0:
+        time.sleep(delay)
+
+
+def replay(index: CandidateIndex, events: Iterable[dict], rate: float = 0.0,
+           batch: int = 256, max_wait: float = 0.05) -> ReplayReport:
+    """Feed ``events`` through ``index`` at ``rate`` events/s (0 = unthrottled).
+
+    A batch is scored when it holds ``batch`` events or its oldest event
+    has waited ``max_wait`` seconds, whichever comes first.
+    """
+    report = ReplayReport()
+    pending: list[dict] = []
+    arrivals: list[float] = []
+
+    def flush() -> None:
+        if not pending:
+            return
+        for match in index.match(pending):
+            report.buckets[bucket(match.confidence)] += 1
+        done = time.perf_counter()
+        report.latencies.extend(done - t for t in arrivals)
+        report.events += len(pending)
+        report.batches += 1
+        pending.clear()
+        arrivals.clear()
+
+    start = time.perf_counter()
+    for n, event in enumerate(events):
+        if rate:
+            due = start + n / rate
+            # Don't let a partial batch sit past its deadline while we wait for the next event
+            if pending and arrivals[0] + max_wait < due:
+                _sleep_until(arrivals[0] + max_wait)
+                flush()
+            _sleep_until(due)
+        pending.append(event)
+        arrivals.append(time.perf_counter())
+        if len(pending) >= batch:
+            flush()
+    flush()
+    report.seconds = time.perf_counter() - start
+    return report
@@ -0,0 +1,369 @@
+"""Append-only columnar segments for edge transactions.
+
+Replaces one ``logs/snapshots/tx_<epoch>.json`` per transaction plus a
+duplicate line in ``fintech-edge.jsonl`` with immutable segment files in
+``.cache/edge-store/`` (untracked, like the other tools' stores). Each
+segment holds:
+
+- fixed-width ``time`` (int64 epoch ms) and ``amount`` (float64) columns,
+- dictionary codes for ``companyId``, ``direction``, ``subType`` and
+  ``currency``,
+- string heaps (uint64 offsets + UTF-8 blob) for descriptions and for the
+  JSON of any remaining fields,
+- a ``shape`` code per row recording its kind and key order, so rows come
+  back as exactly the dicts that went in.
+
+Segments are memory-mapped and the columns are read as NumPy views, so a
+filter such as "IN settlements for company X in February" is a vectorized
+scan over the codes and times:
+
+    store = EdgeStore()
+    for row in store.select(company="...", direction="IN", sub_type="SETTLEMENT",
+                            since="2026-02-01", until="2026-03-01"):
+        ...
+
+File layout (little-endian): a header (magic, version, rows, footer
+offset/length), 8-byte aligned column sections, then a JSON footer with
+column offsets, dictionaries and shapes.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from tools.codemod.writer import atomic_write
+from tools.fs import REPO_ROOT
+
+DEFAULT_STORE = REPO_ROOT / ".cache" / "edge-store"
+
+_MAGIC = b"EDGS"
+_VERSION = 1
+_HEADER = struct.Struct("<4sIQQQ")
+
+EDGE, SNAPSHOT = "edge", "snapshot"
+# Row key -> dictionary-encoded column
+DICT_COLUMNS = {"companyId": "company", "direction": "direction", "subType": "sub_type", "currency": "currency"}
+_DICT_DTYPES = {"company": np.uint32, "direction": np.uint8, "sub_type": np.uint16, "currency": np.uint16}
+_COLUMN_KEYS = set(DICT_COLUMNS) | {"amount", "description"}
+
+# flags bits
+_AMOUNT_INT = 1
+_AMOUNT_NONE = 2
+_DESCRIPTION_NONE = 4
+_TIME_RAW = 8  # the time string did not round-trip through epoch ms; it is kept in the extras
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MS = timedelta(milliseconds=1)
+
+
+class SegmentError(ValueError):
+    pass
+
+
+def parse_time(value: str) -> int:
+    """ISO-8601 (as written by ``Date.toISOString``) -> epoch milliseconds."""
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _MS
+
+
+def format_time(ms: int) -> str:
+    dt = _EPOCH + ms * _MS
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{dt.microsecond // 1000:03d}Z"
+
+
+def _heap(strings: list[str]) -> tuple[bytes, bytes]:
+    blobs = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(blobs) + 1, dtype="<u8")
+    np.cumsum([len(b) for b in blobs], out=offsets[1:])
+    return offsets.tobytes(), b"".join(blobs)
+
+
+class SegmentWriter:
+    """Buffers rows and writes them out as one immutable segment."""
+
+    def __init__(self):
+        self.rows: list[tuple[str, dict, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def add_edge(self, line: dict) -> None:
+        """A ``fintech-edge.jsonl`` line (``time`` at top level)."""
+        self.rows.append((EDGE, line, line.get("time")))
+
+    def add_snapshot(self, snapshot: dict) -> None:
+        """A ``tx_*.json`` document: ``{"payload": {...}, "timestamp": ...}``."""
+        if list(snapshot) != ["payload", "timestamp"]:
+            raise SegmentError(f"unexpected snapshot keys {list(snapshot)}")
+        self.rows.append((SNAPSHOT, snapshot["payload"], snapshot["timestamp"]))
+
+    def encode(self) -> bytes:
+        n = len(self.rows)
+        dicts: dict[str, dict] = {col: {} for col in DICT_COLUMNS.values()}
+        shapes: dict[tuple, int] = {}
+        codes = {col: np.zeros(n, dtype=dt) for col, dt in _DICT_DTYPES.items()}
+        times = np.zeros(n, dtype="<i8")
+        amounts = np.zeros(n, dtype="<f8")
+        flags = np.zeros(n, dtype=np.uint8)
+        shape_codes = np.zeros(n, dtype="<u2")
+        descriptions: list[str] = []
+        extras: list[str] = []
+
+        for i, (kind, row, when) in enumerate(self.rows):
+            keys = tuple(row)
+            shape_codes[i] = shapes.setdefault((kind, keys), len(shapes))
+            extra = {k: v for k, v in row.items() if k not in _COLUMN_KEYS and not (kind == EDGE and k == "time")}
+            for key, col in DICT_COLUMNS.items():
+                codes[col][i] = dicts[col].setdefault(row.get(key), len(dicts[col]))
+            ms = parse_time(when) if isinstance(when, str) else 0
+            times[i] = ms
+            if not isinstance(when, str) or format_time(ms) != when:
+                flags[i] |= _TIME_RAW
+                extra["\0time"] = when
+            amount = row.get("amount")
+            if amount is None:
+                flags[i] |= _AMOUNT_NONE
+            else:
+                amounts[i] = amount
+                if isinstance(amount, int):
+                    flags[i] |= _AMOUNT_INT
+            description = row.get("description")
+            if description is None:
+                flags[i] |= _DESCRIPTION_NONE
+            descriptions.append(description or "")
+            extras.append(json.dumps(extra, ensure_ascii=False, separators=(",", ":")) if extra else "")
+
+        for col, mapping in dicts.items():
+            if len(mapping) > np.iinfo(_DICT_DTYPES[col]).max + 1:
+                raise SegmentError(f"too many distinct {col} values for one segment")
+
+        desc_offsets, desc_blob = _heap(descriptions)
+        extra_offsets, extra_blob = _heap(extras)
+        sections = [
+            ("time", "<i8", times.tobytes()),
+            ("amount", "<f8", amounts.tobytes()),
+            ("flags", "u1", flags.tobytes()),
+            ("shape", "<u2", shape_codes.tobytes()),
+            *((col, np.dtype(dt).newbyteorder("<").str, codes[col].tobytes()) for col, dt in _DICT_DTYPES.items()),
+            ("description_offsets", "<u8", desc_offsets),
+            ("description_heap", "u1", desc_blob),
+            ("extra_offsets", "<u8", extra_offsets),
+            ("extra_heap", "u1", extra_blob),
+        ]
+        body = bytearray(_HEADER.size)
+        columns = {}
+        for name, dtype, data in sections:
+            body += b"\0" * (-len(body) % 8)
+            columns[name] = [len(body), dtype, len(data) // np.dtype(dtype).itemsize]
+            body += data
+        footer = json.dumps({
+            "columns": columns,
+            "dicts": {col: list(mapping) for col, mapping in dicts.items()},
+            "shapes": [[kind, list(keys)] for kind, keys in shapes],
+        }, ensure_ascii=False).encode("utf-8")
+        _HEADER.pack_into(body, 0, _MAGIC, _VERSION, n, len(body), len(footer))
+        return bytes(body) + footer
+
+
+class Segment:
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.rows, footer_off, footer_len = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise SegmentError(f"{self.path} is not a v{_VERSION} edge segment")
+        footer = json.loads(self._mm[footer_off:footer_off + footer_len])
+        self.dicts: dict[str, list] = footer["dicts"]
+        self.shapes = [(kind, keys) for kind, keys in footer["shapes"]]
+        self._codes = {col: {v: i for i, v in enumerate(values)} for col, values in self.dicts.items()}
+        self.columns = {
+            name: np.frombuffer(self._mm, dtype=dtype, count=count, offset=offset)
+            for name, (offset, dtype, count) in footer["columns"].items()
+        }
+
+    def close(self) -> None:
+        # Views must go before the map they point into
+        self.columns.clear()
+        self._mm.close()
+
+    def __enter__(self) -> "Segment":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def mask(self, company=None, direction=None, sub_type=None, currency=None,
+             since: int | None = None, until: int | None = None) -> np.ndarray:
+        """Boolean row mask; ``since``/``until`` are epoch ms, ``until`` exclusive."""
+        keep = np.ones(self.rows, dtype=bool)
+        for col, value in (("company", company), ("direction", direction),
+                           ("sub_type", sub_type), ("currency", currency)):
+            if value is None:
+                continue
+            code = self._codes[col].get(value)
+            if code is None:
+                return np.zeros(self.rows, dtype=bool)
+            keep &= self.columns[col] == code
+        if since is not None:
+            keep &= self.columns["time"] >= since
+        if until is not None:
+            keep &= self.columns["time"] < until
+        return keep
+
+    def _string(self, heap: str, i: int) -> str:
+        offsets = self.columns[f"{heap}_offsets"]
+        lo, hi = int(offsets[i]), int(offsets[i + 1])
+        return self.columns[f"{heap}_heap"][lo:hi].tobytes().decode("utf-8")
+
+    def row(self, i: int) -> dict:
+        """Row ``i`` in the shape it was written: an edge line or a snapshot document."""
+        c = self.columns
+        kind, keys = self.shapes[c["shape"][i]]
+        flags = int(c["flags"][i])
+        raw_extra = self._string("extra", i)
+        extra = json.loads(raw_extra) if raw_extra else {}
+        when = extra.pop("\0time") if flags & _TIME_RAW else format_time(int(c["time"][i]))
+        values = {key: self.dicts[col][c[col][i]] for key, col in DICT_COLUMNS.items()}
+        if flags & _AMOUNT_NONE:
+            values["amount"] = None
+        else:
+            amount = float(c["amount"][i])
+            values["amount"] = int(amount) if flags & _AMOUNT_INT else amount
+        values["description"] = None if flags & _DESCRIPTION_NONE else self._string("description", i)
+        if kind == EDGE:
+            values["time"] = when
+        values.update(extra)
+        row = {key: values[key] for key in keys}
+        return row if kind == EDGE else {"payload": row, "timestamp": when}
+
+    def kind(self, i: int) -> str:
+        """``EDGE`` or ``SNAPSHOT``: what row ``i`` was written as."""
+        return self.shapes[self.columns["shape"][i]][0]
+
+    def __iter__(self) -> Iterator[dict]:
+        for i in range(self.rows):
+            yield self.row(i)
+
+
+class EdgeStore:
+    """Segments in ``root``; a compaction in progress is recorded in ``compact.json``.
+
+    The marker names the merged segment (staged under a temp name) and the
+    segments it replaces. Writing it is the commit point: whoever next
+    lists the segments finishes the swap, so a crash never leaves both the
+    merged rows and the originals visible.
+    """
+
+    def __init__(self, root: str | Path = DEFAULT_STORE):
+        self.root = Path(root)
+        self.marker = self.root / "compact.json"
+
+    def _finish_compaction(self) -> None:
+        try:
+            with open(self.marker, "r", encoding="utf-8") as f:
+                pending = json.load(f)
+        except FileNotFoundError:
+            return
+        staged = self.root / pending["staged"]
+        if staged.exists():
+            os.replace(staged, self.root / pending["segment"])
+        for name in pending["replaces"]:
+            (self.root / name).unlink(missing_ok=True)
+        self.marker.unlink()
+
+    def segment_paths(self) -> list[Path]:
+        self._finish_compaction()
+        return sorted(self.root.glob("seg-*.seg"))
+
+    def _next_path(self) -> Path:
+        existing = self.segment_paths()
+        number = int(existing[-1].stem.split("-")[1]) + 1 if existing else 1
+        return self.root / f"seg-{number:06d}.seg"
+
+    def append(self, writer: SegmentWriter) -> Path | None:
+        """Write ``writer``'s rows as the next segment; earlier segments are never touched."""
+        if not len(writer):
+            return None
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._next_path()
+        atomic_write(path, writer.encode())
+        return path
+
+    def segments(self) -> Iterator[Segment]:
+        for path in self.segment_paths():
+            with Segment(path) as seg:
+                yield seg
+
+    def __iter__(self) -> Iterator[dict]:
+        for seg in self.segments():
+            yield from seg
+
+    def select(self, since: str | int | None = None, until: str | int | None = None, **filters) -> Iterator[dict]:
+        """Rows matching dictionary filters (company, direction, sub_type, currency) and a time range."""
+        if isinstance(since, str):
+            since = parse_time(since)
+        if isinstance(until, str):
+            until = parse_time(until)
+        for seg in self.segments():
+            for i in np.flatnonzero(seg.mask(since=since, until=until, **filters)).tolist():
+                yield seg.row(i)
+
+    def compact(self) -> Path | None:
+        """Merge every segment into one, so appends of a few rows don't pile up."""
+        paths = self.segment_paths()
+        if len(paths) < 2:
+            return None
+        writer = SegmentWriter()
+        for seg in self.segments():
+            for i in range(len(seg)):
+                row = seg.row(i)
+                (writer.add_snapshot if seg.kind(i) == SNAPSHOT else writer.add_edge)(row)
+        path = self._next_path()
+        staged = path.with_suffix(".staged")
+        atomic_write(staged, writer.encode())
+        atomic_write(self.marker, json.dumps({
+            "segment": path.name, "staged": staged.name, "replaces": [p.name for p in paths],
+        }))
+        self._finish_compaction()
+        return path
+
+
+def convert(snapshots: str | Path | None, edge_log: str | Path | None, store: EdgeStore,
+            rows_per_segment: int = 1 << 20) -> list[Path]:
+    """Load snapshot files and/or an edge diary into ``store``."""
+    written = []
+    writer = SegmentWriter()
+
+    def sources() -> Iterable[tuple[str, dict]]:
+        if snapshots:
+            for path in sorted(Path(snapshots).glob("tx_*.json")):
+                with open(path, "r", encoding="utf-8") as f:
+                    yield SNAPSHOT, json.load(f)
+        if edge_log and os.path.exists(edge_log):
+            with open(edge_log, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield EDGE, json.loads(line)
+
+    for kind, record in sources():
+        (writer.add_snapshot if kind == SNAPSHOT else writer.add_edge)(record)
+        if len(writer) >= rows_per_segment:
+            written.append(store.append(writer))
+            writer = SegmentWriter()
+    if len(writer):
+        written.append(store.append(writer))
+    return written
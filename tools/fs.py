@@ -0,0 +1,37 @@
+"""Filesystem helpers shared by the tools."""
+
+from __future__ import annotations
+
+import os
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Iterable, Iterator
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+SKIP_DIRS = frozenset({"node_modules", ".next", ".git", ".vercel", "__pycache__", "dist", "build"})
+
+
+def iter_files(root: str | Path, include: Iterable[str] = ("*",)) -> Iterator[str]:
+    """Yield posix paths relative to ``root`` for files matching any ``include`` glob.
+
+    Output order is sorted per directory so runs are reproducible.
+    """
+    root = str(root)
+    include = tuple(include)
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            entries = sorted(os.scandir(os.path.join(root, rel_dir)), key=lambda e: e.name)
+        except FileNotFoundError:
+            continue
+        subdirs = []
+        for entry in entries:
+            rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS and not entry.name.startswith("."):
+                    subdirs.append(rel)
+            elif any(fnmatch(rel, pat) for pat in include):
+                yield rel
+        stack.extend(reversed(subdirs))
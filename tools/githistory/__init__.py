@@ -0,0 +1,14 @@
+"""Parsed ``git log -p`` / diff dumps indexed by commit, file and hunk.
+
+    python -m tools.githistory touching HepsiburadaService
+    python -m tools.githistory churn [--prefix src/services/] [-n 20]
+    python -m tools.githistory co-change [--path FILE] [-n 20]
+"""
+
+from .index import Churn, HistoryIndex, Touch
+from .parse import Commit, FileChange, Hunk, iter_commits, parse_dump, parse_lines, split_commits
+
+__all__ = [
+    "Churn", "Commit", "FileChange", "HistoryIndex", "Hunk", "Touch",
+    "iter_commits", "parse_dump", "parse_lines", "split_commits",
+]
@@ -0,0 +1,66 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from tools.fs import REPO_ROOT
+
+from .index import HistoryIndex
+
+# Root-level dumps read by default
+DEFAULT_DUMPS = ("gitlog.txt", "*.diff", "all_diffs.txt")
+
+
+def default_dumps(root: Path = REPO_ROOT) -> list[Path]:
+    return sorted({p for pattern in DEFAULT_DUMPS for p in root.glob(pattern) if p.is_file()})
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.githistory")
+    parser.add_argument("--dump", action="append", help="log/diff dump to read (repeatable; default: root dumps)")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="worker processes for large dumps")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("touching", help="commits whose changes mention a symbol or path fragment")
+    p.add_argument("symbol")
+
+    p = sub.add_parser("churn", help="files by lines changed")
+    p.add_argument("--prefix", default="")
+    p.add_argument("-n", type=int, default=20)
+
+    p = sub.add_parser("co-change", help="files most often changed in the same commit")
+    p.add_argument("--path", help="only pairs with this file")
+    p.add_argument("--min", type=int, default=2, help="minimum shared commits")
+    p.add_argument("-n", type=int, default=20)
+
+    p = sub.add_parser("log", help="commits that changed a file")
+    p.add_argument("path")
+
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    dumps = args.dump or default_dumps()
+    index = HistoryIndex.from_dumps(dumps, args.jobs)
+    t1 = time.perf_counter()
+    if args.command == "touching":
+        for t in index.touching(args.symbol):
+            where = f"{t.hunks} hunks" if t.hunks else "path"
+            print(f"{t.commit.sha[:10] or '(worktree)':10}  {t.commit.date[:24]:24}  {where:9}  {t.path}")
+            print(f"{'':12}{t.commit.subject}")
+    elif args.command == "churn":
+        for c in index.churn(args.n, args.prefix):
+            print(f"{c.commits:5} commits  +{c.added:<6} -{c.removed:<6} {c.path}")
+    elif args.command == "co-change":
+        for a, b, n in index.co_change(args.n, args.min, args.path):
+            print(f"{n:5}  {a}  {b}")
+    else:
+        for commit in index.commits_for(args.path):
+            print(f"{commit.sha[:10] or '(worktree)':10}  {commit.date[:24]:24}  {commit.subject}")
+    t2 = time.perf_counter()
+    print(f"{len(index.commits)} commits from {len(dumps)} dumps: parse {(t1 - t0) * 1000:.0f} ms,"
+          f" query {(t2 - t1) * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""In-memory commit → file → hunk index with churn, co-change and symbol lookups.
+
+Identifiers in changed lines, hunk context headers and file paths are
+indexed per commit, so "which commits touched HepsiburadaService" is a
+dictionary lookup. Queries that are not a single identifier fall back to
+a substring scan over the changed lines.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Iterable, Sequence
+
+from .parse import Commit, parse_dump
+
+_IDENT = re.compile(r"[A-Za-z_$][\w$]*")
+
+# Commits touching more files than this (formatting sweeps, mass renames)
+# are left out of co-change pairs, where they would swamp everything else
+CO_CHANGE_MAX_FILES = 50
+
+
+@dataclass(frozen=True, slots=True)
+class Churn:
+    path: str
+    commits: int
+    added: int
+    removed: int
+
+    @property
+    def lines(self) -> int:
+        return self.added + self.removed
+
+
+@dataclass(frozen=True, slots=True)
+class Touch:
+    commit: Commit
+    path: str
+    hunks: int  # hunks of ``path`` that mention the symbol; 0 if only the path matched
+
+
+class HistoryIndex:
+    def __init__(self, commits: Iterable[Commit] = ()):
+        self.commits: list[Commit] = []
+        self.by_file: dict[str, list[int]] = defaultdict(list)
+        self.tokens: dict[str, set[int]] = defaultdict(set)
+        self._seen: set[str] = set()
+        self.add(commits)
+
+    @classmethod
+    def from_dumps(cls, paths: Sequence[str | os.PathLike], jobs: int | None = None) -> "HistoryIndex":
+        index = cls()
+        for path in paths:
+            index.add(parse_dump(path, jobs))
+        return index
+
+    def add(self, commits: Iterable[Commit]) -> int:
+        """Index ``commits``; a sha already indexed (dumps overlap) is skipped."""
+        n = 0
+        for commit in commits:
+            if commit.sha:
+                if commit.sha in self._seen:
+                    continue
+                self._seen.add(commit.sha)
+            i = len(self.commits)
+            self.commits.append(commit)
+            n += 1
+            for change in commit.files:
+                self.by_file[change.path].append(i)
+                words = set(_IDENT.findall(change.path))
+                for hunk in change.hunks:
+                    words.update(_IDENT.findall(hunk.header))
+                    for line in hunk.added:
+                        words.update(_IDENT.findall(line))
+                    for line in hunk.removed:
+                        words.update(_IDENT.findall(line))
+                for word in words:
+                    self.tokens[word].add(i)
+        return n
+
+    def churn(self, limit: int | None = None, prefix: str = "") -> list[Churn]:
+        """Files by lines changed, most first."""
+        stats: dict[str, list[int]] = defaultdict(lambda: [0, 0, 0])
+        for commit in self.commits:
+            for change in commit.files:
+                if not change.path.startswith(prefix):
+                    continue
+                s = stats[change.path]
+                s[0] += 1
+                s[1] += change.added
+                s[2] += change.removed
+        rows = [Churn(path, *s) for path, s in stats.items()]
+        rows.sort(key=lambda c: (-c.lines, -c.commits, c.path))
+        return rows[:limit]
+
+    def co_change(self, limit: int | None = None, min_count: int = 2,
+                  path: str | None = None) -> list[tuple[str, str, int]]:
+        """``(a, b, commits)`` for file pairs changed together, most often first.
+
+        With ``path`` only pairs including that file are returned.
+        """
+        pairs: Counter = Counter()
+        for commit in self.commits:
+            files = sorted({c.path for c in commit.files})
+            if len(files) > CO_CHANGE_MAX_FILES or (path is not None and path not in files):
+                continue
+            if path is not None:
+                pairs.update((path, f) if path < f else (f, path) for f in files if f != path)
+            else:
+                pairs.update(combinations(files, 2))
+        rows = [(a, b, n) for (a, b), n in pairs.items() if n >= min_count]
+        rows.sort(key=lambda r: (-r[2], r[0], r[1]))
+        return rows[:limit]
+
+    def commits_for(self, path: str) -> list[Commit]:
+        return [self.commits[i] for i in self.by_file.get(path, ())]
+
+    def touching(self, symbol: str) -> list[Touch]:
+        """Changes that added or removed a line mentioning ``symbol``, or whose path or
+        hunk context contains it, in index order."""
+        if _IDENT.fullmatch(symbol):
+            candidates = sorted(self.tokens.get(symbol, ()))
+        else:
+            candidates = range(len(self.commits))
+        out = []
+        for i in candidates:
+            commit = self.commits[i]
+            for change in commit.files:
+                hunks = sum(
+                    1 for h in change.hunks
+                    if symbol in h.header
+                    or any(symbol in line for line in h.added)
+                    or any(symbol in line for line in h.removed)
+                )
+                if hunks or symbol in change.path:
+                    out.append(Touch(commit, change.path, hunks))
+        return out
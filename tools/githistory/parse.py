@@ -0,0 +1,180 @@
+"""Streaming parser for ``git log -p`` dumps and bare ``git diff`` output.
+
+gitlog.txt and hepsiburada_history.diff are UTF-16 PowerShell captures,
+the other dumps UTF-8; tools.ingest.text picks the codec. A dump without
+``commit`` headers (all_diffs.txt, a working-tree diff) parses as one
+commit with an empty sha.
+
+Large dumps can be parsed in parallel: the text is cut at ``commit ``
+lines into roughly equal pieces and each piece is parsed by a worker.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass, field
+from multiprocessing import Pool
+from typing import Iterable, Iterator
+
+from tools.ingest.text import open_text
+
+_HUNK = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@ ?(.*)$")
+_DIFF = re.compile(r"^diff --git a/(.*?) b/(.*)$")
+
+# Below this many bytes a parallel parse is not worth the process startup
+PARALLEL_MIN = 4 << 20
+
+
+@dataclass(slots=True)
+class Hunk:
+    old_start: int
+    new_start: int
+    header: str  # the function/class context git prints after ``@@``
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class FileChange:
+    path: str
+    old_path: str
+    status: str = "M"  # A, D, M or R
+    binary: bool = False
+    hunks: list[Hunk] = field(default_factory=list)
+
+    @property
+    def added(self) -> int:
+        return sum(len(h.added) for h in self.hunks)
+
+    @property
+    def removed(self) -> int:
+        return sum(len(h.removed) for h in self.hunks)
+
+
+@dataclass(slots=True)
+class Commit:
+    sha: str  # "" for a dump without commit headers
+    author: str = ""
+    date: str = ""
+    message: str = ""
+    files: list[FileChange] = field(default_factory=list)
+
+    @property
+    def subject(self) -> str:
+        return self.message.split("\n", 1)[0]
+
+
+def parse_lines(lines: Iterable[str]) -> Iterator[Commit]:
+    """Commits from the lines of a dump, yielded as each one ends."""
+    commit: Commit | None = None
+    change: FileChange | None = None
+    hunk: Hunk | None = None
+    old_left = new_left = 0
+    message: list[str] = []
+
+    def finish() -> Commit | None:
+        if commit is not None:
+            commit.message = "\n".join(message).strip()
+        return commit
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if hunk is not None and (old_left > 0 or new_left > 0):
+            tag = line[:1]
+            if tag == "+":
+                hunk.added.append(line[1:])
+                new_left -= 1
+                continue
+            if tag == "-":
+                hunk.removed.append(line[1:])
+                old_left -= 1
+                continue
+            if tag == " " or not line:
+                old_left -= 1
+                new_left -= 1
+                continue
+            if tag == "\\":  # "\ No newline at end of file"
+                continue
+        hunk = None
+        if line.startswith("commit "):
+            done = finish()
+            if done is not None:
+                yield done
+            # "commit <sha> (HEAD -> main)" with --decorate
+            commit, change, message = Commit(line[7:].partition(" ")[0]), None, []
+            continue
+        if line.startswith("diff --git "):
+            if commit is None:
+                commit, message = Commit(""), []
+            m = _DIFF.match(line)
+            old, new = (m[1], m[2]) if m else (line[11:], line[11:])
+            change = FileChange(new, old, "R" if old != new else "M")
+            commit.files.append(change)
+            continue
+        if change is not None:
+            m = _HUNK.match(line)
+            if m:
+                hunk = Hunk(int(m[1]), int(m[3]), m[5])
+                old_left = int(m[2]) if m[2] is not None else 1
+                new_left = int(m[4]) if m[4] is not None else 1
+                change.hunks.append(hunk)
+            elif line.startswith("new file mode"):
+                change.status = "A"
+            elif line.startswith("deleted file mode"):
+                change.status = "D"
+            elif line.startswith("Binary files") or line.startswith("GIT binary patch"):
+                change.binary = True
+            elif line.startswith("rename from "):
+                change.old_path, change.status = line[12:], "R"
+            elif line.startswith("rename to "):
+                change.path = line[10:]
+            continue
+        if commit is None:
+            continue
+        if line.startswith("Author:"):
+            commit.author = line[7:].strip()
+        elif line.startswith("Date:"):
+            commit.date = line[5:].strip()
+        elif line.startswith("    ") or not line:
+            message.append(line[4:])
+    done = finish()
+    if done is not None:
+        yield done
+
+
+def iter_commits(path: str | os.PathLike) -> Iterator[Commit]:
+    """Commits of a dump in file order (newest first for ``git log``), in one streaming pass."""
+    with open_text(path) as f:
+        yield from parse_lines(f)
+
+
+def split_commits(text: str, parts: int) -> list[str]:
+    """Cut ``text`` at ``commit `` lines into at most ``parts`` pieces of similar size."""
+    pieces = []
+    start = 0
+    step = max(1, len(text) // max(1, parts))
+    while start < len(text):
+        cut = text.find("\ncommit ", start + step)
+        if cut < 0:
+            pieces.append(text[start:])
+            break
+        pieces.append(text[start:cut + 1])
+        start = cut + 1
+    return pieces
+
+
+def _parse_piece(text: str) -> list[Commit]:
+    return list(parse_lines(text.splitlines()))
+
+
+def parse_dump(path: str | os.PathLike, jobs: int | None = None) -> list[Commit]:
+    """All commits of a dump; big dumps are parsed by ``jobs`` worker processes."""
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or os.path.getsize(path) < PARALLEL_MIN:
+        return list(iter_commits(path))
+    with open_text(path) as f:
+        text = f.read()
+    pieces = split_commits(text, jobs * 4)
+    with Pool(min(jobs, len(pieces))) as pool:
+        return [c for commits in pool.map(_parse_piece, pieces) for c in commits]
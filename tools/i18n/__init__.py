@@ -0,0 +1,18 @@
+"""Locale dictionaries for the UI: extraction, key checks and lazy per-namespace chunks.
+
+    python -m tools.i18n extract      # inline LanguageContext dictionaries -> src/locales/<lang>.json
+    python -m tools.i18n check        # unused, undefined and untranslated keys
+    python -m tools.i18n build        # src/locales/<lang>/<ns>.json chunks + generated LanguageContext.tsx
+"""
+
+from .context import EAGER, render_context
+from .dictionaries import (
+    DictionaryError, build_chunks, extract_dictionaries, flatten, load_locales, merge_missing, namespaces,
+    write_locales,
+)
+from .usage import KeyReport, Usage, check, scan_usage
+
+__all__ = [
+    "DictionaryError", "EAGER", "KeyReport", "Usage", "build_chunks", "check", "extract_dictionaries",
+    "flatten", "load_locales", "merge_missing", "namespaces", "render_context", "scan_usage", "write_locales",
+]
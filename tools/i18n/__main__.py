@@ -0,0 +1,72 @@
+import argparse
+import sys
+from pathlib import Path
+
+from tools.codemod.writer import atomic_write
+
+from .context import EAGER, render_context
+from .dictionaries import (
+    CONTEXT, FALLBACK, LOCALES_DIR, DictionaryError, build_chunks, extract_dictionaries, load_locales, namespaces,
+    write_locales,
+)
+from .usage import check, scan_usage
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.i18n")
+    parser.add_argument("--context", default=str(CONTEXT))
+    parser.add_argument("--locales", default=str(LOCALES_DIR), help="directory of <lang>.json files and chunks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("extract", help="write the context's inline dictionaries to <lang>.json files")
+
+    p = sub.add_parser("check", help="report unused, undefined and untranslated keys")
+    p.add_argument("--sites", type=int, default=2, help="call sites listed per undefined key")
+
+    p = sub.add_parser("build", help="write per-namespace chunks and regenerate the context")
+    p.add_argument("--eager", nargs="*", default=list(EAGER), help="namespaces requested up front")
+
+    args = parser.parse_args(argv)
+    context = Path(args.context)
+
+    try:
+        if args.command == "extract":
+            dictionaries = extract_dictionaries(context.read_text(encoding="utf-8"))
+            for path in write_locales(dictionaries, args.locales):
+                print(path)
+            return 0
+
+        dictionaries = load_locales(args.locales)
+        if args.command == "check":
+            report = check(dictionaries, scan_usage(namespaces(dictionaries)))
+            for key in report.unused:
+                print(f"unused     {key}")
+            for key, sites in report.undefined.items():
+                where = ", ".join(f"{path}:{line}" for path, line in sites[:args.sites])
+                print(f"undefined  {key}  {where}")
+            for locale, keys in report.missing.items():
+                for key in keys:
+                    print(f"missing    {locale}  {key}")
+            print(f"{len(report.unused)} unused, {len(report.undefined)} undefined,"
+                  f" {sum(map(len, report.missing.values()))} missing translations", file=sys.stderr)
+            return 1 if report.undefined or report.missing else 0
+
+        sizes = build_chunks(dictionaries, args.locales)
+        names = namespaces(dictionaries)
+        atomic_write(context, render_context(list(dictionaries), names, FALLBACK, args.eager))
+        total = sum(n for per_ns in sizes.values() for n in per_ns.values())
+        eager = [ns for ns in args.eager if ns in names]
+        for locale, per_ns in sizes.items():
+            # The fallback locale is bundled with the context; other locales add their eager chunks
+            bundled = sum(sizes.get(FALLBACK, {}).values())
+            first = bundled + (0 if locale == FALLBACK else sum(per_ns.get(ns, 0) for ns in eager))
+            print(f"{locale}: {len(per_ns)} chunks, {sum(per_ns.values())} bytes; first load {first} bytes")
+        print(f"all locales: {total} bytes; wrote {context}")
+    except DictionaryError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
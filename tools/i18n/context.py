@@ -0,0 +1,178 @@
+"""Generator for src/contexts/LanguageContext.tsx with lazily imported dictionaries.
+
+The generated provider keeps the old API (``language``, ``setLanguage``,
+``t(key, variables)``) but imports ``@/locales/<lang>/<ns>.json`` on demand.
+The bundler emits each chunk separately, so a page downloads only the
+active language's namespaces it actually renders. The eager namespaces
+are requested as soon as the language is known; others on their first
+``t()`` call. The fallback language's chunks are all imported statically:
+server rendering has no effects to load anything with, and until another
+language's chunk arrives ``t()`` answers from the fallback, so a raw key
+only shows for keys no locale defines.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Sequence
+
+# Namespaces nearly every page renders (buttons, sidebar)
+EAGER = ("common", "menu")
+STORAGE_KEY = "periodya_lang"
+
+_TEMPLATE = '''"use client";
+
+// Generated by `python -m tools.i18n build` from src/locales/<lang>.json; edit those, not this file.
+
+import React, { createContext, useContext, useState, useEffect, useRef, ReactNode } from "react";
+__STATIC_IMPORTS__
+
+type Language = __LANGUAGE_TYPE__;
+type Dictionary = Record<string, any>;
+
+const LANGUAGES: Language[] = __LANGUAGES__;
+const NAMESPACES: string[] = __NAMESPACES__;
+// Requested as soon as the language is known; the rest load on their first t() call
+const EAGER_NAMESPACES: string[] = __EAGER__;
+const FALLBACK: Language = __FALLBACK__;
+
+// One chunk per language and namespace, shared by every provider instance.
+// Missing keys were filled from the fallback language when the chunks were built.
+const chunks = new Map<string, Promise<Dictionary>>();
+// The fallback language, bundled with the context: what the server renders, and what
+// t() answers with while another language's chunk loads
+const STATIC: Record<string, Dictionary> = __STATIC__;
+
+function loadNamespace(lang: Language, ns: string): Promise<Dictionary> {
+    const id = `${lang}/${ns}`;
+    let chunk = chunks.get(id);
+    if (!chunk) {
+        chunk = import(`@/locales/${lang}/${ns}.json`)
+            .then((mod) => (mod.default ?? mod) as Dictionary)
+            .catch(() => {
+                chunks.delete(id);
+                return {};
+            });
+        chunks.set(id, chunk);
+    }
+    return chunk;
+}
+
+interface LanguageContextProps {
+    language: Language;
+    setLanguage: (lang: Language) => void;
+    t: (key: string, variables?: Record<string, any>) => string;
+}
+
+const LanguageContext = createContext<LanguageContextProps>({
+    language: FALLBACK,
+    setLanguage: () => {},
+    t: (key) => key,
+});
+
+export const LanguageProvider = ({ children }: { children: ReactNode }) => {
+    const [language, setLanguageState] = useState<Language>(FALLBACK);
+    const [dictionaries, setDictionaries] = useState<Record<string, Dictionary>>({ [FALLBACK]: STATIC });
+    // "<lang>/<ns>" chunks already asked for by this provider
+    const requested = useRef(new Set<string>());
+
+    // Starts loading a chunk once; the state update re-renders whatever asked for it
+    const request = (lang: Language, ns: string) => {
+        const id = `${lang}/${ns}`;
+        if (requested.current.has(id) || typeof window === "undefined") return;
+        requested.current.add(id);
+        // Deferred: t() is called while components render, where no state may be set
+        queueMicrotask(() => {
+            loadNamespace(lang, ns).then((dict) => {
+                setDictionaries((prev) => ({ ...prev, [lang]: { ...prev[lang], [ns]: dict } }));
+            });
+        });
+    };
+
+    useEffect(() => {
+        // Load user's preferred language from local storage
+        const savedLang = localStorage.getItem(__STORAGE_KEY__) as Language;
+        if (savedLang && LANGUAGES.includes(savedLang)) {
+            setLanguageState(savedLang);
+        }
+    }, []);
+
+    useEffect(() => {
+        for (const ns of EAGER_NAMESPACES) {
+            if (dictionaries[language]?.[ns] === undefined) request(language, ns);
+        }
+    }, [language]);
+
+    const setLanguage = (lang: Language) => {
+        setLanguageState(lang);
+        localStorage.setItem(__STORAGE_KEY__, lang);
+    };
+
+    const t = (key: string, variables?: Record<string, any>): string => {
+        const keys = key.split(".");
+        const ns = keys[0];
+        let namespace = dictionaries[language]?.[ns];
+
+        if (namespace === undefined) {
+            if (!NAMESPACES.includes(ns)) return key;
+            // Still loading: answer from the (static) fallback language
+            request(language, ns);
+            namespace = dictionaries[FALLBACK]?.[ns];
+        }
+
+        let value: any = namespace;
+        for (const k of keys.slice(1)) {
+            if (value && typeof value === 'object') {
+                value = value[k];
+            } else {
+                value = undefined;
+                break;
+            }
+        }
+
+        if (typeof value !== 'string') return key;
+
+        // Replace variables e.g. {name} -> variables.name
+        if (variables) {
+            return value.replace(/\\{(\\w+)\\}/g, (_, vKey) => {
+                return variables[vKey] !== undefined ? variables[vKey] : `{${vKey}}`;
+            });
+        }
+
+        return value;
+    };
+
+    return (
+        <LanguageContext.Provider value={{ language, setLanguage, t }}>
+            {children}
+        </LanguageContext.Provider>
+    );
+};
+
+export const useLanguage = () => useContext(LanguageContext);
+'''
+
+
+def _static_name(ns: str) -> str:
+    return "fallback_" + re.sub(r"\W", "_", ns)
+
+
+def render_context(languages: Sequence[str], namespaces: Sequence[str], fallback: str,
+                   eager: Sequence[str] = EAGER) -> str:
+    eager = [ns for ns in eager if ns in namespaces]
+    imports = "\n".join(f'import {_static_name(ns)} from "@/locales/{fallback}/{ns}.json";' for ns in namespaces)
+    values = {
+        "__STATIC_IMPORTS__": imports,
+        "__STATIC__": "{\n" + "".join(f"    {json.dumps(ns)}: {_static_name(ns)},\n" for ns in namespaces) + "}",
+        "__LANGUAGE_TYPE__": " | ".join(json.dumps(lang) for lang in languages),
+        "__LANGUAGES__": json.dumps(list(languages)),
+        "__NAMESPACES__": json.dumps(list(namespaces)),
+        "__EAGER__": json.dumps(eager),
+        "__FALLBACK__": json.dumps(fallback),
+        "__STORAGE_KEY__": json.dumps(STORAGE_KEY),
+    }
+    text = _TEMPLATE
+    for placeholder, value in values.items():
+        text = text.replace(placeholder, value)
+    return text
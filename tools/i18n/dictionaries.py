@@ -0,0 +1,126 @@
+"""Locale dictionaries: extraction from LanguageContext.tsx and per-namespace chunks.
+
+The dictionaries used to live inline in src/contexts/LanguageContext.tsx
+(``defaultDictionaries``), so every client bundle carried every language.
+They are now edited as src/locales/<lang>.json; ``build_chunks`` splits
+each into src/locales/<lang>/<namespace>.json, which the generated context
+imports lazily. Keys a locale lacks are filled from the fallback locale at
+build time, as ``t()`` used to do at run time.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+
+from tools.codemod.writer import atomic_write
+from tools.fs import REPO_ROOT
+from tools.jsobject import is_string, js_string, read_value
+
+CONTEXT = REPO_ROOT / "src" / "contexts" / "LanguageContext.tsx"
+LOCALES_DIR = REPO_ROOT / "src" / "locales"
+FALLBACK = "tr"
+
+_DECL = re.compile(r"\bconst\s+defaultDictionaries\b[^=]*=\s*(?=\{)")
+
+
+class DictionaryError(ValueError):
+    pass
+
+
+def _to_python(value, path: str):
+    if isinstance(value, dict):
+        return {k: _to_python(v, f"{path}.{k}" if path else k) for k, v in value.items()}
+    if is_string(value):
+        return js_string(value)
+    raise DictionaryError(f"{path}: not a string or object literal: {str(value)[:60]}")
+
+
+def extract_dictionaries(text: str) -> dict[str, dict]:
+    """``{locale: nested dict}`` from the inline ``defaultDictionaries`` literal."""
+    m = _DECL.search(text)
+    if m is None:
+        raise DictionaryError("no inline defaultDictionaries (already extracted?)")
+    value = read_value(text, m.end())
+    if not isinstance(value, dict):
+        raise DictionaryError("defaultDictionaries is not an object literal")
+    return _to_python(value, "")
+
+
+def flatten(tree: dict, prefix: str = "") -> dict[str, str]:
+    """Dotted keys to strings, in definition order."""
+    out = {}
+    for key, value in tree.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            out.update(flatten(value, path))
+        else:
+            out[path] = value
+    return out
+
+
+def merge_missing(tree: dict, fallback: dict) -> dict:
+    """``tree`` with keys it lacks copied from ``fallback``, keeping ``tree``'s order first."""
+    out = dict(tree)
+    for key, value in fallback.items():
+        if key not in out:
+            out[key] = value
+        elif isinstance(value, dict) and isinstance(out[key], dict):
+            out[key] = merge_missing(out[key], value)
+    return out
+
+
+def load_locales(root: str | Path = LOCALES_DIR) -> dict[str, dict]:
+    """The per-locale JSON files, fallback locale first."""
+    root = Path(root)
+    out = {}
+    for path in sorted(root.glob("*.json"), key=lambda p: (p.stem != FALLBACK, p.stem)):
+        with open(path, encoding="utf-8") as f:
+            out[path.stem] = json.load(f)
+    if not out:
+        raise DictionaryError(f"no <locale>.json files in {root}")
+    return out
+
+
+def write_locales(dictionaries: dict[str, dict], root: str | Path = LOCALES_DIR) -> list[Path]:
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    written = []
+    for locale, tree in dictionaries.items():
+        path = root / f"{locale}.json"
+        atomic_write(path, json.dumps(tree, ensure_ascii=False, indent=2) + "\n")
+        written.append(path)
+    return written
+
+
+def build_chunks(dictionaries: dict[str, dict], root: str | Path = LOCALES_DIR,
+                 fallback: str = FALLBACK) -> dict[str, dict[str, int]]:
+    """Write one compact JSON file per locale and namespace; returns ``{locale: {namespace: bytes}}``.
+
+    Chunk files of namespaces that no longer exist are removed.
+    """
+    root = Path(root)
+    base = dictionaries.get(fallback, {})
+    sizes: dict[str, dict[str, int]] = {}
+    for locale, tree in dictionaries.items():
+        tree = merge_missing(tree, base) if locale != fallback else tree
+        out_dir = root / locale
+        out_dir.mkdir(parents=True, exist_ok=True)
+        sizes[locale] = {}
+        for ns, value in tree.items():
+            if not isinstance(value, dict):
+                raise DictionaryError(f"{locale}.{ns}: top-level entries must be namespaces (objects)")
+            data = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+            atomic_write(out_dir / f"{ns}.json", data)
+            sizes[locale][ns] = len(data.encode("utf-8"))
+        for stale in out_dir.glob("*.json"):
+            if stale.stem not in tree:
+                os.remove(stale)
+    return sizes
+
+
+def namespaces(dictionaries: dict[str, dict]) -> list[str]:
+    """Every namespace of any locale, in first-seen order."""
+    return list(dict.fromkeys(ns for tree in dictionaries.values() for ns in tree))
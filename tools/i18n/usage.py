@@ -0,0 +1,76 @@
+"""Translation keys referenced from src/ and how they line up with the dictionaries.
+
+A key counts as used when it appears as ``t("ns.key")`` or as any string
+literal equal to a defined key (menu configs pass keys around before
+calling ``t``). ``t(`ns.${x}`)`` marks every key under ``ns.`` as used.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from tools.fs import REPO_ROOT, iter_files
+
+from .dictionaries import CONTEXT, flatten
+
+SRC = REPO_ROOT / "src"
+INCLUDE = ("*.ts", "*.tsx", "*.js", "*.jsx")
+
+# t("ns.key") or t(`ns.${...}`); starts with a literal so the regex engine can skip ahead
+_T_CALL = re.compile(r"""t\(\s*(['"`])([\w-]+(?:\.[\w-]+)*)(\.\$\{|\1)""")
+_IDENT_CHAR = re.compile(r"[\w$.]")
+
+
+@dataclass
+class Usage:
+    calls: dict[str, list[tuple[str, int]]] = field(default_factory=dict)  # key -> (path, line) of t() calls
+    literals: set[str] = field(default_factory=set)  # dotted string literals anywhere
+    prefixes: set[str] = field(default_factory=set)  # from t(`ns.${...}`)
+
+    def used(self, key: str) -> bool:
+        return key in self.calls or key in self.literals or any(key.startswith(p) for p in self.prefixes)
+
+
+def scan_usage(namespaces: Iterable[str], root: str | Path = SRC, skip: Path = CONTEXT) -> Usage:
+    """References under ``root``; plain string literals are only collected for ``namespaces``."""
+    root = Path(root)
+    usage = Usage()
+    alternatives = "|".join(re.escape(ns) for ns in sorted(namespaces, key=len, reverse=True))
+    literal = re.compile(rf"""(['"])((?:{alternatives})(?:\.[\w-]+)+)\1""") if alternatives else None
+    for rel in iter_files(root, INCLUDE):
+        path = root / rel
+        if path == skip:
+            continue
+        text = path.read_text(encoding="utf-8", errors="replace")
+        repo_rel = path.relative_to(REPO_ROOT).as_posix()
+        for m in _T_CALL.finditer(text):
+            if m.start() and _IDENT_CHAR.match(text, m.start() - 1):
+                continue  # e.g. format(...), this.t(...)
+            if m[3] != m[1]:
+                usage.prefixes.add(m[2] + ".")
+            elif "." in m[2]:
+                usage.calls.setdefault(m[2], []).append((repo_rel, text.count("\n", 0, m.start()) + 1))
+        if literal is not None:
+            usage.literals.update(m[2] for m in literal.finditer(text))
+    return usage
+
+
+@dataclass
+class KeyReport:
+    unused: list[str]  # defined in the fallback locale, never referenced
+    undefined: dict[str, list[tuple[str, int]]]  # called with t() but defined in no locale
+    missing: dict[str, list[str]]  # locale -> keys other locales define and it lacks
+
+
+def check(dictionaries: dict[str, dict], usage: Usage) -> KeyReport:
+    flat = {locale: flatten(tree) for locale, tree in dictionaries.items()}
+    defined = {key for keys in flat.values() for key in keys}
+    first = next(iter(flat.values()), {})
+    unused = [key for key in first if not usage.used(key)]
+    undefined = {key: sites for key, sites in sorted(usage.calls.items()) if key not in defined}
+    order = list(dict.fromkeys(key for keys in flat.values() for key in keys))
+    missing = {locale: [key for key in order if key not in keys] for locale, keys in flat.items()}
+    return KeyReport(unused, undefined, {locale: keys for locale, keys in missing.items() if keys})
@@ -0,0 +1,25 @@
+"""Streaming readers for the build, lint and history dumps at the repo root.
+
+    python -m tools.ingest detect FILE...
+    python -m tools.ingest transcode SRC [-o DST]
+    python -m tools.ingest lint FILE [--summary]
+"""
+
+from .eslint import ERROR, WARNING, LintMessage, is_stylish_line, iter_json, iter_lint, iter_stylish, repo_path
+from .text import detect, iter_chunks, open_text, sniff, transcode
+
+__all__ = [
+    "ERROR",
+    "WARNING",
+    "LintMessage",
+    "detect",
+    "is_stylish_line",
+    "iter_chunks",
+    "iter_json",
+    "iter_lint",
+    "iter_stylish",
+    "open_text",
+    "repo_path",
+    "sniff",
+    "transcode",
+]
@@ -0,0 +1,47 @@
+import argparse
+import sys
+from collections import Counter
+
+from .eslint import iter_lint
+from .text import detect, transcode
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.ingest")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("detect", help="print each file's detected encoding")
+    p.add_argument("files", nargs="+")
+
+    p = sub.add_parser("transcode", help="stream a file to UTF-8")
+    p.add_argument("src")
+    p.add_argument("-o", "--output", help="default: stdout")
+    p.add_argument("--crlf", action="store_true", help="keep CRLF line endings")
+
+    p = sub.add_parser("lint", help="ESLint report (JSON or stylish) as TSV records")
+    p.add_argument("file")
+    p.add_argument("--summary", action="store_true", help="counts per rule instead of records")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "detect":
+        for path in args.files:
+            print(f"{detect(path)}\t{path}")
+        return 0
+
+    if args.command == "transcode":
+        transcode(args.src, args.output or sys.stdout.buffer, crlf=args.crlf)
+        return 0
+
+    if args.summary:
+        rules = Counter((m.rule or "(parse)", m.level) for m in iter_lint(args.file))
+        for (rule, level), n in rules.most_common():
+            print(f"{n}\t{level}\t{rule}")
+        return 0
+    for m in iter_lint(args.file):
+        print(f"{m.file}\t{m.line}\t{m.column}\t{m.level}\t{m.rule or ''}\t{m.message}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
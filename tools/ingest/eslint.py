@@ -0,0 +1,140 @@
+"""ESLint output as typed records, one message at a time.
+
+Handles both formats found in the repo: the JSON formatter
+(``lint_errors.json``: one huge line, parsed incrementally with
+tools.jsonstream) and the default "stylish" text report (``lint-err.log``,
+``lint_output.txt``, ...). File paths are made repo-relative, since the
+dumps were taken on a Windows checkout.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator
+
+from tools.fs import REPO_ROOT
+from tools.jsonstream import JsonReader
+
+from .text import open_text
+
+ERROR, WARNING = 2, 1
+_SEVERITIES = {"error": ERROR, "warning": WARNING}
+
+_STYLISH = re.compile(
+    r"^\s+(\d+):(\d+)\s+(error|warning)\s+(.+?)(?:\s{2,}(@?[\w-]+(?:/[\w-]+)*))?\s*$"
+)
+# "✖ 12 problems (...)"; the mark is often mojibake in PowerShell captures
+_SUMMARY = re.compile(r"^\S{0,4}\s*\d+ problems? \(")
+# Stylish prints absolute paths; anything else at column 0 is message detail or a code frame
+_FILE_HEADER = re.compile(r"^(?:[A-Za-z]:)?[\\/](?!.*:\d+:\d+$)")
+
+
+@dataclass(frozen=True, slots=True)
+class LintMessage:
+    file: str
+    rule: str | None  # None for parse errors
+    severity: int  # 2 = error, 1 = warning, as in ESLint
+    line: int
+    column: int
+    message: str
+
+    @property
+    def level(self) -> str:
+        return "error" if self.severity == ERROR else "warning"
+
+
+# Folder names of the checkouts the dumps were captured in
+CHECKOUT_DIRS = frozenset({REPO_ROOT.name, "motoroil"})
+
+
+@lru_cache(maxsize=None)
+def _top_level() -> frozenset[str]:
+    return frozenset(os.listdir(REPO_ROOT))
+
+
+@lru_cache(maxsize=1 << 16)
+def repo_path(path: str) -> str:
+    """Map an absolute (often Windows) path to a posix path relative to the repo root.
+
+    The root is the last checkout folder in the path or, failing that, the
+    first component naming a top-level entry of this tree; paths matching
+    neither are returned with ``/`` separators.
+    """
+    parts = [p for p in re.split(r"[\\/]+", path) if p]
+    for i in range(len(parts) - 2, -1, -1):
+        if parts[i] in CHECKOUT_DIRS:
+            return "/".join(parts[i + 1:])
+    for i, part in enumerate(parts):
+        if part in _top_level():
+            return "/".join(parts[i:])
+    return "/".join(parts)
+
+
+def iter_json(path: str | os.PathLike) -> Iterator[LintMessage]:
+    """Messages from an ESLint ``--format json`` report."""
+    with open_text(path) as f:
+        r = JsonReader(f)
+        r.expect("[")
+        if r.peek() == "]":
+            return
+        while True:
+            r.expect("{")
+            file = ""
+            if r.peek() != "}":
+                while True:
+                    key = r.key()
+                    if key == "filePath":
+                        file = repo_path(r.value())
+                    elif key == "messages" and r.peek() == "[":
+                        r.expect("[")
+                        if r.peek() != "]":
+                            while True:
+                                m = r.value()
+                                yield LintMessage(
+                                    file, m.get("ruleId"), m.get("severity", ERROR),
+                                    m.get("line", 0), m.get("column", 0), m.get("message", ""),
+                                )
+                                if not r.comma_or("]"):
+                                    break
+                        else:
+                            r.pos += 1
+                    else:
+                        r.value()
+                    if not r.comma_or("}"):
+                        break
+            else:
+                r.pos += 1
+            if not r.comma_or("]"):
+                break
+
+
+def is_stylish_line(line: str) -> bool:
+    """True for a message line of the default text formatter (``  12:5  error  ...``)."""
+    return _STYLISH.match(line) is not None
+
+
+def iter_stylish(path: str | os.PathLike) -> Iterator[LintMessage]:
+    """Messages from the default text formatter."""
+    file = None
+    with open_text(path) as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line.strip() or line.startswith(">") or _SUMMARY.match(line):
+                continue
+            m = _STYLISH.match(line)
+            if m:
+                if file is not None:
+                    ln, col, level, message, rule = m.groups()
+                    yield LintMessage(file, rule, _SEVERITIES[level], int(ln), int(col), message)
+            elif _FILE_HEADER.match(line):
+                file = repo_path(line.strip())
+
+
+def iter_lint(path: str | os.PathLike) -> Iterator[LintMessage]:
+    """Messages from either format, chosen by the first non-blank character."""
+    with open_text(path) as f:
+        head = f.read(256).lstrip()
+    return iter_json(path) if head.startswith("[") else iter_stylish(path)
@@ -0,0 +1,41 @@
+"""Pick the right parser for a lint or type-check dump by looking at its content."""
+
+from __future__ import annotations
+
+import os
+from itertools import islice
+from typing import Iterator
+
+from .eslint import LintMessage, is_stylish_line, iter_json, iter_stylish
+from .text import open_text
+from .tsc import TSC_LINE, iter_tsc
+
+ESLINT, TSC = "eslint", "tsc"
+
+_SNIFF_LINES = 400
+
+
+def report_kind(path: str | os.PathLike) -> str | None:
+    """``"eslint"``, ``"tsc"`` or None when the first lines look like neither."""
+    with open_text(path) as f:
+        lines = list(islice(f, _SNIFF_LINES))
+    if lines and lines[0].lstrip().startswith("[{"):
+        return ESLINT
+    for line in lines:
+        line = line.rstrip("\n")
+        if TSC_LINE.match(line):
+            return TSC
+        if is_stylish_line(line) or line.strip() == "> eslint":
+            return ESLINT
+    return None
+
+
+def iter_report(path: str | os.PathLike, kind: str | None = None) -> Iterator[LintMessage]:
+    kind = kind or report_kind(path)
+    if kind == TSC:
+        return iter_tsc(path)
+    if kind == ESLINT:
+        with open_text(path) as f:
+            json_report = f.read(64).lstrip().startswith("[")
+        return iter_json(path) if json_report else iter_stylish(path)
+    return iter(())
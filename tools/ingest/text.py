@@ -0,0 +1,100 @@
+"""BOM-aware, streaming text access for the build and history dumps.
+
+Many root artifacts (lint-err.log, lint_errors.json, gitlog.txt, ...) were
+captured by PowerShell and are UTF-16LE with CRLF; others are plain UTF-8.
+``open_text`` picks the codec from the byte-order mark and returns a text
+stream decoded incrementally, so callers read lines or chunks without
+loading the file or guessing its encoding.
+"""
+
+from __future__ import annotations
+
+import codecs
+import io
+import os
+from contextlib import nullcontext
+from typing import BinaryIO, Iterator
+
+CHUNK = 1 << 16
+
+# Longest marks first: the UTF-32LE mark starts with the UTF-16LE one
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+
+
+def sniff(head: bytes) -> tuple[str, int]:
+    """Return ``(encoding, bom_length)`` for a file starting with ``head``.
+
+    Without a BOM, text with NULs in every other byte is taken as UTF-16,
+    anything else as UTF-8.
+    """
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding, len(bom)
+    sample = head[:4096]
+    if len(sample) >= 4:
+        if sample[1::2].count(0) > len(sample) // 4 and not sample[0::2].count(0):
+            return "utf-16-le", 0
+        if sample[0::2].count(0) > len(sample) // 4 and not sample[1::2].count(0):
+            return "utf-16-be", 0
+    return "utf-8", 0
+
+
+def detect(path: str | os.PathLike) -> str:
+    with open(path, "rb") as f:
+        return sniff(f.read(4096))[0]
+
+
+def _open_binary(path: str | os.PathLike) -> tuple[BinaryIO, str]:
+    f = open(path, "rb")
+    encoding, skip = sniff(f.read(4096))
+    f.seek(skip)
+    return f, encoding
+
+
+def open_text(path: str | os.PathLike, newline: str | None = None, errors: str = "replace") -> io.TextIOWrapper:
+    """Text stream over ``path`` in its detected encoding, without the BOM.
+
+    ``newline=None`` folds CRLF to ``\\n``; pass ``""`` to keep line endings.
+    """
+    f, encoding = _open_binary(path)
+    return io.TextIOWrapper(f, encoding=encoding, errors=errors, newline=newline)
+
+
+def iter_chunks(path: str | os.PathLike, chunk: int = CHUNK, errors: str = "replace") -> Iterator[str]:
+    """Decoded text in pieces of at most ``chunk`` bytes of input."""
+    f, encoding = _open_binary(path)
+    decoder = codecs.getincrementaldecoder(encoding)(errors)
+    with f:
+        while True:
+            data = f.read(chunk)
+            text = decoder.decode(data, final=not data)
+            if text:
+                yield text
+            if not data:
+                return
+
+
+def transcode(src: str | os.PathLike, dst: str | os.PathLike | BinaryIO, crlf: bool = False,
+              chunk: int = CHUNK) -> int:
+    """Stream ``src`` into ``dst`` as UTF-8 without BOM; returns bytes written.
+
+    ``dst`` is a path, or a binary stream (such as ``sys.stdout.buffer``)
+    that is written to but left open. Line endings become ``\\n`` unless
+    ``crlf`` is set.
+    """
+    written = 0
+    target = nullcontext(dst) if hasattr(dst, "write") else open(dst, "wb")
+    with open_text(src, newline=None if not crlf else "") as f, target as out:
+        while True:
+            text = f.read(chunk)
+            if not text:
+                return written
+            data = text.encode("utf-8")
+            out.write(data)
+            written += len(data)
@@ -0,0 +1,43 @@
+"""TypeScript compiler (``tsc --noEmit``) error dumps as LintMessage records.
+
+Both output styles are understood: ``file(line,col): error TS2307: ...``
+and the ``--pretty`` form ``file:line:col - error TS2307: ...``. The TS
+code is used as the rule.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from typing import Iterator
+
+from .eslint import ERROR, WARNING, LintMessage, repo_path
+from .text import open_text
+
+TSC_LINE = re.compile(
+    r"^(?P<file>\S.*?)(?:\((?P<line>\d+),(?P<col>\d+)\)|:(?P<pline>\d+):(?P<pcol>\d+) -)"
+    r":? (?P<level>error|warning) (?P<code>TS\d+): (?P<message>.*)$"
+)
+
+
+def parse_line(line: str) -> LintMessage | None:
+    m = TSC_LINE.match(line.rstrip("\r\n"))
+    if not m:
+        return None
+    return LintMessage(
+        repo_path(m["file"].strip()),
+        m["code"],
+        ERROR if m["level"] == "error" else WARNING,
+        int(m["line"] or m["pline"]),
+        int(m["col"] or m["pcol"]),
+        m["message"],
+    )
+
+
+def iter_tsc(path: str | os.PathLike) -> Iterator[LintMessage]:
+    """Diagnostics in file order; continuation lines of multi-line messages are skipped."""
+    with open_text(path) as f:
+        for line in f:
+            msg = parse_line(line)
+            if msg is not None:
+                yield msg
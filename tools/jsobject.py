@@ -0,0 +1,206 @@
+"""Reader for JavaScript/TypeScript object and array literals in source text.
+
+Not a JS parser: it walks brackets, strings, template literals and
+comments well enough to turn object literals into dicts and arrays into
+lists, keeping every other value as its source text. Used to read Prisma
+query arguments and inline dictionaries out of the TS tree.
+"""
+
+from __future__ import annotations
+
+import re
+
+_KEY = re.compile(r"[\w$]+")
+_ESCAPES = {"n": "\n", "r": "\r", "t": "\t", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+_ESCAPE = re.compile(r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|.)", re.S)
+
+
+class JsReader:
+    """Just enough of JS expressions to walk object literals.
+
+    Objects become dicts and arrays lists; any other value is kept as its
+    source text. Spreads are stored under ``"...name"`` keys.
+    """
+
+    _CLOSE = {"(": ")", "[": "]", "{": "}"}
+
+    def __init__(self, text: str, pos: int = 0):
+        self.text = text
+        self.pos = pos
+
+    def skip(self) -> None:
+        text = self.text
+        n = len(text)
+        while self.pos < n:
+            ch = text[self.pos]
+            if ch.isspace():
+                self.pos += 1
+            elif text.startswith("//", self.pos):
+                end = text.find("\n", self.pos)
+                self.pos = n if end < 0 else end + 1
+            elif text.startswith("/*", self.pos):
+                end = text.find("*/", self.pos + 2)
+                self.pos = n if end < 0 else end + 2
+            else:
+                return
+
+    def string(self) -> str:
+        quote = self.text[self.pos]
+        i = self.pos + 1
+        text = self.text
+        while i < len(text):
+            ch = text[i]
+            if ch == "\\":
+                i += 2
+                continue
+            if quote == "`" and text.startswith("${", i):
+                self.pos = i + 1
+                self.balanced()
+                i = self.pos
+                continue
+            if ch == quote:
+                break
+            i += 1
+        start, self.pos = self.pos, i + 1
+        return text[start:self.pos]
+
+    def balanced(self) -> str:
+        """Skip a bracketed expression starting at ``pos``; returns its source."""
+        start = self.pos
+        stack = [self._CLOSE[self.text[self.pos]]]
+        self.pos += 1
+        while stack and self.pos < len(self.text):
+            self.skip()
+            if self.pos >= len(self.text):
+                break
+            ch = self.text[self.pos]
+            if ch in "'\"`":
+                self.string()
+                continue
+            if ch in self._CLOSE:
+                stack.append(self._CLOSE[ch])
+            elif ch == stack[-1]:
+                stack.pop()
+            self.pos += 1
+        return self.text[start:self.pos]
+
+    def value(self):
+        self.skip()
+        if self.pos >= len(self.text):
+            return ""
+        ch = self.text[self.pos]
+        if ch == "{":
+            return self.object()
+        if ch == "[":
+            return self.array()
+        start = self.pos
+        while self.pos < len(self.text):
+            self.skip()
+            if self.pos >= len(self.text):
+                break
+            ch = self.text[self.pos]
+            if ch in ",}])":
+                break
+            if ch in "'\"`":
+                self.string()
+            elif ch in "({[":
+                self.balanced()
+            else:
+                self.pos += 1
+        return self.text[start:self.pos].strip()
+
+    def array(self) -> list:
+        self.pos += 1
+        out = []
+        while True:
+            self.skip()
+            if self.pos >= len(self.text) or self.text[self.pos] == "]":
+                self.pos += 1
+                return out
+            if self.text[self.pos] == ",":
+                self.pos += 1
+                continue
+            if self.text.startswith("...", self.pos):
+                self.pos += 3
+            start = self.pos
+            out.append(self.value())
+            if self.pos == start:  # a stray closer; give up on this array
+                return out
+
+    def object(self) -> dict:
+        self.pos += 1
+        out: dict = {}
+        text = self.text
+        while True:
+            self.skip()
+            if self.pos >= len(text):
+                return out
+            ch = text[self.pos]
+            if ch == "}":
+                self.pos += 1
+                return out
+            if ch == ",":
+                self.pos += 1
+                continue
+            if text.startswith("...", self.pos):
+                self.pos += 3
+                out["..." + str(self.value())] = None
+                continue
+            if ch in "'\"":
+                key = self.string()[1:-1]
+            elif ch == "[":
+                key = self.balanced()  # computed key
+            else:
+                m = _KEY.match(text, self.pos)
+                if not m:
+                    # Something this reader does not model; skip it or give up on this object
+                    start = self.pos
+                    self.value()
+                    if self.pos == start:
+                        return out
+                    continue
+                key = m[0]
+                self.pos = m.end()
+            self.skip()
+            if self.pos < len(text) and text[self.pos] == ":":
+                self.pos += 1
+                out[key] = self.value()
+            elif self.pos < len(text) and text[self.pos] == "(":
+                self.balanced()  # method shorthand
+                self.skip()
+                if self.pos < len(text) and text[self.pos] == "{":
+                    self.balanced()
+                out[key] = ""
+            else:
+                out[key] = key  # shorthand property
+
+
+def read_value(text: str, pos: int = 0):
+    """The JS value starting at ``text[pos]`` (an object literal becomes a dict)."""
+    return JsReader(text, pos).value()
+
+
+def is_string(value) -> bool:
+    """Whether a value from the reader is a plain string literal (not a template with ``${}``)."""
+    return (
+        isinstance(value, str) and len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"`"
+        and not (value[0] == "`" and "${" in value)
+    )
+
+
+def js_string(literal: str) -> str:
+    """The value of a JS string literal given with its quotes."""
+    if not is_string(literal):
+        raise ValueError(f"not a string literal: {literal[:40]!r}")
+
+    def unescape(m: re.Match) -> str:
+        e = m[1]
+        if e[0] == "u":
+            return chr(int(e[2:-1] if e[1] == "{" else e[1:], 16))
+        if e[0] == "x":
+            return chr(int(e[1:], 16))
+        if e in ("\n", "\r\n", "\r"):
+            return ""  # line continuation
+        return _ESCAPES.get(e, e)
+
+    return _ESCAPE.sub(unescape, literal[1:-1])
@@ -0,0 +1,118 @@
+"""Incremental JSON reading from a text stream.
+
+``JsonReader`` walks containers token by token and decodes one value at a
+time with ``json.JSONDecoder.raw_decode``, so memory is bounded by the
+largest single value plus the read buffer, whatever the document size.
+Callers drive it with the structure they expect::
+
+    r = JsonReader(f)
+    r.expect("[")
+    if r.peek() != "]":
+        while True:
+            handle(r.value())
+            if not r.comma_or("]"):
+                break
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+CHUNK = 1 << 16
+
+_decoder = json.JSONDecoder()
+_WS = " \t\r\n"
+
+
+class JsonStreamError(ValueError):
+    pass
+
+
+class JsonReader:
+    def __init__(self, f, chunk: int = CHUNK, track: bool = False):
+        self.f = f
+        self.chunk = chunk
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        # With ``track`` every consumed character is kept until take() returns it
+        self.track = track
+        self.mark = 0
+        self.carry = ""
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        # Grow reads with the pending text so a huge record costs O(n), not O(n^2)
+        data = self.f.read(max(self.chunk, len(self.buf) - self.pos))
+        if not data:
+            self.eof = True
+            return False
+        if self.track:
+            self.carry += self.buf[self.mark:self.pos]
+            self.mark = 0
+        # Drop the consumed prefix so the buffer only holds unread text
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def take(self) -> str:
+        """Text consumed since the previous take() (tracking readers only)."""
+        text = self.carry + self.buf[self.mark:self.pos]
+        self.carry = ""
+        self.mark = self.pos
+        return text
+
+    def rest(self) -> str:
+        """Everything not yet consumed, through end of file."""
+        text = self.buf[self.pos:] + self.f.read()
+        self.pos = len(self.buf)
+        return text
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WS:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, ch: str) -> None:
+        got = self.peek()
+        if got != ch:
+            raise JsonStreamError(f"expected {ch!r}, found {got!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number (or literal) touching the buffer end may continue in the next chunk
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+    def key(self) -> str:
+        key = self.value()
+        if not isinstance(key, str):
+            raise JsonStreamError(f"expected an object key, found {key!r}")
+        self.expect(":")
+        return key
+
+    def comma_or(self, closer: str) -> bool:
+        """Consume ``,`` (returns True) or ``closer`` (returns False)."""
+        ch = self.peek()
+        self.pos += 1
+        if ch == ",":
+            return True
+        if ch == closer:
+            return False
+        raise JsonStreamError(f"expected ',' or {closer!r}, found {ch!r}")
@@ -0,0 +1,10 @@
+"""Indexed history of lint and type-check dumps: hotspots and per-rule trends.
+
+    python -m tools.lintdb ingest [DUMP...]
+    python -m tools.lintdb top [--kind eslint|tsc] [-n 50]
+    python -m tools.lintdb trend [--kind eslint|tsc] [RULE]
+"""
+
+from .store import DEFAULT_SOURCES, IngestResult, LintStore, default_sources
+
+__all__ = ["DEFAULT_SOURCES", "IngestResult", "LintStore", "default_sources"]
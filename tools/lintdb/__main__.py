@@ -0,0 +1,66 @@
+import argparse
+import sys
+import time
+from collections import defaultdict
+
+from tools.ingest.reports import ESLINT, TSC
+
+from .store import DEFAULT_PATH, LintStore, default_sources
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.lintdb")
+    parser.add_argument("--db", default=str(DEFAULT_PATH))
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("ingest", help="add new or changed dumps")
+    p.add_argument("dumps", nargs="*", help="default: lint/tsc dumps at the repo root")
+
+    p = sub.add_parser("top", help="files with the most new problems since the previous run")
+    p.add_argument("--kind", choices=[ESLINT, TSC], default=ESLINT)
+    p.add_argument("-n", type=int, default=50)
+    p.add_argument("--warnings", action="store_true", help="count warnings too")
+    p.add_argument("--run", help="dump to treat as current (default: latest)")
+    p.add_argument("--base", help="dump to compare against (default: the run before)")
+
+    p = sub.add_parser("trend", help="problem counts per rule across runs")
+    p.add_argument("rule", nargs="?")
+    p.add_argument("--kind", choices=[ESLINT, TSC], default=ESLINT)
+    p.add_argument("--rules", type=int, default=8, help="rules shown when no rule is given")
+
+    p = sub.add_parser("runs", help="list runs in order")
+    p.add_argument("--kind", choices=[ESLINT, TSC])
+
+    args = parser.parse_args(argv)
+
+    with LintStore(args.db) as store:
+        t0 = time.perf_counter()
+        if args.command == "ingest":
+            for r in store.ingest(args.dumps or default_sources()):
+                detail = f" ({r.kind}, {r.messages} messages)" if r.status in ("new", "changed") else ""
+                print(f"{r.status:12} {r.source}{detail}")
+        elif args.command == "runs":
+            for seq, source, kind, messages in store.runs(args.kind):
+                print(f"{seq:4}  {kind:6} {messages:6}  {source}")
+        elif args.command == "top":
+            rows = store.top_new(args.kind, args.n, 1 if args.warnings else 2, args.run, args.base)
+            for path, new, total in rows:
+                print(f"{new:6} new {total:6} total  {path}")
+        else:
+            table: dict[str, dict[int, int]] = defaultdict(dict)
+            runs: dict[int, str] = {}
+            for seq, source, rule, n in store.trend(args.kind, args.rule):
+                table[rule][seq] = n
+                runs[seq] = source
+            ranked = sorted(table, key=lambda r: -sum(table[r].values()))[: None if args.rule else args.rules]
+            for seq, source in sorted(runs.items()):
+                counts = "  ".join(f"{table[r].get(seq, 0):5}" for r in ranked)
+                print(f"{seq:4}  {counts}  {source}")
+            for i, rule in enumerate(ranked):
+                print(f"  col {i + 1}: {rule}")
+        print(f"{(time.perf_counter() - t0) * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
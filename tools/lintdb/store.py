@@ -0,0 +1,225 @@
+"""SQLite store of lint and type-check runs, keyed by run, file and rule.
+
+Each dump (an ESLint report or a ``tsc`` error list) becomes a run. Only
+per-(run, file, rule, severity) counts are kept, which is all the hotspot
+and trend queries need and keeps them index lookups. Ingest is
+incremental: a dump whose size and mtime are unchanged is skipped without
+being read, and one whose content changed replaces its run and becomes the
+newest run of its kind.
+
+Runs are ordered by ``seq``. A first bulk ingest assigns it by file mtime
+(then name); every later new or changed dump goes to the end.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from tools.fs import REPO_ROOT
+from tools.ingest.reports import iter_report, report_kind
+
+DEFAULT_PATH = REPO_ROOT / ".cache" / "lint.sqlite"
+
+# Root-level dumps picked up by default
+DEFAULT_SOURCES = (
+    "lint*.txt", "lint*.log", "lint*.json", "eslint*.txt", "eslint*.log",
+    "*tsc*.txt", "*tsc*.log", "*_errors*.txt", "ts_err*.txt", "ts-err*.txt",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL UNIQUE,
+    kind TEXT,
+    seq INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    digest BLOB NOT NULL,
+    messages INTEGER NOT NULL,
+    ingested REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS rules (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS counts (
+    run_id INTEGER NOT NULL,
+    file_id INTEGER NOT NULL,
+    rule_id INTEGER NOT NULL,
+    severity INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (run_id, file_id, rule_id, severity)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS counts_rule ON counts (rule_id, run_id);
+CREATE INDEX IF NOT EXISTS runs_kind ON runs (kind, seq);
+"""
+
+# Parse errors have no rule id
+NO_RULE = "(none)"
+
+
+@dataclass
+class IngestResult:
+    source: str
+    status: str  # "new", "changed", "unchanged" or "unrecognized"
+    kind: str | None = None
+    messages: int = 0
+
+
+def _digest(path: Path) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.digest()
+
+
+class LintStore:
+    def __init__(self, path: str | Path = DEFAULT_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.executescript(_SCHEMA)
+
+    def __enter__(self) -> "LintStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.db.commit()
+        self.db.close()
+
+    def _id(self, table: str, column: str, value: str, cache: dict[str, int]) -> int:
+        i = cache.get(value)
+        if i is None:
+            self.db.execute(f"INSERT OR IGNORE INTO {table} ({column}) VALUES (?)", (value,))
+            i = cache[value] = self.db.execute(f"SELECT id FROM {table} WHERE {column} = ?", (value,)).fetchone()[0]
+        return i
+
+    def ingest(self, paths: Iterable[str | Path], root: str | Path = REPO_ROOT) -> list[IngestResult]:
+        root = Path(root)
+        todo = []
+        for path in paths:
+            path = Path(path)
+            st = path.stat()
+            try:
+                source = path.resolve().relative_to(root.resolve()).as_posix()
+            except ValueError:
+                source = str(path.resolve())
+            todo.append((st.st_mtime_ns, source, path, st))
+        results = []
+        files: dict[str, int] = {}
+        rules: dict[str, int] = {}
+        # Oldest first, so a bulk ingest numbers runs in capture order
+        for mtime_ns, source, path, st in sorted(todo):
+            row = self.db.execute("SELECT id, mtime_ns, size, digest FROM runs WHERE source = ?", (source,)).fetchone()
+            if row and (row[1], row[2]) == (mtime_ns, st.st_size):
+                results.append(IngestResult(source, "unchanged"))
+                continue
+            digest = _digest(path)
+            if row and row[3] == digest:
+                self.db.execute("UPDATE runs SET mtime_ns = ?, size = ? WHERE id = ?", (mtime_ns, st.st_size, row[0]))
+                results.append(IngestResult(source, "unchanged"))
+                continue
+            kind = report_kind(path)
+            counts: Counter = Counter()
+            for m in iter_report(path, kind):
+                counts[(m.file, m.rule or NO_RULE, m.severity)] += 1
+            seq = self.db.execute("SELECT COALESCE(MAX(seq), 0) + 1 FROM runs").fetchone()[0]
+            values = (kind, seq, mtime_ns, st.st_size, digest, sum(counts.values()), time.time())
+            if row:
+                run_id = row[0]
+                self.db.execute("DELETE FROM counts WHERE run_id = ?", (run_id,))
+                self.db.execute(
+                    "UPDATE runs SET kind = ?, seq = ?, mtime_ns = ?, size = ?, digest = ?, messages = ?, ingested = ?"
+                    " WHERE id = ?", (*values, run_id),
+                )
+            else:
+                run_id = self.db.execute(
+                    "INSERT INTO runs (source, kind, seq, mtime_ns, size, digest, messages, ingested)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)", (source, *values),
+                ).lastrowid
+            self.db.executemany(
+                "INSERT INTO counts (run_id, file_id, rule_id, severity, n) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (run_id, self._id("files", "path", f, files), self._id("rules", "name", r, rules), sev, n)
+                    for (f, r, sev), n in counts.items()
+                ],
+            )
+            self.db.commit()
+            status = "unrecognized" if kind is None else "changed" if row else "new"
+            results.append(IngestResult(source, status, kind, sum(counts.values())))
+        self.db.commit()
+        return results
+
+    def runs(self, kind: str | None = None) -> list[tuple[int, str, str, int]]:
+        """``(seq, source, kind, messages)`` oldest first."""
+        sql = "SELECT seq, source, kind, messages FROM runs WHERE kind IS NOT NULL"
+        args: tuple = ()
+        if kind:
+            sql += " AND kind = ?"
+            args = (kind,)
+        return self.db.execute(sql + " ORDER BY seq", args).fetchall()
+
+    def _run_id(self, kind: str, source: str | None = None, before_seq: int | None = None) -> tuple[int, int] | None:
+        if source:
+            return self.db.execute("SELECT id, seq FROM runs WHERE source = ?", (source,)).fetchone()
+        sql = "SELECT id, seq FROM runs WHERE kind = ?"
+        args: list = [kind]
+        if before_seq is not None:
+            sql += " AND seq < ?"
+            args.append(before_seq)
+        return self.db.execute(sql + " ORDER BY seq DESC LIMIT 1", args).fetchone()
+
+    def top_new(self, kind: str = "eslint", limit: int = 50, min_severity: int = 2,
+                run: str | None = None, base: str | None = None) -> list[tuple[str, int, int]]:
+        """Files with the most new problems in ``run`` versus ``base`` (default: latest vs previous).
+
+        New means, per rule, how far the count grew. Returns ``(path, new, total)``.
+        """
+        cur = self._run_id(kind, run)
+        if cur is None:
+            return []
+        prev = self._run_id(kind, base, None if base else cur[1])
+        return self.db.execute(
+            """
+            WITH cur AS (
+                SELECT file_id, rule_id, SUM(n) AS n FROM counts
+                WHERE run_id = ? AND severity >= ? GROUP BY file_id, rule_id
+            ), prev AS (
+                SELECT file_id, rule_id, SUM(n) AS n FROM counts
+                WHERE run_id = ? AND severity >= ? GROUP BY file_id, rule_id
+            )
+            SELECT f.path, SUM(MAX(cur.n - COALESCE(prev.n, 0), 0)) AS new, SUM(cur.n) AS total
+            FROM cur LEFT JOIN prev USING (file_id, rule_id) JOIN files f ON f.id = cur.file_id
+            GROUP BY cur.file_id HAVING new > 0
+            ORDER BY new DESC, total DESC, f.path LIMIT ?
+            """,
+            (cur[0], min_severity, prev[0] if prev else -1, min_severity, limit),
+        ).fetchall()
+
+    def trend(self, kind: str = "eslint", rule: str | None = None,
+              min_severity: int = 1) -> list[tuple[int, str, str, int]]:
+        """``(seq, source, rule, count)`` per run, oldest first; all rules unless ``rule`` is given."""
+        sql = """
+            SELECT r.seq, r.source, ru.name, SUM(c.n)
+            FROM counts c JOIN runs r ON r.id = c.run_id JOIN rules ru ON ru.id = c.rule_id
+            WHERE r.kind = ? AND c.severity >= ?
+        """
+        args: list = [kind, min_severity]
+        if rule:
+            sql += " AND ru.name = ?"
+            args.append(rule)
+        return self.db.execute(sql + " GROUP BY r.id, ru.id ORDER BY r.seq, SUM(c.n) DESC", args).fetchall()
+
+
+def default_sources(root: str | Path = REPO_ROOT) -> list[Path]:
+    root = Path(root)
+    seen = {p for pattern in DEFAULT_SOURCES for p in root.glob(pattern) if p.is_file()}
+    return sorted(seen)
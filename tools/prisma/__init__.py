@@ -0,0 +1,21 @@
+"""Model/relation/index graph of the Prisma schema and its side files.
+
+    python -m tools.prisma fk-indexes
+    python -m tools.prisma chain Invoice.company.tenant
+    python -m tools.prisma paths Invoice Tenant
+    python -m tools.prisma compat OLD.prisma [--new NEW.prisma]
+    python -m tools.prisma advise [src/lib ...]
+"""
+
+from .advisor import Site, Suggestion, advise
+from .graph import (
+    Change, Hop, MissingIndex, SchemaCache, SchemaGraph, compare, default_files,
+)
+from .queries import Call, CallCache, extract_text, scan_calls
+from .schema import Enum, Field, Index, Model, Relation, SchemaError, SchemaFile, parse_schema, read_schema
+
+__all__ = [
+    "Call", "CallCache", "Change", "Enum", "Field", "Hop", "Index", "MissingIndex", "Model", "Relation",
+    "SchemaCache", "SchemaError", "SchemaFile", "SchemaGraph", "Site", "Suggestion", "advise", "compare",
+    "default_files", "extract_text", "parse_schema", "read_schema", "scan_calls",
+]
@@ -0,0 +1,107 @@
+import argparse
+import sys
+import time
+
+from .advisor import advise
+from .graph import DEFAULT_CACHE, SchemaCache, SchemaGraph, compare
+from .queries import DEFAULT_DIRS, CallCache, scan_calls
+from .schema import SchemaError
+
+
+def _hop(h) -> str:
+    arrow = "->*" if h.many else "->"
+    fk = f"{h.fk_model}({', '.join(h.fk)})" if h.fk else "join table"
+    return f"{h.model}.{h.field} {arrow} {h.target}  via {fk}{'' if h.indexed else '  [no index]'}"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.prisma")
+    parser.add_argument("--schema", action="append",
+                        help="schema file (repeatable; default: prisma/schema.prisma and its side files)")
+    parser.add_argument("--no-cache", action="store_true", help="parse every file")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("fk-indexes", help="foreign keys without an index")
+    sub.add_parser("conflicts", help="models defined differently in the schema and a side file")
+
+    p = sub.add_parser("chain", help="relations a dotted include path walks through")
+    p.add_argument("path", help="e.g. Invoice.company.tenant or invoice.company.tenant")
+
+    p = sub.add_parser("paths", help="relation chains between two models")
+    p.add_argument("source")
+    p.add_argument("target")
+    p.add_argument("--depth", type=int, default=3)
+    p.add_argument("-n", type=int, default=20)
+
+    p = sub.add_parser("advise", help="composite indexes suggested by Prisma calls in src/")
+    p.add_argument("dirs", nargs="*", help=f"repo-relative dirs to scan (default: {' '.join(DEFAULT_DIRS)})")
+    p.add_argument("--jobs", "-j", type=int, default=None, help="worker processes (default: CPU count)")
+    p.add_argument("-n", type=int, default=30)
+    p.add_argument("--sites", type=int, default=3, help="call sites listed per suggestion")
+
+    p = sub.add_parser("compat", help="changes from an old schema to the current (or a given) one")
+    p.add_argument("old", nargs="+", help="old schema file(s)")
+    p.add_argument("--new", action="append", help="new schema file(s) (default: the current graph)")
+    p.add_argument("--all", action="store_true", help="include informational changes")
+
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    cache = None if args.no_cache else SchemaCache(DEFAULT_CACHE)
+    try:
+        graph = SchemaGraph.load(args.schema, cache)
+        status = 0
+        if args.command == "fk-indexes":
+            missing = graph.missing_fk_indexes()
+            for m in missing:
+                print(f"{m.model}({', '.join(m.fields)})  -> {m.target} via {m.relation}  {m.source}:{m.line}")
+            print(f"{len(missing)} foreign keys without an index", file=sys.stderr)
+        elif args.command == "conflicts":
+            for name, kept, other in graph.conflicts:
+                print(f"{name}: {kept} differs from {other}")
+        elif args.command == "chain":
+            for hop in graph.resolve(args.path):
+                print(_hop(hop))
+        elif args.command == "paths":
+            for chain in graph.chains(args.source, args.target, args.depth, args.n):
+                print("\n    ".join(map(_hop, chain)))
+        elif args.command == "advise":
+            if cache is None:
+                calls = list(scan_calls(args.dirs or DEFAULT_DIRS, args.jobs))
+            else:
+                with CallCache(cache.path) as call_cache:
+                    calls = list(scan_calls(args.dirs or DEFAULT_DIRS, args.jobs, call_cache))
+            suggestions = advise(graph, calls)
+            for s in suggestions[:args.n]:
+                flag = "  (no usable index)" if s.unindexed else ""
+                print(f"{s.score:5}  {s.model} {s.directive()}  [{s.reason}, {len(s.sites)} calls]{flag}")
+                for site in s.sites[:args.sites]:
+                    print(f"{'':7}{site.path}:{site.line}  {site.operation}")
+                if len(s.sites) > args.sites:
+                    print(f"{'':7}... {len(s.sites) - args.sites} more")
+            print(f"{len(calls)} calls, {len(suggestions)} suggestions", file=sys.stderr)
+        else:
+            old = SchemaGraph.load(args.old, cache)
+            new = SchemaGraph.load(args.new, cache) if args.new else graph
+            changes = compare(old, new)
+            for c in changes:
+                if c.severity != "info" or args.all:
+                    print(f"{c.severity:9} {c.model}{'.' + c.field if c.field else ''}: {c.message}")
+            breaking = sum(1 for c in changes if c.severity == "breaking")
+            print(f"{breaking} breaking, {sum(1 for c in changes if c.severity == 'warning')} warnings,"
+                  f" {sum(1 for c in changes if c.severity == 'info')} info", file=sys.stderr)
+            status = 1 if breaking else 0
+    except SchemaError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if cache is not None:
+            parsed = cache.parsed
+            cache.close()
+    print(f"{(time.perf_counter() - t0) * 1000:.0f} ms"
+          + (f", {parsed} files parsed" if cache is not None else ""), file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""Composite index suggestions from Prisma call sites checked against the schema graph.
+
+For each call the candidate index follows the usual equality, sort, range
+order: the columns compared for equality (ordered so the ones most calls
+filter on lead), then any ``: null`` columns (soft-delete flags, too
+unselective to lead), then the ``orderBy`` columns, then the first range
+column. An OR whose branches each compare a column for equality gives one
+candidate per branch, each with the equality columns AND'ed around the
+OR. Calls that hit an id or unique key, or that an existing index already
+serves, are dropped. Included or filtered relations whose join has to
+search the child side by a foreign key without an index produce a join
+suggestion on the child.
+
+Suggestions are grouped per model and column set, a suggestion whose
+columns extend another's absorbs it, and the rest are ranked by a score
+summed over call sites: list and aggregate reads weigh more than point
+reads, and calls no index helps at all count three times.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from .graph import SchemaGraph
+from .queries import Call
+from .schema import Model
+
+OPERATION_WEIGHT = {
+    "findMany": 3, "count": 2, "aggregate": 2, "groupBy": 2, "findFirst": 2, "findFirstOrThrow": 2,
+    "updateMany": 2, "deleteMany": 2,
+}
+UNINDEXED_FACTOR = 3
+
+
+@dataclass(frozen=True, slots=True)
+class Site:
+    path: str
+    line: int
+    operation: str
+
+
+@dataclass
+class Suggestion:
+    model: str
+    equals: frozenset[str]
+    rest: tuple[str, ...]  # sort columns, then at most one range column
+    reason: str  # "filter" or "join"
+    score: int = 0
+    unindexed: bool = False  # no existing index helps any of the calls
+    sites: list[Site] = field(default_factory=list)
+    columns: tuple[str, ...] = ()  # final column order, set by ``advise``
+
+    def directive(self) -> str:
+        return f"@@index([{', '.join(self.columns)}])"
+
+
+def _columns(model: Model, names: Iterable[str]) -> list[str]:
+    """Scalar columns of ``model`` among ``names``; ``compound_key.column`` becomes ``column``."""
+    out = []
+    for name in names:
+        head, _, sub = name.partition(".")
+        if sub:
+            f = model.fields.get(head)
+            if f is not None and not f.scalar:
+                continue  # nested filter on a relation; handled as a join
+            name = sub
+        f = model.fields.get(name)
+        if f is not None and f.scalar and not f.is_list and name not in out:
+            out.append(name)
+    return out
+
+
+def _unique_hit(model: Model, equals: set[str]) -> bool:
+    if any(model.fields[c].id or model.fields[c].unique for c in equals):
+        return True
+    return any(i.kind in ("unique", "id") and set(i.fields) <= equals for i in model.indexes)
+
+
+def _best_prefix(graph: SchemaGraph, model: Model, equals: set[str], rest: tuple[str, ...]) -> tuple[bool, bool]:
+    """``(covered, helped)``: an index serves the equality set and the first sort/range
+    column, or at least one of its leading columns is usable."""
+    helped = False
+    for index in model.indexes:
+        cols = index.fields
+        lead = set(cols[:len(equals)])
+        if equals and lead == equals and (not rest or (len(cols) > len(equals) and cols[len(equals)] == rest[0])):
+            return True, True
+        if not equals and rest and cols[0] == rest[0]:
+            return True, True
+        if cols and (cols[0] in equals or (rest and cols[0] == rest[0])):
+            helped = True
+    if not helped:
+        helped = any(graph.indexed(model, [c]) for c in equals)
+    return False, helped
+
+
+def advise(graph: SchemaGraph, calls: Iterable[Call]) -> list[Suggestion]:
+    groups: dict[tuple, Suggestion] = {}
+    usage: dict[str, Counter] = defaultdict(Counter)
+
+    def add(model: Model, equals: frozenset[str], rest: tuple[str, ...], reason: str, site: Site,
+            unindexed: bool) -> None:
+        key = (model.name, equals, rest, reason)
+        s = groups.get(key)
+        if s is None:
+            s = groups[key] = Suggestion(model.name, equals, rest, reason, unindexed=True)
+        weight = OPERATION_WEIGHT.get(site.operation, 1)
+        s.score += weight * (UNINDEXED_FACTOR if unindexed else 1)
+        s.unindexed = s.unindexed and unindexed
+        s.sites.append(site)
+        usage[model.name].update(equals)
+
+    for call in calls:
+        model = graph.by_client_name(call.delegate)
+        if model is None:
+            continue
+        site = Site(call.path, call.line, call.operation)
+        for name in call.joins:
+            f = model.fields.get(name)
+            hop = graph.hop(model, f) if f is not None and not f.scalar else None
+            if hop is not None and not hop.indexed and hop.fk_model == hop.target:
+                add(graph.models[hop.target], frozenset(hop.fk), (), "join", site, True)
+        base = _columns(model, call.equals)
+        branches = [_columns(model, b) for b in call.branches]
+        # An OR whose every branch pins a column is served by one index per branch
+        candidates = [set(base) | set(b) for b in branches] if branches and all(branches) else [set(base)]
+        for equals in candidates:
+            if _unique_hit(model, equals):
+                continue
+            sought = [c for c in _columns(model, call.order) + _columns(model, call.ranges)[:1] if c not in equals]
+            if not equals and not sought:
+                continue  # nothing but IS NULL filters
+            nulls = [c for c in _columns(model, call.nulls) if c not in equals]
+            rest = tuple(dict.fromkeys(nulls + sought))
+            covered, helped = _best_prefix(graph, model, equals, rest)
+            if not covered:
+                add(model, frozenset(equals), rest, "filter", site, not helped)
+
+    # A suggestion with the same equality set and a longer sort/range tail serves the shorter one
+    families: dict[tuple, list[Suggestion]] = defaultdict(list)
+    for s in groups.values():
+        families[(s.model, s.equals, s.reason)].append(s)
+    merged = []
+    for group in families.values():
+        group.sort(key=lambda s: -len(s.rest))
+        kept: list[Suggestion] = []
+        for s in group:
+            into = next((k for k in kept if k.rest[:len(s.rest)] == s.rest), None)
+            if into is None:
+                kept.append(s)
+            else:
+                into.score += s.score
+                into.unindexed = into.unindexed and s.unindexed
+                into.sites.extend(s.sites)
+        merged.extend(kept)
+
+    for s in merged:
+        counts = usage[s.model]
+        lead = sorted(s.equals, key=lambda c: (-counts[c], c))
+        s.columns = tuple(lead) + s.rest
+        s.sites.sort(key=lambda x: (x.path, x.line))
+    merged.sort(key=lambda s: (-s.score, s.model, s.columns))
+    return merged
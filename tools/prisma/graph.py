@@ -0,0 +1,316 @@
+"""Merged model/relation/index graph over the schema and its side files.
+
+prisma/schema.prisma is authoritative; the side files (schema_extension,
+temp_*_models) are spliced into it by scripts such as
+scripts/append-schema.js, so a model defined in both is taken from the
+first file that defines it and a differing copy is reported as a conflict.
+
+Parsed files are cached as JSON in .cache/prisma.sqlite keyed by mtime and
+size, so after an edit only the changed file is parsed again.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from tools.fs import REPO_ROOT
+
+from .schema import Enum, Field, Model, SchemaError, SchemaFile, parse_schema, read_schema
+
+SCHEMA_DIR = REPO_ROOT / "prisma"
+DEFAULT_SCHEMA = SCHEMA_DIR / "schema.prisma"
+SIDE_FILES = ("schema_extension.prisma", "temp_*.prisma")
+DEFAULT_CACHE = REPO_ROOT / ".cache" / "prisma.sqlite"
+# Bump when the parsed form changes so cached files are parsed again
+PARSE_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+"""
+
+
+def default_files(root: Path = SCHEMA_DIR) -> list[Path]:
+    side = sorted({p for pattern in SIDE_FILES for p in root.glob(pattern) if p.is_file()})
+    return [root / "schema.prisma", *side]
+
+
+class SchemaCache:
+    def __init__(self, path: str | Path = DEFAULT_CACHE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.executescript(_SCHEMA)
+        self.parsed = 0  # files parsed (not served from the cache) since opening
+
+    def __enter__(self) -> "SchemaCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.db.commit()
+        self.db.close()
+
+    def load(self, path: str | Path) -> SchemaFile:
+        path = Path(path)
+        key = str(path.resolve())
+        st = path.stat()
+        row = self.db.execute("SELECT mtime_ns, size, version, data FROM files WHERE path = ?", (key,)).fetchone()
+        if row and tuple(row[:3]) == (st.st_mtime_ns, st.st_size, PARSE_VERSION):
+            return SchemaFile.from_dict(json.loads(row[3]))
+        parsed = parse_schema(read_schema(path), _source(path))
+        self.parsed += 1
+        self.db.execute(
+            "INSERT OR REPLACE INTO files (path, mtime_ns, size, version, data) VALUES (?, ?, ?, ?, ?)",
+            (key, st.st_mtime_ns, st.st_size, PARSE_VERSION, json.dumps(parsed.to_dict(), separators=(",", ":"))),
+        )
+        self.db.commit()
+        return parsed
+
+
+def _source(path: Path) -> str:
+    try:
+        return path.resolve().relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+
+@dataclass(frozen=True, slots=True)
+class MissingIndex:
+    model: str
+    fields: tuple[str, ...]
+    relation: str  # the relation field holding the foreign key
+    target: str
+    source: str
+    line: int
+
+
+@dataclass(frozen=True, slots=True)
+class Hop:
+    model: str
+    field: str
+    target: str
+    many: bool
+    fk_model: str  # the side holding the foreign-key columns
+    fk: tuple[str, ...]
+    indexed: bool  # whether the join can use an index on the side it filters
+
+
+@dataclass(frozen=True, slots=True)
+class Change:
+    severity: str  # "breaking", "warning" or "info"
+    model: str
+    field: str | None
+    message: str
+
+
+@dataclass
+class SchemaGraph:
+    models: dict[str, Model] = field(default_factory=dict)
+    enums: dict[str, Enum] = field(default_factory=dict)
+    conflicts: list[tuple[str, str, str]] = field(default_factory=list)  # (name, kept source, other source)
+
+    @classmethod
+    def from_files(cls, files: Iterable[SchemaFile]) -> "SchemaGraph":
+        graph = cls()
+        for f in files:
+            for table, items in ((graph.models, f.models), (graph.enums, f.enums)):
+                for name, item in items.items():
+                    kept = table.get(name)
+                    if kept is None:
+                        table[name] = item
+                    elif not _same_definition(kept, item):
+                        graph.conflicts.append((name, kept.source, item.source))
+        return graph
+
+    @classmethod
+    def load(cls, paths: Sequence[str | Path] | None = None, cache: SchemaCache | None = None) -> "SchemaGraph":
+        paths = [Path(p) for p in paths] if paths else default_files()
+        if cache is None:
+            return cls.from_files(parse_schema(read_schema(p), _source(p)) for p in paths)
+        return cls.from_files(cache.load(p) for p in paths)
+
+    def by_client_name(self, name: str) -> Model | None:
+        """The model behind ``prisma.<name>``."""
+        model = self.models.get(name[:1].upper() + name[1:])
+        return model if model is not None and model.client_name == name else None
+
+    def fk_fields(self, model: Model) -> list[tuple[Field, tuple[str, ...]]]:
+        """Relation fields of ``model`` that hold foreign keys, with their key columns."""
+        return [
+            (f, tuple(f.relation.fields)) for f in model.fields.values()
+            if f.relation is not None and f.relation.fields
+        ]
+
+    def indexed(self, model: Model, columns: Sequence[str]) -> bool:
+        """Whether some index, unique constraint or id on ``model`` starts with ``columns`` (any order)."""
+        want = set(columns)
+        if not want:
+            return True
+        for index in model.indexes:
+            if set(index.fields[:len(want)]) == want:
+                return True
+        if len(want) == 1:
+            f = model.fields.get(next(iter(want)))
+            return f is not None and (f.id or f.unique)
+        return False
+
+    def missing_fk_indexes(self) -> list[MissingIndex]:
+        """Foreign keys without an index that starts with them; PostgreSQL does not create one."""
+        out = []
+        for model in self.models.values():
+            for f, columns in self.fk_fields(model):
+                if not self.indexed(model, columns):
+                    out.append(MissingIndex(model.name, columns, f.name, f.type, model.source, f.line))
+        out.sort(key=lambda m: (m.model, m.fields))
+        return out
+
+    def _opposite(self, model: Model, f: Field) -> Field | None:
+        target = self.models.get(f.type)
+        if target is None:
+            return None
+        name = f.relation.name if f.relation is not None else None
+        for other in target.fields.values():
+            if other.type != model.name or other is f:
+                continue
+            other_name = other.relation.name if other.relation is not None else None
+            if other_name == name:
+                return other
+        return None
+
+    def hop(self, model: Model, f: Field) -> Hop | None:
+        target = self.models.get(f.type)
+        if target is None:
+            return None
+        if f.relation is not None and f.relation.fields:
+            # Many-to-one: the join looks up the referenced columns on the target
+            references = f.relation.references
+            return Hop(model.name, f.name, target.name, f.is_list, model.name, tuple(f.relation.fields),
+                       self.indexed(target, references))
+        other = self._opposite(model, f)
+        if other is None or other.relation is None or not other.relation.fields:
+            # Implicit many-to-many: Prisma creates and indexes the join table
+            return Hop(model.name, f.name, target.name, f.is_list, "", (), True)
+        fk = tuple(other.relation.fields)
+        return Hop(model.name, f.name, target.name, f.is_list, target.name, fk, self.indexed(target, fk))
+
+    def resolve(self, path: str) -> list[Hop]:
+        """Hops of a dotted include/select path such as ``Invoice.company.tenant``."""
+        head, *rest = path.split(".")
+        model = self.models.get(head) or self.by_client_name(head)
+        if model is None:
+            raise SchemaError(f"unknown model {head!r}")
+        hops = []
+        for name in rest:
+            f = model.fields.get(name)
+            if f is None:
+                raise SchemaError(f"{model.name} has no field {name!r}")
+            hop = self.hop(model, f)
+            if hop is None:
+                raise SchemaError(f"{model.name}.{name} is not a relation")
+            hops.append(hop)
+            model = self.models[hop.target]
+        return hops
+
+    def chains(self, source: str, target: str, max_depth: int = 3, limit: int = 20) -> list[list[Hop]]:
+        """Shortest relation paths from ``source`` to ``target``, at most ``max_depth`` hops."""
+        if source not in self.models or target not in self.models:
+            raise SchemaError(f"unknown model {source if source not in self.models else target!r}")
+        out: list[list[Hop]] = []
+        queue: deque[tuple[str, list[Hop]]] = deque([(source, [])])
+        while queue and len(out) < limit:
+            name, path = queue.popleft()
+            if len(path) >= max_depth:
+                continue
+            model = self.models[name]
+            seen = {source, *(h.target for h in path)}
+            for f in model.fields.values():
+                hop = self.hop(model, f)
+                if hop is None:
+                    continue
+                if hop.target == target:
+                    out.append(path + [hop])
+                elif hop.target not in seen:
+                    queue.append((hop.target, path + [hop]))
+        return out[:limit]
+
+
+def _same_definition(a: Model | Enum, b: Model | Enum) -> bool:
+    if isinstance(a, Enum) or isinstance(b, Enum):
+        return isinstance(a, Enum) and isinstance(b, Enum) and a.values == b.values
+    return (
+        {n: (f.type, f.is_list, f.optional, f.id, f.unique, f.default) for n, f in a.fields.items()}
+        == {n: (f.type, f.is_list, f.optional, f.id, f.unique, f.default) for n, f in b.fields.items()}
+        and sorted((i.kind, i.fields) for i in a.indexes) == sorted((i.kind, i.fields) for i in b.indexes)
+    )
+
+
+def compare(old: SchemaGraph, new: SchemaGraph) -> list[Change]:
+    """Changes from ``old`` to ``new``, classified by whether existing data or clients break.
+
+    Breaking: dropped models, fields or enum values, type or list changes,
+    and new required columns without a default. Warnings: new unique
+    constraints (existing rows may violate them) and fields made required.
+    Everything else is informational.
+    """
+    out: list[Change] = []
+    for name in sorted(old.enums.keys() - new.enums.keys()):
+        out.append(Change("breaking", name, None, "enum removed"))
+    for name in sorted(old.enums.keys() & new.enums.keys()):
+        dropped = [v for v in old.enums[name].values if v not in new.enums[name].values]
+        added = [v for v in new.enums[name].values if v not in old.enums[name].values]
+        if dropped:
+            out.append(Change("breaking", name, None, f"enum values removed: {', '.join(dropped)}"))
+        if added:
+            out.append(Change("info", name, None, f"enum values added: {', '.join(added)}"))
+    for name in sorted(old.models.keys() - new.models.keys()):
+        out.append(Change("breaking", name, None, "model removed"))
+    for name in sorted(new.models.keys() - old.models.keys()):
+        out.append(Change("info", name, None, "model added"))
+    for name in sorted(old.models.keys() & new.models.keys()):
+        a, b = old.models[name], new.models[name]
+        for fname, f in a.fields.items():
+            g = b.fields.get(fname)
+            if g is None:
+                out.append(Change("breaking", name, fname, "field removed"))
+            elif (f.type, f.is_list) != (g.type, g.is_list):
+                out.append(Change("breaking", name, fname, f"type {_type(f)} -> {_type(g)}"))
+            elif f.optional and not g.optional:
+                severity = "warning" if g.default is not None else "breaking"
+                out.append(Change(severity, name, fname, "made required"))
+            elif not f.optional and g.optional:
+                out.append(Change("info", name, fname, "made optional"))
+            elif g.unique and not f.unique:
+                out.append(Change("warning", name, fname, "unique constraint added"))
+        for fname, g in b.fields.items():
+            if fname in a.fields:
+                continue
+            column = g.scalar or g.type in new.enums
+            if column and not g.optional and not g.is_list and g.default is None and "@updatedAt" not in g.attrs:
+                out.append(Change("breaking", name, fname, f"required field {_type(g)} added without default"))
+            else:
+                out.append(Change("info", name, fname, "field added"))
+        old_idx = {(i.kind, tuple(i.fields)) for i in a.indexes}
+        new_idx = {(i.kind, tuple(i.fields)) for i in b.indexes}
+        for kind, columns in sorted(new_idx - old_idx):
+            severity = "warning" if kind in ("unique", "id") else "info"
+            out.append(Change(severity, name, None, f"@@{kind}([{', '.join(columns)}]) added"))
+        for kind, columns in sorted(old_idx - new_idx):
+            out.append(Change("info", name, None, f"@@{kind}([{', '.join(columns)}]) removed"))
+    return out
+
+
+def _type(f: Field) -> str:
+    return f.type + ("[]" if f.is_list else "") + ("?" if f.optional else "")
@@ -0,0 +1,294 @@
+"""Prisma client calls in the TS tree and the fields they filter, sort and join on.
+
+Calls are found by their shape, ``<client>.<delegate>.<operation>(``, where
+the client is whatever the file calls it (``prisma``, ``tx``, ``prismaRaw``,
+...); the schema graph later decides which delegates are models. The
+argument object is read with tools.jsobject, which is enough for the
+query shapes in this tree. A ``where`` passed as a variable is looked up
+in the same file: its declaration and any later ``where.field = ...``
+assignments.
+
+Extraction results depend only on the file, so they are cached in the
+``calls`` table of .cache/prisma.sqlite and files are processed in
+parallel.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+from bisect import bisect_right
+from dataclasses import asdict, dataclass, field
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from tools.fs import REPO_ROOT, iter_files
+from tools.jsobject import JsReader, read_value
+
+from .graph import DEFAULT_CACHE
+
+OPERATIONS = (
+    "findMany", "findFirst", "findFirstOrThrow", "findUnique", "findUniqueOrThrow",
+    "count", "aggregate", "groupBy", "updateMany", "deleteMany", "update", "delete", "upsert",
+)
+_CALL = re.compile(r"\b(\w+)\s*\.\s*(\w+)\s*\.\s*(" + "|".join(OPERATIONS) + r")\s*\(")
+
+# Where filters that still let an index seek on the column
+EQUALITY_OPS = frozenset({"equals", "in"})
+RANGE_OPS = frozenset({"gt", "gte", "lt", "lte", "not", "notIn", "contains", "startsWith", "endsWith", "has", "hasSome"})
+RELATION_OPS = frozenset({"some", "every", "none", "is", "isNot"})
+LOGICAL = frozenset({"AND", "OR", "NOT"})
+
+DEFAULT_DIRS = ("src/lib", "src/jobs", "src/actions", "src/app/api")
+INCLUDE = ("*.ts", "*.tsx")
+
+# Bump when the extracted form changes so cached files are read again
+EXTRACT_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS calls (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+"""
+
+
+@dataclass(slots=True)
+class Call:
+    path: str  # repo-relative
+    line: int
+    delegate: str  # e.g. "salesInvoice"
+    operation: str
+    equals: list[str] = field(default_factory=list)  # columns compared for equality
+    ranges: list[str] = field(default_factory=list)  # columns with range, pattern or negated filters
+    nulls: list[str] = field(default_factory=list)  # columns filtered with ``: null``
+    branches: list[list[str]] = field(default_factory=list)  # equality columns of each top-level OR branch
+    order: list[str] = field(default_factory=list)
+    joins: list[str] = field(default_factory=list)  # relations filtered on, included or selected
+    opaque: bool = False  # the where clause could not be read completely
+
+
+# ---------------------------------------------------------------------------
+# Query shape
+
+
+def _is_identifier(value) -> bool:
+    return isinstance(value, str) and re.fullmatch(r"[\w$]+", value) is not None
+
+
+def _where_fields(where: dict, call: Call, branch: list[str] | None = None, ignored: bool = False) -> None:
+    """Sort ``where``'s columns into ``call``.
+
+    At the top level equality columns go to ``equals``; inside a top-level
+    OR they go to that branch's list in ``branches``. Columns under NOT or
+    a nested OR give no index seek and are only scanned for joins.
+    """
+    equals = call.equals if branch is None else branch
+    for key, value in where.items():
+        if key.startswith("..."):
+            call.opaque = True
+            continue
+        if key in LOGICAL:
+            for sub in value if isinstance(value, list) else [value]:
+                if not isinstance(sub, dict):
+                    call.opaque = True
+                elif key == "AND":
+                    _where_fields(sub, call, branch, ignored)
+                elif key == "OR" and branch is None and not ignored:
+                    call.branches.append([])
+                    _where_fields(sub, call, call.branches[-1])
+                else:
+                    _where_fields(sub, call, branch, True)
+            continue
+        if isinstance(value, dict) and value.keys() & RELATION_OPS:
+            _add(call.joins, key)
+            continue
+        if isinstance(value, dict) and value and not (value.keys() & (EQUALITY_OPS | RANGE_OPS | {"mode"})):
+            # Nested filter on a to-one relation, or a compound unique key
+            _add(call.joins, key)
+            if not ignored:
+                for sub in value:
+                    if not sub.startswith("..."):
+                        _add(equals, f"{key}.{sub}")
+            continue
+        if ignored or value == "undefined":  # Prisma drops undefined filters
+            continue
+        if value == "null":
+            # IS NULL (soft deletes) matches most rows; never a leading column
+            if branch is None:
+                _add(call.nulls, key)
+        elif isinstance(value, dict) and (value.keys() & RANGE_OPS) and not (value.keys() & EQUALITY_OPS):
+            if branch is None:
+                _add(call.ranges, key)
+        else:
+            _add(equals, key)
+
+
+def _order_fields(order, call: Call) -> None:
+    for item in order if isinstance(order, list) else [order]:
+        if isinstance(item, dict):
+            for key, value in item.items():
+                if isinstance(value, dict):
+                    _add(call.joins, key)
+                elif not key.startswith("..."):
+                    _add(call.order, key)
+
+
+def _joined(spec: dict, call: Call) -> None:
+    """Keys of an include/select; scalar columns among them are dropped against the schema later."""
+    for key, value in spec.items():
+        if key != "_count" and not key.startswith("...") and (isinstance(value, dict) or value == "true"):
+            _add(call.joins, key)
+
+
+def _add(items: list[str], name: str) -> None:
+    if name not in items:
+        items.append(name)
+
+
+def _resolve_variable(text: str, name: str, before: int) -> tuple[dict | None, list[str]]:
+    """The object literal last assigned to ``name`` before ``before``, plus fields set on it later."""
+    decl = None
+    for m in re.finditer(rf"\b(?:const|let|var)\s+{re.escape(name)}\b[^=;]*=\s*(?=\{{)|\b{re.escape(name)}\s*=\s*(?=\{{)",
+                         text[:before]):
+        decl = m
+    if decl is None:
+        return None, []
+    obj = read_value(text, decl.end())
+    if not isinstance(obj, dict):
+        return None, []
+    assigned = re.findall(rf"\b{re.escape(name)}(?:\.(\w+)|\[['\"](\w+)['\"]\])\s*=(?!=)", text[decl.end():before])
+    return obj, [a or b for a, b in assigned]
+
+
+def extract_text(text: str, path: str = "") -> list[Call]:
+    calls = []
+    line_starts = [0] + [m.end() for m in re.finditer("\n", text)]
+    for m in _CALL.finditer(text):
+        client, delegate, operation = m.groups()
+        if client in ("this", "console", "Math", "JSON", "Object"):
+            continue
+        call = Call(path, bisect_right(line_starts, m.start()), delegate, operation)
+        reader = JsReader(text, m.end())
+        reader.skip()
+        args = reader.value() if reader.pos < len(text) and text[reader.pos] != ")" else {}
+        if _is_identifier(args):
+            args, _ = _resolve_variable(text, args, m.start())
+        if not isinstance(args, dict):
+            call.opaque = True
+            calls.append(call)
+            continue
+        where = args.get("where")
+        if _is_identifier(where):
+            obj, assigned = _resolve_variable(text, where, m.start())
+            if obj is None:
+                call.opaque = True
+            else:
+                _where_fields(obj, call)
+                for name in assigned:
+                    if name not in LOGICAL:
+                        _add(call.equals, name)
+        elif isinstance(where, dict):
+            _where_fields(where, call)
+        elif where:
+            call.opaque = True
+        if "orderBy" in args:
+            _order_fields(args["orderBy"], call)
+        for key in ("include", "select"):
+            if isinstance(args.get(key), dict):
+                _joined(args[key], call)
+        by = args.get("by")
+        if isinstance(by, list):
+            for name in by:
+                if isinstance(name, str) and name[:1] in "'\"":
+                    _add(call.order, name[1:-1])
+        calls.append(call)
+    return calls
+
+
+# ---------------------------------------------------------------------------
+# Tree scan
+
+
+def _extract_file(args: tuple[str, str]) -> tuple[str, int, int, list[dict]]:
+    root, rel = args
+    path = os.path.join(root, rel)
+    st = os.stat(path)
+    with open(path, encoding="utf-8", errors="replace") as f:
+        text = f.read()
+    repo_rel = Path(path).resolve().relative_to(REPO_ROOT).as_posix()
+    return rel, st.st_mtime_ns, st.st_size, [asdict(c) for c in extract_text(text, repo_rel)]
+
+
+class CallCache:
+    def __init__(self, path: str | Path = DEFAULT_CACHE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.executescript(_SCHEMA)
+
+    def __enter__(self) -> "CallCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.db.commit()
+        self.db.close()
+
+    def load(self) -> dict[str, tuple[int, int, str]]:
+        rows = self.db.execute("SELECT path, mtime_ns, size, data FROM calls WHERE version = ?", (EXTRACT_VERSION,))
+        return {path: (mtime_ns, size, data) for path, mtime_ns, size, data in rows}
+
+    def store(self, rows: Iterable[tuple[str, int, int, list[dict]]]) -> None:
+        self.db.executemany(
+            "INSERT OR REPLACE INTO calls (path, mtime_ns, size, version, data) VALUES (?, ?, ?, ?, ?)",
+            [(path, mtime_ns, size, EXTRACT_VERSION, json.dumps(calls, separators=(",", ":")))
+             for path, mtime_ns, size, calls in rows],
+        )
+        self.db.commit()
+
+
+def scan_calls(
+    dirs: Iterable[str] = DEFAULT_DIRS,
+    jobs: int | None = None,
+    cache: CallCache | None = None,
+) -> Iterator[Call]:
+    """Prisma calls under ``dirs`` (repo-relative), in path order."""
+    cached = cache.load() if cache is not None else {}
+    results: dict[str, list[dict]] = {}
+    todo = []
+    for d in dirs:
+        root = str(REPO_ROOT / d)
+        for rel in iter_files(root, INCLUDE):
+            key = f"{d}/{rel}"
+            entry = cached.get(key)
+            if entry is not None:
+                st = os.stat(os.path.join(root, rel))
+                if (entry[0], entry[1]) == (st.st_mtime_ns, st.st_size):
+                    results[key] = json.loads(entry[2])
+                    continue
+            todo.append((d, root, rel))
+    if todo:
+        tasks = [(root, rel) for _, root, rel in todo]
+        if jobs == 1 or len(tasks) < 64:
+            fresh = [_extract_file(t) for t in tasks]
+        else:
+            with Pool(jobs or os.cpu_count() or 1) as pool:
+                fresh = pool.map(_extract_file, tasks, chunksize=max(1, len(tasks) // 64))
+        rows = []
+        for (d, _, _), (rel, mtime_ns, size, calls) in zip(todo, fresh):
+            results[f"{d}/{rel}"] = calls
+            rows.append((f"{d}/{rel}", mtime_ns, size, calls))
+        if cache is not None:
+            cache.store(rows)
+    for key in sorted(results):
+        for data in results[key]:
+            yield Call(**data)
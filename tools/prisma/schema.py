@@ -0,0 +1,254 @@
+"""Parser for Prisma schema files: models, fields, relations, indexes and enums.
+
+Only the parts the graph queries need are modelled; ``generator`` and
+``datasource`` blocks are skipped. Parsed files round-trip through plain
+dicts so they can be cached as JSON.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+_BLOCK = re.compile(r"^\s*(model|enum|view|type|generator|datasource)\s+(\w+)\s*\{")
+_FIELD = re.compile(r"^\s*(\w+)\s+(\w+)(\[\])?(\?)?\s*(.*)$")
+_NAME_ARG = re.compile(r'^\s*(?:name:\s*)?"([^"]*)"')
+_LIST_ARG = re.compile(r"\b(fields|references)\s*:\s*\[([^\]]*)\]")
+_ON_DELETE = re.compile(r"\bonDelete\s*:\s*(\w+)")
+_BLOCK_ATTR = re.compile(r"^\s*@@(index|unique|id)\s*\(")
+
+SCALARS = frozenset({
+    "String", "Boolean", "Int", "BigInt", "Float", "Decimal", "DateTime", "Json", "Bytes", "Unsupported",
+})
+
+
+class SchemaError(ValueError):
+    pass
+
+
+@dataclass(slots=True)
+class Relation:
+    name: str | None = None
+    fields: list[str] = field(default_factory=list)  # foreign-key columns on this side
+    references: list[str] = field(default_factory=list)
+    on_delete: str | None = None
+
+
+@dataclass(slots=True)
+class Field:
+    name: str
+    type: str
+    is_list: bool = False
+    optional: bool = False
+    id: bool = False
+    unique: bool = False
+    default: str | None = None
+    relation: Relation | None = None  # set for relation fields with @relation(...)
+    attrs: str = ""
+    line: int = 0
+
+    @property
+    def scalar(self) -> bool:
+        return self.type in SCALARS
+
+
+@dataclass(slots=True)
+class Index:
+    kind: str  # "index", "unique" or "id"
+    fields: list[str]
+    name: str | None = None
+
+
+@dataclass(slots=True)
+class Model:
+    name: str
+    source: str
+    line: int
+    fields: dict[str, Field] = field(default_factory=dict)
+    indexes: list[Index] = field(default_factory=list)
+
+    @property
+    def client_name(self) -> str:
+        """The ``prisma.<name>`` delegate: the model name with a lower-case first letter."""
+        return self.name[:1].lower() + self.name[1:]
+
+
+@dataclass(slots=True)
+class Enum:
+    name: str
+    source: str
+    line: int
+    values: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class SchemaFile:
+    source: str
+    models: dict[str, Model] = field(default_factory=dict)
+    enums: dict[str, Enum] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SchemaFile":
+        models = {}
+        for name, m in data["models"].items():
+            fields = {}
+            for fname, f in m["fields"].items():
+                rel = f.pop("relation")
+                fields[fname] = Field(**f, relation=Relation(**rel) if rel is not None else None)
+            models[name] = Model(m["name"], m["source"], m["line"], fields, [Index(**i) for i in m["indexes"]])
+        enums = {name: Enum(**e) for name, e in data["enums"].items()}
+        return cls(data["source"], models, enums)
+
+
+def _strip_comment(line: str) -> str:
+    """Drop a ``//`` comment, leaving ``//`` inside string literals alone."""
+    if "//" not in line:
+        return line
+    quoted = False
+    for i, ch in enumerate(line):
+        if ch == '"' and (i == 0 or line[i - 1] != "\\"):
+            quoted = not quoted
+        elif not quoted and line.startswith("//", i):
+            return line[:i]
+    return line
+
+
+def _args(text: str, start: int) -> str:
+    """The text inside the parentheses opening at ``text[start]``."""
+    depth = 0
+    quoted = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if ch == '"' and text[i - 1] != "\\":
+            quoted = not quoted
+        elif quoted:
+            continue
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+            if depth == 0:
+                return text[start + 1:i]
+    return text[start + 1:]
+
+
+def _field_list(text: str) -> list[str]:
+    """``a, b(sort: Desc), c(ops: ...)`` -> ``["a", "b", "c"]``."""
+    out = []
+    depth = 0
+    current = []
+    for ch in text:
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif depth == 0:
+            if ch == ",":
+                out.append("".join(current).strip())
+                current = []
+            else:
+                current.append(ch)
+    out.append("".join(current).strip())
+    return [name for name in out if name]
+
+
+def _attr_args(attrs: str, name: str) -> str | None:
+    m = re.search(rf"@{name}\b", attrs)
+    if not m:
+        return None
+    end = m.end()
+    if end < len(attrs) and attrs[end] == "(":
+        return _args(attrs, end)
+    return ""
+
+
+def _parse_field(m: re.Match) -> Field:
+    name, type_, is_list, optional, attrs = m.groups()
+    f = Field(name, type_, bool(is_list), bool(optional), attrs=attrs.strip())
+    f.id = re.search(r"(?<!@)@id\b", attrs) is not None
+    f.unique = re.search(r"(?<!@)@unique\b", attrs) is not None
+    f.default = _attr_args(attrs, "default")
+    args = _attr_args(attrs, "relation")
+    if args is not None:
+        rel = Relation()
+        nm = _NAME_ARG.match(args)
+        if nm:
+            rel.name = nm[1]
+        for kind, names in _LIST_ARG.findall(args):
+            setattr(rel, kind, _field_list(names))
+        od = _ON_DELETE.search(args)
+        if od:
+            rel.on_delete = od[1]
+        f.relation = rel
+    return f
+
+
+def _parse_index(line: str, kind: str) -> Index:
+    args = _args(line, line.index("("))
+    fields_m = re.match(r"\s*(?:fields\s*:\s*)?\[([^\]]*)\]", args)
+    if not fields_m:
+        raise SchemaError(f"cannot read @@{kind} fields: {line.strip()}")
+    name = re.search(r"\b(?:name|map)\s*:\s*\"([^\"]*)\"", args[fields_m.end():])
+    return Index(kind, _field_list(fields_m[1]), name[1] if name else None)
+
+
+def parse_schema(text: str, source: str = "") -> SchemaFile:
+    out = SchemaFile(source)
+    block: Model | Enum | None = None
+    skip = False
+    for n, raw in enumerate(text.splitlines(), 1):
+        line = _strip_comment(raw).strip()
+        if not line:
+            continue
+        if block is None and not skip:
+            m = _BLOCK.match(line)
+            if not m:
+                continue
+            kind, name = m.groups()
+            if kind in ("model", "view"):
+                block = out.models[name] = Model(name, source, n)
+            elif kind == "enum":
+                block = out.enums[name] = Enum(name, source, n)
+            else:
+                skip = True
+            continue
+        if line == "}" or line.startswith("}"):
+            block, skip = None, False
+            continue
+        if skip:
+            continue
+        if isinstance(block, Enum):
+            value = line.split()[0]
+            if not value.startswith("@@"):
+                block.values.append(value)
+            continue
+        m = _BLOCK_ATTR.match(line)
+        if m:
+            block.indexes.append(_parse_index(line, m[1]))
+            continue
+        if line.startswith("@@"):
+            continue
+        m = _FIELD.match(line)
+        if m:
+            f = _parse_field(m)
+            f.line = n
+            block.fields[f.name] = f
+    if block is not None:
+        raise SchemaError(f"{source}: block {block.name} is not closed")
+    return out
+
+
+def read_schema(path: str | Path) -> str:
+    """Schema text; undoes the double encoding of files once read as UTF-16 and saved as UTF-8."""
+    data = Path(path).read_bytes()
+    text = data.decode("utf-8-sig", errors="replace")
+    head = text[:64]
+    if head and sum(1 for ch in head if "㐀" <= ch <= "鿿") > len(head) // 2:
+        repaired = text.encode("utf-16-le", errors="surrogatepass").decode("utf-8", errors="replace")
+        if "{" in repaired[:512]:
+            return repaired
+    return text
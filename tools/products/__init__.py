@@ -0,0 +1,24 @@
+"""Offline batch matching for the product-intelligence jobs (normalize-product, rebuild-product-clusters).
+
+    python -m tools.products match --canonicals canonical.jsonl --products products.csv [-k 5] [-o OUT.jsonl]
+    python -m tools.products match --canonicals canonical.jsonl --backup B
+    python -m tools.products clusters --canonicals canonical.jsonl [--threshold 0.92]
+    python -m tools.products bench --scale 100000
+"""
+
+from .matcher import (
+    AUTO_MAP, HIGH_CONFIDENCE, NO_STRONG_MATCH, REVIEW_THRESHOLD, SUGGEST, TOP_K, CanonicalIndex, Item,
+    ProductMatch, clusters, iter_matches,
+)
+from .names import (
+    Similarity, build_cluster_key, extract_brand_token, extract_numeric_tokens, extract_sku_tokens,
+    normalize_product_name, product_similarity, tokenize_product_name,
+)
+from .sources import from_backup, read_records, synthetic, to_items
+
+__all__ = [
+    "AUTO_MAP", "HIGH_CONFIDENCE", "NO_STRONG_MATCH", "REVIEW_THRESHOLD", "SUGGEST", "TOP_K", "CanonicalIndex",
+    "Item", "ProductMatch", "Similarity", "build_cluster_key", "clusters", "extract_brand_token",
+    "extract_numeric_tokens", "extract_sku_tokens", "from_backup", "iter_matches", "normalize_product_name",
+    "product_similarity", "read_records", "synthetic", "to_items", "tokenize_product_name",
+]
@@ -0,0 +1,84 @@
+import argparse
+import json
+import sys
+import time
+
+from tools.checkpoints import BackupFormatError
+
+from .matcher import AUTO_MAP, HIGH_CONFIDENCE, NO_STRONG_MATCH, REVIEW_THRESHOLD, SUGGEST, TOP_K, CanonicalIndex, \
+    clusters, iter_matches
+from .names import build_cluster_key
+from .sources import from_backup, read_records, synthetic, to_items
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.products")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("match", help="top-k canonical matches for every product; writes JSONL")
+    p.add_argument("--canonicals", required=True, help="canonical products (JSONL, JSON or CSV with id, name)")
+    source = p.add_mutually_exclusive_group(required=True)
+    source.add_argument("--products", help="tenant products (JSONL, JSON or CSV)")
+    source.add_argument("--backup", help="take the products from this checkpoint backup")
+    p.add_argument("-k", type=int, default=TOP_K)
+    p.add_argument("--min-score", type=float, default=REVIEW_THRESHOLD)
+    p.add_argument("-o", "--output", help="write JSONL here instead of stdout")
+
+    p = sub.add_parser("clusters", help="group near-duplicate canonical products")
+    p.add_argument("--canonicals", required=True)
+    p.add_argument("--threshold", type=float, default=HIGH_CONFIDENCE)
+
+    p = sub.add_parser("bench", help="time the matcher on generated names")
+    p.add_argument("--scale", type=int, default=100_000, help="canonicals and products each")
+    p.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    try:
+        if args.command == "bench":
+            canonicals, products = synthetic(args.scale, args.scale, args.seed)
+        else:
+            canonicals = list(to_items(read_records(args.canonicals)))
+        min_score = args.threshold if args.command == "clusters" else getattr(args, "min_score", REVIEW_THRESHOLD)
+        index = CanonicalIndex(canonicals, min_score)
+        build = time.perf_counter() - t0
+        print(f"{len(index)} canonicals indexed in {build:.2f} s", file=sys.stderr)
+
+        if args.command == "clusters":
+            groups = clusters(index, args.threshold)
+            for group in groups:
+                members = [index.canonicals[i] for i in group]
+                print(json.dumps({"clusterKey": build_cluster_key(members[0].name),
+                                  "members": [{"id": m.id, "name": m.name} for m in members]}, ensure_ascii=False))
+            print(f"{len(groups)} clusters in {time.perf_counter() - t0:.2f} s", file=sys.stderr)
+            return 0
+
+        if args.command == "match":
+            products = from_backup(args.backup) if args.backup else to_items(read_records(args.products))
+            out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+            k = args.k
+        else:
+            out, k = None, TOP_K
+        actions = {AUTO_MAP: 0, SUGGEST: 0, NO_STRONG_MATCH: 0}
+        t1 = time.perf_counter()
+        try:
+            for match in iter_matches(index, products, k):
+                actions[match.action] += 1
+                if out is not None:
+                    out.write(json.dumps(match.to_dict(), ensure_ascii=False) + "\n")
+        finally:
+            if out is not None and out is not sys.stdout:
+                out.close()
+    except (BackupFormatError, FileNotFoundError, json.JSONDecodeError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    seconds = time.perf_counter() - t1
+    total = sum(actions.values())
+    print(f"{total} products in {seconds:.2f} s ({total / max(seconds, 1e-9):,.0f}/s); "
+          + ", ".join(f"{name} {count}" for name, count in actions.items()), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
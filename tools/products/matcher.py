@@ -0,0 +1,391 @@
+"""Batch matching of tenant products against canonical products.
+
+``findBestCanonicalMatches`` scores one product against (the first 1000)
+canonical products in a loop. Here the canonicals are indexed once and
+products are matched in batches:
+
+- Blocking. Numbers, brand and SKU add at most 0.6 to a score, less for
+  a name that lacks some of them, so reaching ``min_score`` takes a
+  minimum token overlap ratio. With that bound the standard prefix filter
+  applies: order tokens rarest first, and two names whose overlap meets
+  the bound share a token among the first ``len - ceil(bound * len) + 1``
+  of each. Only those prefixes are indexed and probed, so common words
+  (``castrol``, ``5w``) rarely generate candidates. Two exceptions are blocked
+  separately: equal normalized names (``EXACT``) and the 0.95 boost for
+  a full SKU + brand + number match, keyed on brand and the canonical's
+  rarest SKU and number. For ``min_score`` above 0.6 no pair that scores
+  at least ``min_score`` is missed; below that, pairs without a shared
+  token are not considered.
+- Scoring. Token, number and SKU lists are integer-coded CSR arrays. The
+  overlap counts of every candidate pair in a batch come from one
+  membership test and a ``bincount``, and the score and match type follow
+  ``calculateProductSimilarity`` as array expressions; ``names.product_similarity``
+  is the scalar reference.
+
+The thresholds are the ones productSimilarity.service.ts acts on.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Sequence
+
+import numpy as np
+
+from .names import (
+    BRANDS, extract_brand_token, extract_numeric_tokens, extract_sku_tokens, normalize_product_name,
+    tokenize_product_name,
+)
+
+HIGH_CONFIDENCE = 0.92
+REVIEW_THRESHOLD = 0.75
+TOP_K = 5
+BATCH = 2048  # products whose candidate pairs are scored together
+PAIR_CHUNK = 1 << 21  # candidate pairs expanded and scored at once
+
+AUTO_MAP, SUGGEST, NO_STRONG_MATCH = "AUTO_MAP", "SUGGEST", "NO_STRONG_MATCH"
+MATCH_TYPES = ("TEXT_SIMILAR", "SKU_SIMILAR", "BRAND_MATCH", "EXACT")
+_TEXT, _SKU, _BRAND, _EXACT = range(4)
+
+_EPS = 1e-9
+
+
+@dataclass(frozen=True)
+class Item:
+    """A product or canonical product: the id and name are all the matcher needs."""
+    id: str
+    name: str
+    tenant_id: str | None = None
+
+
+@dataclass
+class ProductMatch:
+    product: Item
+    normalized_name: str
+    matches: list[dict] = field(default_factory=list)  # best first: canonicalProductId, canonicalName, score, matchType
+
+    @property
+    def action(self) -> str:
+        """What compareTenantProductToCanonical does with the top match."""
+        score = self.matches[0]["score"] if self.matches else 0.0
+        return AUTO_MAP if score >= HIGH_CONFIDENCE else SUGGEST if score >= REVIEW_THRESHOLD else NO_STRONG_MATCH
+
+    def to_dict(self) -> dict:
+        return {
+            "tenantId": self.product.tenant_id, "productId": self.product.id, "name": self.product.name,
+            "normalizedName": self.normalized_name, "action": self.action, "matches": self.matches,
+        }
+
+
+class _Lists:
+    """Per-name lists of codes in one vocabulary, as CSR arrays.
+
+    Entries missing from a frozen vocabulary are dropped from ``ids`` but
+    still counted in ``length``, which is what the score divides by.
+    """
+
+    def __init__(self, lists: Iterable[list[str]], vocab: dict[str, int], grow: bool):
+        ids: list[int] = []
+        starts = [0]
+        lengths: list[int] = []
+        for values in lists:
+            lengths.append(len(values))
+            for v in values:
+                code = vocab.setdefault(v, len(vocab)) if grow else vocab.get(v, -1)
+                if code >= 0:
+                    ids.append(code)
+            starts.append(len(ids))
+        self.vocab = vocab
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.start = np.asarray(starts, dtype=np.int64)
+        self.length = np.asarray(lengths, dtype=np.int64)
+
+    def row(self, i: int) -> np.ndarray:
+        return self.ids[self.start[i]:self.start[i + 1]]
+
+
+def _ragged(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Concatenated ``arange(start, start + length)`` for every pair."""
+    total = int(lengths.sum())
+    if not total:
+        return np.zeros(0, dtype=np.int64)
+    return np.repeat(starts - (np.cumsum(lengths) - lengths), lengths) + np.arange(total)
+
+
+def _distinct(codes: np.ndarray) -> np.ndarray:
+    """Sorted distinct values; a sort is far quicker than ``np.unique``'s hashing on large int arrays."""
+    codes = np.sort(codes)
+    return codes[np.concatenate(([True], codes[1:] != codes[:-1]))] if len(codes) else codes
+
+
+class _Features:
+    """Everything the score needs about a list of names."""
+
+    def __init__(self, items: Sequence[Item], index: "CanonicalIndex | None" = None):
+        grow = index is None
+        vocab = (index.tokens.vocab, index.numbers.vocab, index.skus.vocab, index.norm_vocab) if index else \
+            ({}, {}, {}, {})
+        names = [item.name for item in items]
+        self.tokens = _Lists((tokenize_product_name(n) for n in names), vocab[0], grow)
+        self.numbers = _Lists((extract_numeric_tokens(n) for n in names), vocab[1], grow)
+        self.skus = _Lists((extract_sku_tokens(n) for n in names), vocab[2], grow)
+        self.brand = np.array([BRANDS.index(b) if (b := extract_brand_token(n)) else -1 for n in names],
+                              dtype=np.int64)
+        self.normalized = [normalize_product_name(n) for n in names]
+        # Equal codes mean equal normalized names; a product's name no canonical has gets -1
+        norms = vocab[3]
+        self.norm_vocab = norms
+        self.norm = np.array([norms.setdefault(n, len(norms)) if grow else norms.get(n, -1)
+                              for n in self.normalized], dtype=np.int64)
+
+
+def _min_overlap(f: _Features, min_score: float) -> np.ndarray:
+    """Per name, the token overlap ratio any pair with it needs to reach ``min_score``.
+
+    Whatever the partner, a name without a brand gets no brand term, one
+    without SKUs no SKU term, and one without numbers at most the neutral
+    0.5 number score, so its bound is higher than the general one.
+    """
+    other = (np.where(f.brand >= 0, 0.2, 0.0) + np.where(f.skus.length > 0, 0.1, 0.0)
+             + np.where(f.numbers.length > 0, 0.3, 0.15))
+    return np.maximum(0.0, (min_score - other) / 0.4)
+
+
+def _prefix_len(length: int, bound: float) -> int:
+    need = max(1, math.ceil(bound * length - _EPS))
+    return max(0, length - need + 1)
+
+
+class CanonicalIndex:
+    def __init__(self, canonicals: Sequence[Item], min_score: float = REVIEW_THRESHOLD):
+        self.canonicals = list(canonicals)
+        self.min_score = min_score
+        f = _Features(self.canonicals)
+        self.tokens, self.numbers, self.skus, self.brand = f.tokens, f.numbers, f.skus, f.brand
+        self.norm, self.norm_vocab = f.norm, f.norm_vocab
+
+        # Rarest first; ties by code so the order is total
+        df = np.bincount(self.tokens.ids, minlength=len(self.tokens.vocab))
+        self.rank = np.empty(len(df), dtype=np.int64)
+        self.rank[np.lexsort((np.arange(len(df)), df))] = np.arange(len(df))
+
+        rows: list[np.ndarray] = []
+        cols: list[np.ndarray] = []
+        for i, bound in enumerate(_min_overlap(f, min_score).tolist()):
+            toks = self.tokens.row(i)
+            p = _prefix_len(len(toks), bound)
+            if p:
+                cols.append(toks[np.argsort(self.rank[toks], kind="stable")[:p]])
+                rows.append(np.full(p, i, dtype=np.int64))
+        rows_a = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        cols_a = np.concatenate(cols) if cols else np.zeros(0, dtype=np.int64)
+        order = np.argsort(cols_a, kind="stable")
+        self.post_rows = rows_a[order]
+        self.post_start = np.searchsorted(cols_a[order], np.arange(len(df) + 1))
+
+        self.exact: dict[int, list[int]] = {}
+        for i, code in enumerate(self.norm.tolist()):
+            self.exact.setdefault(code, []).append(i)
+
+        # The boost needs every SKU and number of the canonical in the product, and the same brand
+        sku_df = np.bincount(self.skus.ids, minlength=len(self.skus.vocab))
+        num_df = np.bincount(self.numbers.ids, minlength=len(self.numbers.vocab))
+        self.boost: dict[tuple[int, int, int], list[int]] = {}
+        for i in range(len(self.canonicals)):
+            skus, nums = self.skus.row(i), self.numbers.row(i)
+            if self.brand[i] < 0 or not len(skus) or not len(nums):
+                continue
+            key = (int(self.brand[i]), int(skus[np.argmin(sku_df[skus])]), int(nums[np.argmin(num_df[nums])]))
+            self.boost.setdefault(key, []).append(i)
+
+    def __len__(self) -> int:
+        return len(self.canonicals)
+
+    def _pairs(self, f: _Features) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Candidate ``(product row, canonical)`` pairs in chunks of about ``PAIR_CHUNK``.
+
+        Pairs are distinct within a chunk but may repeat across chunks.
+        """
+        size = len(self.canonicals)
+        probe_rows: list[int] = []
+        probe_tokens: list[int] = []
+        extra: list[int] = []
+        for r, bound in enumerate(_min_overlap(f, self.min_score).tolist()):
+            toks = f.tokens.row(r)
+            # Tokens no canonical has are the rarest of all and come first in the order
+            length = int(f.tokens.length[r])
+            p = _prefix_len(length, bound) - (length - len(toks))
+            if p > 0 and len(toks):
+                picked = toks[np.argsort(self.rank[toks], kind="stable")[:p]]
+                probe_rows.extend([r] * len(picked))
+                probe_tokens.extend(picked.tolist())
+            extra.extend(r * size + c for c in self.exact.get(int(f.norm[r]), ()))
+            if f.brand[r] >= 0 and self.boost:
+                for s in set(f.skus.row(r).tolist()):
+                    for n in set(f.numbers.row(r).tolist()):
+                        extra.extend(r * size + c for c in self.boost.get((int(f.brand[r]), s, n), ()))
+
+        rows_a = np.asarray(probe_rows, dtype=np.int64)
+        toks_a = np.asarray(probe_tokens, dtype=np.int64)
+        starts = self.post_start[toks_a]
+        lengths = self.post_start[toks_a + 1] - starts
+        ends = np.cumsum(lengths)
+        lo = 0
+        while lo < len(toks_a):
+            done = int(ends[lo - 1]) if lo else 0
+            hi = max(lo + 1, int(np.searchsorted(ends, done + PAIR_CHUNK, side="right")))
+            cands = self.post_rows[_ragged(starts[lo:hi], lengths[lo:hi])]
+            codes = _distinct(np.repeat(rows_a[lo:hi], lengths[lo:hi]) * size + cands)
+            yield codes // size, codes % size
+            lo = hi
+        if extra:
+            codes = _distinct(np.asarray(extra, dtype=np.int64))
+            yield codes // size, codes % size
+
+    def _hits(self, mine: _Lists, theirs: _Lists, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """Per pair: entries of the canonical's list (repeats counted) found in the product's list."""
+        # A product x (codes in this batch) table of flags; codes the batch lacks map to an all-False column
+        owned = _distinct(mine.ids)
+        local = np.full(len(theirs.vocab), len(owned), dtype=np.int64)
+        local[owned] = np.arange(len(owned))
+        flags = np.zeros((len(mine.length), len(owned) + 1), dtype=bool)
+        flags[np.repeat(np.arange(len(mine.length)), mine.start[1:] - mine.start[:-1]), local[mine.ids]] = True
+        lengths = theirs.start[cols + 1] - theirs.start[cols]
+        values = theirs.ids[_ragged(theirs.start[cols], lengths)]
+        pair = np.repeat(np.arange(len(rows)), lengths)
+        return np.bincount(pair, weights=flags[rows[pair], local[values]], minlength=len(rows))
+
+    def _share(self, mine: _Lists, theirs: _Lists, rows: np.ndarray, cols: np.ndarray, empty: float) -> np.ndarray:
+        la, lb = mine.length[rows], theirs.length[cols]
+        ratio = self._hits(mine, theirs, rows, cols) / np.maximum(np.maximum(la, lb), 1)
+        return np.where((la > 0) | (lb > 0), ratio, empty)
+
+    def _brand(self, f: _Features, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        ba, bb = f.brand[rows], self.brand[cols]
+        return np.where((ba >= 0) & (bb >= 0), np.where(ba == bb, 1.0, -0.5), 0.0)
+
+    def _plausible(self, f: _Features, rows: np.ndarray, cols: np.ndarray, threshold: float) -> np.ndarray:
+        """False for pairs that cannot reach ``threshold``, judged without comparing token lists.
+
+        The token share is at most the ratio of the list lengths; the brand
+        settles most pairs on its own, then numbers and SKUs (short lists)
+        are compared for the rest. The exact and boost cases stay in.
+        """
+        la, lb = f.tokens.length[rows], self.tokens.length[cols]
+        tok = np.minimum(la, lb) / np.maximum(np.maximum(la, lb), 1)
+        brand = self._brand(f, rows, cols)
+        na, nb = f.numbers.length[rows] > 0, self.numbers.length[cols] > 0
+        skus = (f.skus.length[rows] > 0) & (self.skus.length[cols] > 0)
+        rough = tok * 0.4 + np.where(na & nb, 0.3, np.where(na | nb, 0.0, 0.15)) + brand * 0.2 \
+            + np.where(skus, 0.1, 0.0)
+        # The 0.95 boost needs all of these, and equal lists beyond them
+        boost = (brand == 1) & skus & na & nb
+        keep = (rough >= threshold - _EPS) | boost | (f.norm[rows] == self.norm[cols])
+        rows, cols, tok, brand = rows[keep], cols[keep], tok[keep], brand[keep]
+
+        num = self._share(f.numbers, self.numbers, rows, cols, 0.5)
+        sku = self._share(f.skus, self.skus, rows, cols, 0.0)
+        close = (tok * 0.4 + num * 0.3 + brand * 0.2 + sku * 0.1 >= threshold - _EPS) \
+            | ((sku == 1) & (brand == 1) & (num == 1)) | (f.norm[rows] == self.norm[cols])
+        keep[np.flatnonzero(keep)[~close]] = False
+        return keep
+
+    def score(self, f: _Features, rows: np.ndarray, cols: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """``(score, match type code)`` of each pair, as ``calculateProductSimilarity(product, canonical)``."""
+        tok = self._share(f.tokens, self.tokens, rows, cols, 0.0)
+        num = self._share(f.numbers, self.numbers, rows, cols, 0.5)
+        sku = self._share(f.skus, self.skus, rows, cols, 0.0)
+        brand = self._brand(f, rows, cols)
+
+        score = np.clip(tok * 0.4 + num * 0.3 + brand * 0.2 + sku * 0.1, 0.0, 1.0)
+        kind = np.full(len(rows), _TEXT, dtype=np.int8)
+        kind[(brand == 1.0) & ((num > 0.8) | (tok > 0.7))] = _BRAND
+        kind[(sku > 0.8) & (num > 0.8)] = _SKU
+        score = np.where((sku == 1) & (brand == 1) & (num == 1), np.maximum(score, 0.95), score)
+
+        exact = f.norm[rows] == self.norm[cols]
+        score[exact] = 1.0
+        kind[exact] = _EXACT
+        return score, kind
+
+    def _scored(self, f: _Features, threshold: float) -> tuple[np.ndarray, ...]:
+        """Distinct pairs scoring at least ``threshold`` (not below ``min_score``):
+        rows, canonicals, scores and match type codes, best first within each row."""
+        if threshold < self.min_score:
+            raise ValueError(f"threshold {threshold} is below the index's min_score {self.min_score}")
+        parts = []
+        for rows, cols in self._pairs(f):
+            plausible = self._plausible(f, rows, cols, threshold)
+            rows, cols = rows[plausible], cols[plausible]
+            score, kind = self.score(f, rows, cols)
+            keep = score >= threshold
+            parts.append((rows[keep], cols[keep], score[keep], kind[keep]))
+        if not parts:
+            return tuple(np.zeros(0, dtype=t) for t in (np.int64, np.int64, np.float64, np.int8))
+        rows, cols, score, kind = (np.concatenate(p) for p in zip(*parts))
+        _, first = np.unique(rows * len(self.canonicals) + cols, return_index=True)
+        rows, cols, score, kind = rows[first], cols[first], score[first], kind[first]
+        order = np.lexsort((cols, -score, rows))
+        return rows[order], cols[order], score[order], kind[order]
+
+    def match(self, products: Sequence[Item], k: int | None = TOP_K) -> list[ProductMatch]:
+        """Best canonicals (at most ``k``; all if None) scoring at least ``min_score`` per product.
+
+        Ties keep canonical order, as the stable sort in the service does.
+        """
+        f = _Features(products, self)
+        out = [ProductMatch(p, f.normalized[i]) for i, p in enumerate(products)]
+        if not self.canonicals or not products:
+            return out
+        rows, cols, score, kind = self._scored(f, self.min_score)
+        if k is not None:
+            first = np.searchsorted(rows, rows)  # rows are sorted: index of each row's first pair
+            keep = np.arange(len(rows)) - first < k
+            rows, cols, score, kind = rows[keep], cols[keep], score[keep], kind[keep]
+        for r, c, s, t in zip(rows.tolist(), cols.tolist(), score.tolist(), kind.tolist()):
+            canonical = self.canonicals[c]
+            out[r].matches.append({
+                "canonicalProductId": canonical.id, "canonicalName": canonical.name,
+                "score": s, "matchType": MATCH_TYPES[t],
+            })
+        return out
+
+
+def iter_matches(index: CanonicalIndex, products: Iterable[Item], k: int | None = TOP_K,
+                 batch: int = BATCH) -> Iterator[ProductMatch]:
+    """Stream matches, ``batch`` products at a time."""
+    pending: list[Item] = []
+    for product in products:
+        pending.append(product)
+        if len(pending) >= batch:
+            yield from index.match(pending, k)
+            pending = []
+    if pending:
+        yield from index.match(pending, k)
+
+
+def clusters(index: CanonicalIndex, threshold: float = HIGH_CONFIDENCE) -> list[list[int]]:
+    """Groups of canonical positions joined by pairs scoring at least ``threshold``, largest first.
+
+    A name that repeats a number or SKU can score differently in each
+    direction; a pair joins if either direction reaches the threshold.
+    """
+    parent = list(range(len(index)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for lo in range(0, len(index), BATCH):
+        rows, cols, _, _ = index._scored(_Features(index.canonicals[lo:lo + BATCH], index), threshold)
+        for r, c in zip((rows + lo).tolist(), cols.tolist()):
+            a, b = find(r), find(c)
+            if a != b:
+                parent[max(a, b)] = min(a, b)
+    groups: dict[int, list[int]] = {}
+    for i in range(len(index)):
+        groups.setdefault(find(i), []).append(i)
+    return sorted((g for g in groups.values() if len(g) > 1), key=lambda g: (-len(g), g[0]))
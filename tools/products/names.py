@@ -0,0 +1,119 @@
+"""Python ports of src/domains/product-intelligence/utils (normalization, tokens, scoring).
+
+They follow the TypeScript line by line, including its regex semantics
+(ASCII ``\\w``/``\\d``/``\\b``, Unicode ``\\s``), so a name normalizes, and a
+pair scores, exactly as ``calculateProductSimilarity`` would. The matcher
+vectorizes ``product_similarity``; this version is the reference it is
+checked against.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+# productNormalization.ts
+STOP_WORDS = frozenset(["motor", "yagi", "yağı", "litresi", "litre", "ve", "ile", "icin", "için"])
+# productTokenization.ts
+WEAK_WORDS = frozenset([
+    "adet", "urun", "ürün", "yag", "yağ", "motor", "parca", "parça", "model", "rulman", "yedek", "orijinal",
+    "orjinal", "sanayi", "tip", "kalite",
+])
+BRANDS = (
+    "castrol", "motul", "mobil", "shell", "liquimoly", "liqui moly", "petronas", "elf", "total", "skf", "fag",
+    "timken", "ntn", "snr",
+)
+
+# JavaScript's \s (Unicode White_Space plus BOM); Python's also takes \x1c-\x1f
+_JS_SPACE = "\t\n\v\f\r \u00a0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000\ufeff"
+_SPACES = re.compile(f"[{_JS_SPACE}]+")
+_NORMALIZE_DROP = re.compile(f"[^A-Za-z0-9_{_JS_SPACE}ğüşıöç]")
+_TOKEN_DROP = re.compile(f"[^A-Za-z0-9_{_JS_SPACE}]")
+_SKU_DROP = re.compile(f"[^A-Za-z0-9_{_JS_SPACE}-]")
+_NUMBER = re.compile(r"\b[0-9]+\b", re.ASCII)
+_LETTER = re.compile(r"[A-Z]")
+_DIGIT = re.compile(r"[0-9]")
+
+
+def normalize_product_name(name: str) -> str:
+    words = _SPACES.split(_NORMALIZE_DROP.sub(" ", name.lower()))
+    return " ".join(w for w in words if w and w not in STOP_WORDS).strip()
+
+
+def tokenize_product_name(name: str) -> list[str]:
+    """Distinct tokens longer than one character, weak words removed, in first-seen order."""
+    if not name:
+        return []
+    clean = _SPACES.sub(" ", _TOKEN_DROP.sub(" ", name.lower())).strip()
+    return list(dict.fromkeys(t for t in clean.split(" ") if len(t) > 1 and t not in WEAK_WORDS))
+
+
+def extract_brand_token(name: str) -> str | None:
+    if not name:
+        return None
+    lower = name.lower()
+    return next((brand for brand in BRANDS if brand in lower), None)
+
+
+def extract_numeric_tokens(name: str) -> list[str]:
+    return _NUMBER.findall(name)
+
+
+def extract_sku_tokens(name: str) -> list[str]:
+    """Tokens with both a letter and a digit (``10W-40``, ``SKF-6203``); repeats are kept."""
+    words = _SPACES.split(_SKU_DROP.sub(" ", name.upper()))
+    return [w for w in words if _LETTER.search(w) and _DIGIT.search(w)]
+
+
+def build_cluster_key(name: str) -> str:
+    """productCluster.service.ts ``buildClusterKey``."""
+    return f"{normalize_product_name(name)}_{'-'.join(extract_numeric_tokens(name))}"
+
+
+@dataclass(frozen=True)
+class Similarity:
+    normalized_a: str
+    normalized_b: str
+    token_overlap: float
+    numeric: float
+    brand: float
+    sku: float
+    score: float
+    match_type: str
+
+
+def _share(a: list[str], b: list[str]) -> float:
+    """Entries of ``b`` (repeats counted) found in ``a``, over the longer list."""
+    hits = sum(1 for x in b if x in a)
+    return hits / max(len(a), len(b), 1)
+
+
+def product_similarity(a: str, b: str) -> Similarity:
+    """``calculateProductSimilarity(a, b)``."""
+    norm_a, norm_b = normalize_product_name(a), normalize_product_name(b)
+    if norm_a == norm_b:
+        return Similarity(norm_a, norm_b, 1.0, 1.0, 1.0, 1.0, 1.0, "EXACT")
+
+    tokens_a, tokens_b = tokenize_product_name(a), tokenize_product_name(b)
+    token_overlap = _share(tokens_a, tokens_b)
+
+    nums_a, nums_b = extract_numeric_tokens(a), extract_numeric_tokens(b)
+    numeric = _share(nums_a, nums_b) if nums_a or nums_b else 0.5  # neutral without numbers
+
+    sku_a, sku_b = extract_sku_tokens(a), extract_sku_tokens(b)
+    sku = _share(sku_a, sku_b) if sku_a or sku_b else 0.0
+
+    brand_a, brand_b = extract_brand_token(a), extract_brand_token(b)
+    brand = 0.0
+    if brand_a and brand_b:
+        brand = 1.0 if brand_a == brand_b else -0.5
+
+    score = min(1.0, max(0.0, token_overlap * 0.4 + numeric * 0.3 + brand * 0.2 + sku * 0.1))
+    match_type = "TEXT_SIMILAR"
+    if sku > 0.8 and numeric > 0.8:
+        match_type = "SKU_SIMILAR"
+    elif brand == 1.0 and (numeric > 0.8 or token_overlap > 0.7):
+        match_type = "BRAND_MATCH"
+    if sku == 1 and brand == 1 and numeric == 1:
+        score = max(0.95, score)
+    return Similarity(norm_a, norm_b, token_overlap, numeric, brand, sku, score, match_type)
@@ -0,0 +1,90 @@
+"""Products and canonical products to match, from exports, backups or a generator.
+
+Exports are JSONL, a JSON array or CSV with ``id`` and ``name`` columns;
+product rows may also carry ``tenantId`` (or ``companyId``), and
+``productId``/``productName`` are accepted as the job payloads name them.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import random
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from tools.checkpoints import open_backup
+
+from .matcher import Item
+from .names import BRANDS
+
+
+def read_records(path: str | Path) -> Iterator[dict]:
+    path = Path(path)
+    suffix = path.suffix.lower()
+    with open(path, "r", encoding="utf-8-sig", newline="" if suffix == ".csv" else None) as f:
+        if suffix == ".csv":
+            yield from csv.DictReader(f)
+        elif suffix == ".json":
+            data = json.load(f)
+            yield from data if isinstance(data, list) else [data]
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def to_items(records: Iterable[dict]) -> Iterator[Item]:
+    for r in records:
+        name = r.get("productName") or r.get("name")
+        item_id = r.get("productId") or r.get("id")
+        if name and item_id:
+            yield Item(str(item_id), name, r.get("tenantId") or r.get("companyId"))
+
+
+def from_backup(path: str | Path) -> Iterator[Item]:
+    """Undeleted products of a checkpoint backup."""
+    for entity, record in open_backup(path):
+        if entity == "products" and isinstance(record, dict) and not record.get("deletedAt"):
+            yield from to_items([record])
+
+
+_PARTS = {
+    "oil": ("motor yağı", "tam sentetik", "yarı sentetik", "dizel", "benzinli", "racing", "edge", "magnatec",
+            "helix", "super", "ultra", "pro", "longlife"),
+    "bearing": ("rulman", "bilya", "tekerlek", "aks", "ön", "arka", "sağ", "sol", "2rs", "zz", "c3"),
+}
+_GRADES = ("0W-20", "5W-30", "5W-40", "10W-40", "15W-40", "20W-50")
+
+
+def synthetic(canonicals: int, products: int, seed: int = 0) -> tuple[list[Item], list[Item]]:
+    """Oil and bearing names with brands, grades and part numbers; products are noisy copies of
+    canonicals (reordered, abbreviated, extra words), plus some with no canonical at all."""
+    rng = random.Random(seed)
+    names = []
+    for i in range(canonicals):
+        brand = rng.choice(BRANDS)
+        if rng.random() < 0.5:
+            words = [brand, *rng.sample(_PARTS["oil"], 3), rng.choice(_GRADES), f"{rng.choice((1, 4, 5, 7))} litre",
+                     f"{rng.randrange(100000, 999999)}"]
+        else:
+            words = [brand, f"{rng.randrange(6000, 6400)}", *rng.sample(_PARTS["bearing"], 3),
+                     f"{rng.choice('ABCDEFGH')}{rng.randrange(10, 99)}-{rng.randrange(100, 999)}"]
+        names.append(" ".join(words))
+    canon = [Item(f"c{i}", name) for i, name in enumerate(names)]
+    out = []
+    for i in range(products):
+        if rng.random() < 0.8:
+            words = rng.choice(names).split()
+            if rng.random() < 0.5:
+                words.insert(rng.randrange(len(words) + 1), rng.choice(("orijinal", "adet", "yeni", "kampanya")))
+            if rng.random() < 0.3:
+                words.pop(rng.randrange(1, len(words)))
+            if rng.random() < 0.5:
+                rng.shuffle(words)
+            name = " ".join(words)
+            name = name.upper() if rng.random() < 0.3 else name
+        else:
+            name = " ".join(rng.sample(_PARTS["oil"] + _PARTS["bearing"], 4)) + f" {rng.randrange(1000, 99999)}"
+        out.append(Item(f"p{i}", name, f"t{i % 50}"))
+    return canon, out
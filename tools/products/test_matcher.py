@@ -0,0 +1,62 @@
+"""The indexed matcher against ``product_similarity`` over every pair.
+
+    python -m pytest tools/products        # or: python -m unittest tools.products.test_matcher
+"""
+
+import random
+import unittest
+
+from .matcher import REVIEW_THRESHOLD, CanonicalIndex, Item
+from .names import product_similarity
+
+# Few enough words that names share brands, numbers and SKUs often
+_WORDS = (
+    "skf", "fag", "castrol", "liqui moly", "SKF-6207", "10W-40", "5W-30", "A12-300", "6207", "6203", "4", "1",
+    "litre", "motor", "yağı", "yag", "rulman", "orijinal", "adet", "fren", "hava", "zincir", "yakit", "filtre",
+    "balata", "sentetik", "ön", "arka", "ZZ", "2RS",
+)
+
+
+def _brute(products, canonicals, min_score):
+    out = []
+    for p in products:
+        found = []
+        for c in canonicals:
+            s = product_similarity(p.name, c.name)
+            if s.score >= min_score:
+                found.append((c.id, s.score, s.match_type))
+        found.sort(key=lambda m: -m[1])  # stable: ties keep canonical order
+        out.append(found)
+    return out
+
+
+class MatcherTest(unittest.TestCase):
+    def assertSameMatches(self, canonicals, products, min_score=REVIEW_THRESHOLD):
+        index = CanonicalIndex(canonicals, min_score)
+        got = [[(m["canonicalProductId"], m["score"], m["matchType"]) for m in r.matches]
+               for r in index.match(products, k=None)]
+        for product, mine, expected in zip(products, got, _brute(products, canonicals, min_score)):
+            self.assertEqual([(i, t) for i, _, t in mine], [(i, t) for i, _, t in expected], product.name)
+            for (_, a, _), (_, b, _) in zip(mine, expected):
+                self.assertAlmostEqual(a, b, places=9, msg=product.name)
+
+    def test_boost_without_token_overlap(self):
+        canonicals = [Item("c0", "SKF-6207")]
+        products = [Item("p0", "yag fren hava SKF-6207 zincir yakit")]
+        self.assertEqual(product_similarity(products[0].name, canonicals[0].name).score, 0.95)
+        self.assertSameMatches(canonicals, products)
+
+    def test_random_names(self):
+        for seed in range(4):
+            rng = random.Random(seed)
+            names = [" ".join(rng.choices(_WORDS, k=rng.randint(1, 7))) for _ in range(400)]
+            canonicals = [Item(f"c{i}", name) for i, name in enumerate(names[:200])]
+            products = [Item(f"p{i}", name.upper() if rng.random() < 0.2 else name)
+                        for i, name in enumerate(names[200:] + rng.sample(names[:200], 50))]
+            for min_score in (REVIEW_THRESHOLD, 0.5):
+                with self.subTest(seed=seed, min_score=min_score):
+                    self.assertSameMatches(canonicals, products, min_score)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,9 @@
+"""Multi-pattern source search emitting ``Path,LineNumber,Line`` CSV.
+
+    python -m tools.scan AlertTriangle Info -o alerts.csv
+    python -m tools.scan -f patterns.txt --fixed | python -m tools.codemod rules.json --files-from -
+"""
+
+from .scanner import CSV_HEADER, Hit, ScanCache, compile_patterns, read_csv, scan, scan_text, write_csv
+
+__all__ = ["CSV_HEADER", "Hit", "ScanCache", "compile_patterns", "read_csv", "scan", "scan_text", "write_csv"]
@@ -0,0 +1,44 @@
+import argparse
+import sys
+import time
+
+from .scanner import DEFAULT_CACHE, DEFAULT_ROOT, ScanCache, compile_patterns, scan, write_csv
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.scan")
+    parser.add_argument("patterns", nargs="*", help="regular expressions (literals with --fixed)")
+    parser.add_argument("-f", "--patterns-file", help="one pattern per line; blank lines and # comments ignored")
+    parser.add_argument("--fixed", "-F", action="store_true", help="patterns are plain strings")
+    parser.add_argument("--case-sensitive", "-s", action="store_true")
+    parser.add_argument("--root", default=str(DEFAULT_ROOT), help="tree to search (default: src/)")
+    parser.add_argument("--include", action="append", help="glob of files to search (repeatable; default: all)")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="read every file")
+    parser.add_argument("-o", "--output", help="CSV file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    patterns = list(args.patterns)
+    if args.patterns_file:
+        with open(args.patterns_file, encoding="utf-8-sig") as f:
+            patterns += [p.rstrip("\r\n") for p in f if p.strip() and not p.startswith("#")]
+    if not patterns:
+        parser.error("no patterns given")
+    regex = compile_patterns(patterns, args.fixed, not args.case_sensitive)
+
+    t0 = time.perf_counter()
+    cache = None if args.no_cache else ScanCache(DEFAULT_CACHE)
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        n = write_csv(scan(regex, args.root, args.include or ("*",), args.jobs, cache), out)
+    finally:
+        if args.output:
+            out.close()
+        if cache is not None:
+            cache.close()
+    print(f"{n} lines in {(time.perf_counter() - t0) * 1000:.0f} ms", file=sys.stderr)
+    return 0 if n else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
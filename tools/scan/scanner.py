@@ -0,0 +1,189 @@
+"""Multi-pattern source search with Select-String compatible CSV output.
+
+Replaces the ``Select-String ... | Export-Csv`` runs that produced
+alerts_list.csv and friends. All patterns are folded into one regex and
+run over each file's whole text, hits are mapped back to lines, and a
+line is reported once however many patterns match it (as Select-String
+does). Results are cached per file and pattern set in .cache/scan.sqlite,
+so files whose mtime and size are unchanged are not read again.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import os
+import re
+import sqlite3
+from bisect import bisect_right
+from dataclasses import dataclass
+from multiprocessing import Pool
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Sequence
+
+from tools.fs import REPO_ROOT, iter_files
+from tools.ingest.eslint import repo_path
+
+DEFAULT_ROOT = REPO_ROOT / "src"
+DEFAULT_CACHE = REPO_ROOT / ".cache" / "scan.sqlite"
+CSV_HEADER = ("Path", "LineNumber", "Line")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hits (
+    path TEXT NOT NULL,
+    patterns BLOB NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    hits TEXT NOT NULL,
+    PRIMARY KEY (path, patterns)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class Hit:
+    path: str  # posix, relative to the repo root
+    line_no: int  # 1-based
+    line: str
+
+
+def compile_patterns(patterns: Sequence[str], fixed: bool = False, ignore_case: bool = True) -> re.Pattern:
+    """One alternation of every pattern; Select-String is case-insensitive by default."""
+    if not patterns:
+        raise ValueError("no patterns")
+    parts = [re.escape(p) if fixed else f"(?:{p})" for p in patterns]
+    return re.compile("|".join(parts), re.IGNORECASE if ignore_case else 0)
+
+
+def pattern_key(regex: re.Pattern) -> bytes:
+    return hashlib.blake2b(f"{regex.flags}:{regex.pattern}".encode("utf-8"), digest_size=16).digest()
+
+
+def scan_text(text: str, regex: re.Pattern) -> list[tuple[int, str]]:
+    """``(line_no, line)`` for every line containing a match."""
+    starts = [0]
+    starts.extend(m.end() for m in re.finditer("\n", text))
+    out: list[tuple[int, str]] = []
+    last = 0
+    for m in regex.finditer(text):
+        n = bisect_right(starts, m.start())
+        if n == last:
+            continue
+        last = n
+        end = starts[n] - 1 if n < len(starts) else len(text)
+        out.append((n, text[starts[n - 1]:end].rstrip("\r")))
+    return out
+
+
+def _scan_file(args: tuple[str, str, re.Pattern]) -> tuple[str, int, int, list[tuple[int, str]]]:
+    root, rel, regex = args
+    path = os.path.join(root, rel)
+    st = os.stat(path)
+    with open(path, "rb") as f:
+        data = f.read()
+    if b"\0" in data[:8192]:
+        return rel, st.st_mtime_ns, st.st_size, []
+    return rel, st.st_mtime_ns, st.st_size, scan_text(data.decode("utf-8", errors="replace"), regex)
+
+
+class ScanCache:
+    def __init__(self, path: str | Path = DEFAULT_CACHE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.executescript(_SCHEMA)
+
+    def __enter__(self) -> "ScanCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.db.commit()
+        self.db.close()
+
+    def load(self, key: bytes) -> dict[str, tuple[int, int, str]]:
+        rows = self.db.execute("SELECT path, mtime_ns, size, hits FROM hits WHERE patterns = ?", (key,))
+        return {path: (mtime_ns, size, hits) for path, mtime_ns, size, hits in rows}
+
+    def store(self, key: bytes, rows: Iterable[tuple[str, int, int, list]]) -> None:
+        self.db.executemany(
+            "INSERT OR REPLACE INTO hits (path, patterns, mtime_ns, size, hits) VALUES (?, ?, ?, ?, ?)",
+            [(path, key, mtime_ns, size, json.dumps(hits, ensure_ascii=False)) for path, mtime_ns, size, hits in rows],
+        )
+        self.db.commit()
+
+
+def scan(
+    regex: re.Pattern,
+    root: str | Path = DEFAULT_ROOT,
+    include: Iterable[str] = ("*",),
+    jobs: int | None = None,
+    cache: ScanCache | None = None,
+) -> Iterator[Hit]:
+    """Hits under ``root`` in path order; files unchanged since a cached scan are not read."""
+    root = str(root)
+    prefix = Path(root).resolve()
+    try:
+        prefix_rel = prefix.relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        prefix_rel = prefix.as_posix()
+    key = pattern_key(regex)
+    cached = cache.load(key) if cache is not None else {}
+
+    def full_path(rel: str) -> str:
+        # Cache rows are keyed by this too, so scans of nested roots never share entries
+        return f"{prefix_rel}/{rel}" if prefix_rel not in ("", ".") else rel
+
+    files = list(iter_files(root, include))
+    results: dict[str, list] = {}
+    todo = []
+    for rel in files:
+        entry = cached.get(full_path(rel))
+        if entry is not None:
+            st = os.stat(os.path.join(root, rel))
+            if (entry[0], entry[1]) == (st.st_mtime_ns, st.st_size):
+                results[rel] = json.loads(entry[2])
+                continue
+        todo.append((root, rel, regex))
+
+    if todo:
+        if jobs == 1 or len(todo) < 64:
+            fresh = [_scan_file(t) for t in todo]
+        else:
+            with Pool(jobs or os.cpu_count() or 1) as pool:
+                fresh = pool.map(_scan_file, todo, chunksize=max(1, len(todo) // 64))
+        for rel, _, _, hits in fresh:
+            results[rel] = hits
+        if cache is not None:
+            cache.store(key, [(full_path(rel), *rest) for rel, *rest in fresh])
+
+    for rel in sorted(results):
+        path = full_path(rel)
+        for line_no, line in results[rel]:
+            yield Hit(path, line_no, line)
+
+
+def write_csv(hits: Iterable[Hit], out: IO[str]) -> int:
+    """Write hits in the ``Path,LineNumber,Line`` schema (all fields quoted, like Export-Csv)."""
+    writer = csv.writer(out, quoting=csv.QUOTE_ALL, lineterminator="\n")
+    writer.writerow(CSV_HEADER)
+    n = 0
+    for hit in hits:
+        writer.writerow((hit.path, hit.line_no, hit.line))
+        n += 1
+    return n
+
+
+def read_csv(f: IO[str]) -> Iterator[Hit]:
+    """Hits from a scan CSV, including the old Export-Csv files with absolute Windows paths."""
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        return
+    if tuple(header) != CSV_HEADER:
+        raise ValueError(f"not a Path,LineNumber,Line CSV: {header}")
+    for path, line_no, line in reader:
+        yield Hit(repo_path(path), int(line_no), line)
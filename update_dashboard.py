@@ -1,11 +1,16 @@
 import sys
 
-file_path = r'c:\Users\ertke\OneDrive\Masaüstü\periodya\muhasebeapp\motoroil\src\app\(app)\test-desktop\ClientDashboard.tsx'
+from tools.codemod.regions import AnchorError, SourceIndex, replace_region
+from tools.codemod.writer import Transaction
 
-with open(file_path, 'r', encoding='utf-8') as f:
-    lines = f.readlines()
+file_path = 'src/app/(app)/desktop/ClientDashboard.tsx'
+txn = Transaction('update_dashboard.py', dry_run='--dry-run' in sys.argv)
+if txn.is_applied(file_path):
+    print('Already applied')
+    sys.exit(0)
 
-new_lines = lines[:516]
+with open(file_path, 'r', encoding='utf-8', newline='') as f:
+    content = f.read()
 
 widget_grid_code = """                    {/* WIDGET GRID */}
                     <div className="grid grid-cols-1 lg:grid-cols-2 2xl:grid-cols-3 gap-6">
@@ -388,9 +393,15 @@ widget_grid_code = """                    {/* WIDGET GRID */}
                         </div>
 """
 
-end_lines = lines[781:] # from 782 onwards (0-indexed)
+# The region runs from the WIDGET GRID marker through the grid's closing tag
+widget_grid_code += '                    </div>\n'
 
-with open(file_path, 'w', encoding='utf-8') as f:
-    f.writelines(new_lines)
-    f.write(widget_grid_code + '\n')
-    f.writelines(end_lines)
+try:
+    content = replace_region(content, 'WIDGET GRID', widget_grid_code, index=SourceIndex(content))
+except AnchorError as e:
+    print('Not updated:', e)
+    sys.exit(1)
+
+txn.write(file_path, content)
+txn.commit()
+print('Widget grid updated')